@@ -0,0 +1,332 @@
+"""
+Load test of a single Client against a local stand-in of the StatusPage.io API.
+
+Starts a :class:`statuspageio.FakeServer` in a separate process, so it does not compete with the
+client for the GIL, seeds a page with components and custom metrics, then runs a weighted mix of
+``components.update``, ``incidents.create``, ``metrics.submit_data`` and ``components.list`` calls
+from ``--concurrency`` threads sharing one ``Client``, for every concurrency level in turn.
+Throughput, p50/p90/p99 latencies, error rates and the peak resident memory of the client process
+are reported per level and per operation. Run it from the repository root::
+
+  $ python benchmarks/bench_load.py --concurrency 1 4 16 --duration 10 --save baseline.json
+  $ python benchmarks/bench_load.py --concurrency 1 4 16 --duration 10 --compare baseline.json
+
+``--latency`` delays every response of the stand-in, ``--error-rate`` and ``--rate-limit-rate``
+inject 5xx and 420 answers, to see how retries and pacing hold up under load. With
+``--transport httpx`` the stand-in speaks h2c and every thread multiplexes over one connection. Throughput and
+latencies only compare on the same machine and interpreter.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import payloads
+import statuspageio
+from statuspageio.rate_limit import monotonic
+from statuspageio.transports import TRANSPORTS
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+
+PAGE_ID = 'page0000001'
+
+OPERATIONS = ('update', 'submit', 'list', 'incident')
+
+DEFAULT_MIX = 'update=60,submit=30,list=8,incident=2'
+
+
+def parse_mix(mix):
+    """
+    :param str mix: Comma separated ``operation=weight`` pairs, e.g. ``update=60,submit=40``.
+    :rtype: list
+    """
+
+    weights = []
+    for item in mix.split(','):
+        operation, _, weight = item.partition('=')
+        if operation not in OPERATIONS:
+            raise argparse.ArgumentTypeError('unknown operation {0!r}, expected one of {1}'.format(
+                operation, ', '.join(OPERATIONS)))
+        weights.append((operation, float(weight or 1)))
+    return weights
+
+
+def serve(args, ready, stop):
+    backend = statuspageio.FakeStatusPage(seed=args.seed)
+    client = statuspageio.Client(api_key='key', page_id=PAGE_ID, organization_id='organization',
+                                 transport=statuspageio.FakeTransport(backend))
+    component_ids = [client.components.create(name=component['name'], description=component['description'],
+                                              status=component['status']).id
+                     for component in payloads.components(args.components)]
+    metric_ids = [client.metrics.create('self', name='Metric {0}'.format(number), suffix='ms').id
+                  for number in range(args.metrics)]
+
+    # failures and delays only once the page is seeded
+    backend.latency = args.latency
+    backend.error_rate = args.error_rate
+    backend.rate_limit_rate = args.rate_limit_rate
+    backend.retry_after = 0.1
+
+    server = statuspageio.FakeServer(backend, http2=args.transport == 'httpx').start()
+    ready.put((server.url, component_ids, metric_ids))
+    stop.wait()
+    server.stop()
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak / 1024.0 if sys.platform == 'darwin' else float(peak)
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(latencies, errors, elapsed):
+    """
+    :param list latencies: Seconds taken by every call.
+    :param dict errors: Numbers of failed calls by exception name.
+    :param float elapsed: Wall clock seconds of the run.
+    :rtype: dict
+    """
+
+    latencies = sorted(latencies)
+    count = len(latencies)
+    failed = sum(errors.values())
+    return {
+        'requests': count,
+        'errors': failed,
+        'error_types': errors,
+        'error_rate': round(float(failed) / count, 4) if count else 0.0,
+        'throughput': round(count / elapsed, 1),
+        'p50_ms': None if not count else round(percentile(latencies, 0.5) * 1000, 3),
+        'p90_ms': None if not count else round(percentile(latencies, 0.9) * 1000, 3),
+        'p99_ms': None if not count else round(percentile(latencies, 0.99) * 1000, 3),
+        'max_ms': None if not count else round(latencies[-1] * 1000, 3),
+    }
+
+
+class Workload(object):
+    """
+    Operations of the mix, bound to one client and the seeded page.
+    """
+
+    def __init__(self, client, component_ids, metric_ids):
+        self.client = client
+        self.component_ids = component_ids
+        self.metric_ids = metric_ids
+
+    def update(self, rng):
+        self.client.components.update(rng.choice(self.component_ids), status=rng.choice(payloads.STATUSES))
+
+    def submit(self, rng):
+        self.client.metrics.submit_data(rng.choice(self.metric_ids), timestamp=1460000000 + rng.randint(0, 86400),
+                                        value=rng.random() * 100)
+
+    def list(self, rng):
+        self.client.components.list()
+
+    def incident(self, rng):
+        self.client.incidents.create(name='Elevated error rates', status='investigating',
+                                     message='We are investigating the issue.',
+                                     component_ids=rng.sample(self.component_ids, 2))
+
+
+def run_level(page, args, weights, concurrency):
+    url, component_ids, metric_ids = page
+    client = statuspageio.Client(api_key='key', page_id=PAGE_ID, organization_id='organization', base_url=url,
+                                 transport=args.transport, pool_maxsize=max(10, concurrency), timeout=args.timeout)
+    workload = Workload(client, component_ids, metric_ids)
+    operations = [operation for operation, _ in weights]
+    cumulative = []
+    total = 0.0
+    for _, weight in weights:
+        total += weight
+        cumulative.append(total)
+
+    results = dict((operation, ([], {})) for operation in operations)
+    lock = threading.Lock()
+    remaining = [args.requests]
+    deadline = [None]
+
+    def claim():
+        with lock:
+            if args.requests:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+                return True
+        return monotonic() < deadline[0]
+
+    def worker(number):
+        rng = random.Random(args.seed * 1000 + number)
+        latencies = dict((operation, []) for operation in operations)
+        errors = dict((operation, {}) for operation in operations)
+        while claim():
+            pick = rng.random() * total
+            operation = operations[next(index for index, bound in enumerate(cumulative) if pick < bound)]
+            started = monotonic()
+            try:
+                getattr(workload, operation)(rng)
+            except Exception as error:
+                name = type(error).__name__
+                errors[operation][name] = errors[operation].get(name, 0) + 1
+            latencies[operation].append(monotonic() - started)
+        with lock:
+            for operation in operations:
+                results[operation][0].extend(latencies[operation])
+                for name, count in errors[operation].items():
+                    results[operation][1][name] = results[operation][1].get(name, 0) + count
+
+    for _ in range(args.warmup):
+        workload.list(None)
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(concurrency)]
+    started = monotonic()
+    deadline[0] = started + args.duration
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = monotonic() - started
+    client.close()
+
+    all_latencies = []
+    all_errors = {}
+    per_operation = {}
+    for operation in operations:
+        latencies, errors = results[operation]
+        all_latencies.extend(latencies)
+        for name, count in errors.items():
+            all_errors[name] = all_errors.get(name, 0) + count
+        per_operation[operation] = summarize(latencies, errors, elapsed)
+
+    level = summarize(all_latencies, all_errors, elapsed)
+    level.update(concurrency=concurrency, elapsed_s=round(elapsed, 3), peak_rss_kb=peak_rss_kb(),
+                 operations=per_operation)
+    return level
+
+
+def compare(levels, baseline, tolerance):
+    """
+    :return: Concurrency levels with a lower throughput, a higher p99 latency or error rate than
+             ``baseline`` by more than ``tolerance``.
+    :rtype: list
+    """
+
+    regressions = []
+    for name, level in sorted(levels.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric, worse in (('throughput', lambda ratio: ratio < 1 - tolerance),
+                              ('p99_ms', lambda ratio: ratio > 1 + tolerance),
+                              ('peak_rss_kb', lambda ratio: ratio > 1 + tolerance)):
+            if level[metric] is None or not reference.get(metric):
+                continue
+            ratio = level[metric] / reference[metric]
+            level[metric + '_ratio'] = round(ratio, 3)
+            if worse(ratio):
+                regressions.append('concurrency {0} {1} x{2:.2f}'.format(name, metric, ratio))
+        if level['error_rate'] > reference['error_rate'] + tolerance / 10:
+            regressions.append('concurrency {0} error_rate {1} > {2}'.format(
+                name, level['error_rate'], reference['error_rate']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16],
+                        help='numbers of threads sharing the client, one run each')
+    parser.add_argument('--duration', type=float, default=5, help='seconds per concurrency level')
+    parser.add_argument('--requests', type=int, default=0,
+                        help='requests per concurrency level, instead of a duration')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='weighted operations, default: ' + DEFAULT_MIX)
+    parser.add_argument('--transport', default='requests', choices=sorted(TRANSPORTS))
+    parser.add_argument('--components', type=int, default=50, help='components seeded on the page')
+    parser.add_argument('--metrics', type=int, default=10, help='custom metrics seeded on the page')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds every response is delayed by')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with a 5xx')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0,
+                        help='fraction of requests answered with a 420')
+    parser.add_argument('--timeout', type=float, default=30, help='client timeout in seconds')
+    parser.add_argument('--warmup', type=int, default=20, help='requests sent before measuring')
+    parser.add_argument('--seed', type=int, default=payloads.SEED)
+    parser.add_argument('--save', help='write the report to this json file')
+    parser.add_argument('--compare', help='baseline report to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed degradation before failing')
+    args = parser.parse_args()
+
+    ready = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    server = multiprocessing.Process(target=serve, args=(args, ready, stop))
+    server.daemon = True
+    server.start()
+    page = ready.get(timeout=60)
+
+    levels = {}
+    try:
+        for concurrency in args.concurrency:
+            level = run_level(page, args, args.mix, concurrency)
+            levels[str(concurrency)] = level
+            print('concurrency {0:>4} {1:>10.1f} req/s  p50 {2:>8} ms  p99 {3:>8} ms  errors {4:>6.2%}'.format(
+                concurrency, level['throughput'], level['p50_ms'], level['p99_ms'], level['error_rate']),
+                file=sys.stderr)
+    finally:
+        stop.set()
+        server.join()
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(levels, json.load(baseline)['levels'], args.tolerance)
+
+    report = {
+        'statuspageio': statuspageio.VERSION,
+        'python': platform.python_implementation() + ' ' + platform.python_version(),
+        'platform': platform.platform(),
+        'transport': args.transport,
+        'mix': dict(args.mix),
+        'duration': args.duration,
+        'requests': args.requests,
+        'latency': args.latency,
+        'error_rate': args.error_rate,
+        'rate_limit_rate': args.rate_limit_rate,
+        'levels': levels,
+    }
+    if args.save:
+        with open(args.save, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+    for regression in regressions:
+        print('REGRESSION: ' + regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
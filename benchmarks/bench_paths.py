@@ -0,0 +1,266 @@
+"""
+Microbenchmarks of the request and response handling paths, offline.
+
+Measures CPU time (best of ``--repeat`` runs) and peak traced memory of json encoding with the
+envelope, json parsing with every installed codec (``json``, ``orjson``, ``ujson``),
+incremental parsing of streamed responses, ``unwrap_envelope``/munchify, the ``model`` and ``raw`` response modes and the
+``OPTS_KEYS_TO_PERSIST`` filtering of service methods, on the payloads of :mod:`payloads`.
+Run it from the repository root::
+
+  $ python benchmarks/bench_paths.py --save baseline.json
+  $ python benchmarks/bench_paths.py --compare baseline.json --tolerance 0.2
+
+CPU times only compare on the same machine and interpreter. Peak memory needs :mod:`tracemalloc`
+(Python 3.4+): on Python 2 it is reported as ``null`` and ``--compare`` only checks CPU times,
+saying so on stderr. Run both sides of a memory comparison on Python 3.
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import payloads
+import statuspageio
+from statuspageio.http_client import BaseHttpClient
+from statuspageio.json_codec import CODECS
+from statuspageio.transports import CHUNK_SIZE, StreamedResponse
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2
+    tracemalloc = None
+
+try:
+    cpu_time = time.process_time
+except AttributeError:
+    # Python 2, time.clock is the process time on unix
+    cpu_time = time.clock
+
+
+JSON_HEADERS = {'Content-Type': 'application/json; charset=utf-8'}
+
+
+class RecordingHttpClient(object):
+    """
+    Stands in for :class:`statuspageio.HttpClient` so service methods run without network,
+    echoing the filtered body back.
+    """
+
+    def post(self, url, body=None, **kwargs):
+        return 201, {}, body
+
+    patch = put = post
+
+
+def times(count, function, *args, **kwargs):
+    def run():
+        for _ in range(count):
+            function(*args, **kwargs)
+    return run
+
+
+def streamed(content):
+    """
+    :return: Response handing out ``content`` in chunks, as received from the network.
+    :rtype: :class:`statuspageio.transports.StreamedResponse`
+    """
+
+    return StreamedResponse(200, JSON_HEADERS, (content[start:start + CHUNK_SIZE]
+                                                for start in range(0, len(content), CHUNK_SIZE)))
+
+
+def consume(items):
+    for _ in items:
+        pass
+
+
+def http_client(response_model, json_codec='auto'):
+    config = statuspageio.Configuration(api_key='key', page_id='page', organization_id='organization',
+                                        response_model=response_model, json_codec=json_codec)
+    return statuspageio.HttpClient(config)
+
+
+def installed_codecs():
+    codecs = []
+    for name in sorted(CODECS):
+        try:
+            codecs.append(CODECS[name]())
+        except ImportError:
+            continue
+    return codecs
+
+
+def decode_cases(label, path, payload):
+    content = payloads.encoded(payload)
+    parsed = json.loads(content.decode('utf-8'))
+    cases = [('parse/{0}/{1}'.format(codec.name, label), lambda codec=codec: codec.loads(content))
+             for codec in installed_codecs()]
+    for response_model in statuspageio.Configuration.RESPONSE_MODELS:
+        client = http_client(response_model)
+        cases.append(('decode_body/{0}/{1}'.format(response_model, label),
+                      lambda client=client: client.decode_body(JSON_HEADERS, content, path=path)))
+        cases.append(('decode_stream/{0}/{1}'.format(response_model, label),
+                      lambda client=client: consume(client.decode_stream(streamed(content), path))))
+    cases.append(('unwrap_envelope/' + label, lambda: BaseHttpClient.unwrap_envelope(parsed)))
+    return cases
+
+
+def encode_cases():
+    client = http_client('munch')
+    component = payloads.components(1)[0]
+    points = dict(('metric{0}'.format(metric), [{'timestamp': 1460000000 + second, 'value': second * 0.5}
+                                                for second in range(100)]) for metric in range(10))
+    subscribers = payloads.subscribers(1000)
+
+    def encode_subscribers():
+        for subscriber in subscribers:
+            client.encode_body({'email': subscriber['email'], 'components': subscriber['components']}, {},
+                               container='subscriber')
+
+    return [
+        ('wrap_envelope/component x10000',
+         times(10000, BaseHttpClient.wrap_envelope, 'component', component)),
+        ('encode_body/component', lambda: client.encode_body(component, {}, container='component')),
+        ('encode_body/subscriber x1000', encode_subscribers),
+        ('encode_body/metrics_data 1000pts', lambda: client.encode_body(points, {}, container='data')),
+    ] + [('dumps/{0}/subscribers 1000'.format(codec.name), lambda codec=codec: codec.dumps(subscribers))
+         for codec in installed_codecs()]
+
+
+def filter_cases():
+    components = statuspageio.ComponentsService(RecordingHttpClient(), 'page')
+    subscribers = statuspageio.SubscribersService(RecordingHttpClient(), 'page')
+    attributes = payloads.components(1)[0]
+    subscriber = dict(payloads.subscribers(1)[0], skip_confirmation_notification=True)
+
+    return [
+        ('opts_filter/components.update x10000',
+         times(10000, components.update, 'component', **attributes)),
+        ('opts_filter/subscribers.create x10000',
+         times(10000, subscribers.create, **subscriber)),
+    ]
+
+
+def build_cases(sizes):
+    cases = encode_cases() + filter_cases()
+    cases += decode_cases('components 500', '/pages/page/components.json', payloads.components(500))
+    cases += decode_cases('incidents 1000x5', '/pages/page/incidents.json', payloads.incidents(1000, 5))
+    for size in sizes:
+        cases += decode_cases('subscribers {0}'.format(size), '/pages/page/subscribers.json',
+                              payloads.subscribers(size))
+    return cases
+
+
+def measure(function, repeat):
+    """
+    :return: Tuple of the best CPU time in milliseconds and the peak traced memory in KiB.
+    :rtype: tuple
+    """
+
+    gc.collect()
+    gc.disable()
+    try:
+        best = None
+        for _ in range(repeat):
+            started = cpu_time()
+            function()
+            elapsed = cpu_time() - started
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+
+    peak = None
+    if tracemalloc is not None:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1] / 1024.0
+        finally:
+            tracemalloc.stop()
+
+    return best * 1000, peak
+
+
+def compare(results, baseline, tolerance, skipped=None):
+    """
+    :param set skipped: (optional) Set the metrics missing from ``results`` or ``baseline`` are added to.
+    :return: Names of the benchmarks slower, or using more memory, than ``baseline`` by more than ``tolerance``.
+    :rtype: list
+    """
+
+    regressions = []
+    for name, result in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in ('cpu_ms', 'peak_kb'):
+            if result[metric] is None or not reference.get(metric):
+                if skipped is not None and (result[metric] is None or reference.get(metric) is None):
+                    skipped.add(metric)
+                continue
+            ratio = result[metric] / reference[metric]
+            result[metric + '_ratio'] = round(ratio, 3)
+            if ratio > 1 + tolerance:
+                regressions.append('{0} {1} x{2:.2f}'.format(name, metric, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='runs per benchmark, the best one is kept')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 10000, 100000],
+                        help='numbers of subscribers to decode')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--save', help='write the report to this json file')
+    parser.add_argument('--compare', help='baseline report to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown before failing')
+    args = parser.parse_args()
+
+    results = {}
+    for name, function in build_cases(args.sizes):
+        if args.filter not in name:
+            continue
+        cpu_ms, peak_kb = measure(function, args.repeat)
+        results[name] = {'cpu_ms': round(cpu_ms, 3), 'peak_kb': None if peak_kb is None else round(peak_kb, 1)}
+        print('{0:<48} {1:>12.3f} ms {2:>14} KiB'.format(
+            name, cpu_ms, '-' if peak_kb is None else '{0:.1f}'.format(peak_kb)), file=sys.stderr)
+
+    regressions = []
+    skipped = set()
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(results, json.load(baseline)['results'], args.tolerance, skipped)
+    if 'peak_kb' in skipped:
+        print('NOTE: peak memory not compared, it is only measured on Python 3.4+ (tracemalloc) and '
+              '{0} has none.'.format('this run' if tracemalloc is None else 'the baseline'), file=sys.stderr)
+
+    report = {
+        'python': platform.python_implementation() + ' ' + platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'json_codec': http_client('munch').codec.name,
+        'results': results,
+    }
+    if args.save:
+        with open(args.save, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+    for regression in regressions:
+        print('REGRESSION: ' + regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Startup benchmark: ``import statuspageio`` and ``statuspageio.Client(...)`` cost.
+
+Imports are timed in fresh interpreters, since a module is only imported once per process.
+Run it from the repository root::
+
+  $ python benchmarks/bench_startup.py
+  $ python benchmarks/bench_startup.py --max-import-ms 80 --max-construct-us 200
+
+Exits with a non zero status when a threshold is exceeded or when ``import statuspageio``
+pulls in a module which should only be loaded on first use.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+
+"""
+Modules which must not be imported by ``import statuspageio`` alone.
+"""
+LAZY_MODULES = ('requests', 'munch', 'asyncio', 'aiohttp', 'concurrent.futures', 'logging')
+
+IMPORT_PROBE = '''
+import sys, time
+start = time.time()
+import statuspageio
+elapsed = time.time() - start
+print(repr((elapsed, sorted(name for name in {lazy!r} if name in sys.modules))))
+'''
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(runs):
+    """
+    Median wall time of ``import statuspageio`` in fresh interpreters, in milliseconds,
+    and the lazy modules it loaded.
+    """
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT, env.get('PYTHONPATH')]))
+    probe = IMPORT_PROBE.format(lazy=LAZY_MODULES)
+
+    timings, loaded = [], set()
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', probe], env=env)
+        elapsed, modules = eval(output.decode('utf-8').strip().splitlines()[-1])
+        timings.append(elapsed * 1000)
+        loaded.update(modules)
+
+    timings.sort()
+    return timings[len(timings) // 2], sorted(loaded)
+
+
+def measure_construct(number):
+    """
+    Mean time of building a :class:`statuspageio.Client`, in microseconds.
+    """
+
+    sys.path.insert(0, ROOT)
+    import statuspageio
+
+    def construct():
+        statuspageio.Client(api_key='key', page_id='page', organization_id='organization')
+
+    best = min(timeit.repeat(construct, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=15, help='fresh interpreters to time the import in')
+    parser.add_argument('--number', type=int, default=2000, help='clients built per timing')
+    parser.add_argument('--max-import-ms', type=float, help='fail if the median import time is above')
+    parser.add_argument('--max-construct-us', type=float, help='fail if the construction time is above')
+    args = parser.parse_args()
+
+    import_ms, loaded = measure_import(args.runs)
+    construct_us = measure_construct(args.number)
+
+    print(json.dumps({
+        'python': sys.version.split()[0],
+        'import_ms': round(import_ms, 2),
+        'construct_us': round(construct_us, 2),
+        'eager_modules': loaded,
+    }, indent=2, sort_keys=True))
+
+    failures = []
+    if loaded:
+        failures.append('import statuspageio loaded {0}'.format(', '.join(loaded)))
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append('import took {0:.2f}ms > {1}ms'.format(import_ms, args.max_import_ms))
+    if args.max_construct_us is not None and construct_us > args.max_construct_us:
+        failures.append('construction took {0:.2f}us > {1}us'.format(construct_us, args.max_construct_us))
+
+    for failure in failures:
+        print('REGRESSION: ' + failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
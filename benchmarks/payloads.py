@@ -0,0 +1,113 @@
+"""
+Deterministic StatusPage.io-like payloads for the benchmarks.
+
+Shapes follow the documented v1 responses: list endpoints return bare json arrays, single
+resources bare objects. Values come from a seeded generator, so every run on every machine
+benchmarks exactly the same bytes.
+"""
+
+import json
+import random
+
+
+SEED = 20160401
+
+STATUSES = ('operational', 'degraded_performance', 'partial_outage', 'major_outage', 'under_maintenance')
+INCIDENT_STATUSES = ('investigating', 'identified', 'monitoring', 'resolved')
+
+
+def timestamp(rng):
+    return '2016-{0:02d}-{1:02d}T{2:02d}:{3:02d}:{4:02d}.000Z'.format(
+        rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59))
+
+
+def identifier(rng):
+    return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789') for _ in range(12))
+
+
+def component(rng, page_id, position):
+    return {
+        'id': identifier(rng),
+        'page_id': page_id,
+        'group_id': None if position % 10 == 0 else identifier(rng),
+        'name': 'Component {0}'.format(position),
+        'description': 'Service {0} of the platform, monitored every minute'.format(position),
+        'status': rng.choice(STATUSES),
+        'position': position,
+        'showcase': rng.random() < 0.5,
+        'only_show_if_degraded': False,
+        'automation_email': 'component+{0}@notifications.statuspage.io'.format(identifier(rng)),
+        'created_at': timestamp(rng),
+        'updated_at': timestamp(rng),
+    }
+
+
+def subscriber(rng, component_ids):
+    return {
+        'id': identifier(rng),
+        'email': 'user.{0}@example.com'.format(identifier(rng)),
+        'phone_number': None,
+        'phone_country': None,
+        'mode': 'email',
+        'skip_confirmation_notification': False,
+        'quarantined_at': None,
+        'purge_at': None,
+        'components': rng.sample(component_ids, min(3, len(component_ids))),
+        'created_at': timestamp(rng),
+    }
+
+
+def incident(rng, page_id, component_ids, updates):
+    incident_id = identifier(rng)
+    affected = rng.sample(component_ids, min(4, len(component_ids)))
+    return {
+        'id': incident_id,
+        'page_id': page_id,
+        'name': 'Elevated error rates on {0} services'.format(len(affected)),
+        'status': rng.choice(INCIDENT_STATUSES),
+        'impact': rng.choice(('none', 'minor', 'major', 'critical')),
+        'shortlink': 'http://stspg.io/{0}'.format(incident_id[:6]),
+        'created_at': timestamp(rng),
+        'updated_at': timestamp(rng),
+        'monitoring_at': None,
+        'resolved_at': timestamp(rng),
+        'incident_updates': [{
+            'id': identifier(rng),
+            'incident_id': incident_id,
+            'status': INCIDENT_STATUSES[min(number, len(INCIDENT_STATUSES) - 1)],
+            'body': 'We are continuing to investigate the issue. ' * 3,
+            'display_at': timestamp(rng),
+            'created_at': timestamp(rng),
+            'updated_at': timestamp(rng),
+            'affected_components': [{'code': code, 'old_status': 'operational', 'new_status': 'major_outage'}
+                                    for code in affected],
+        } for number in range(updates)],
+        'components': [dict(component(rng, page_id, position), id=code) for position, code in enumerate(affected)],
+    }
+
+
+def components(count=500, seed=SEED):
+    rng = random.Random(seed)
+    return [component(rng, 'page0000001', position) for position in range(count)]
+
+
+def subscribers(count, seed=SEED):
+    rng = random.Random(seed)
+    component_ids = [identifier(rng) for _ in range(50)]
+    return [subscriber(rng, component_ids) for _ in range(count)]
+
+
+def incidents(count=1000, updates=5, seed=SEED):
+    rng = random.Random(seed)
+    component_ids = [identifier(rng) for _ in range(50)]
+    return [incident(rng, 'page0000001', component_ids, updates) for _ in range(count)]
+
+
+def encoded(payload):
+    """
+    Response content as it comes off the wire.
+
+    :rtype: bytes
+    """
+
+    return json.dumps(payload).encode('utf-8')
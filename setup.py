@@ -17,7 +17,12 @@ setup(
     license='MIT',
     packages=['statuspageio'],
     install_requires=['requests', 'munch'],
-    use_2to3=True,
+    extras_require={
+        ':python_version<"3"': ['futures'],
+        'async': ['aiohttp'],
+        'http2': ['httpx[http2]'],
+        'parquet': ['pyarrow'],
+    },
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "Intended Audience :: Developers",
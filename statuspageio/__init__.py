@@ -22,7 +22,14 @@ from statuspageio.errors import (
 #
 
 from statuspageio.configuration import Configuration
+from statuspageio.retry import RetryPolicy
+from statuspageio.cache import ResponseCache
+from statuspageio.instrumentation import RequestEvent, StatsCollector
+from statuspageio.profiling import Profile
+from statuspageio.json_codec import JsonCodec
 from statuspageio.http_client import HttpClient
+from statuspageio.transports import Transport, RequestsTransport, Urllib3Transport, FakeTransport
+from statuspageio.fake import FakeStatusPage, FakeServer
 
 from statuspageio.services import (
     PageService,
@@ -32,6 +39,33 @@ from statuspageio.services import (
     MetricsService,
     UsersService,
 )
+from statuspageio.metrics_batcher import MetricsBatcher
+from statuspageio.metrics_backfill import MetricsBackfill, BackfillReport
+from statuspageio.incident_coalescer import IncidentUpdateCoalescer
+from statuspageio.mirror import PageMirror, ResourceIndex
+from statuspageio.subscriber_import import SubscriberImporter, ImportReport
+from statuspageio.export import ExportReport
+from statuspageio.models import (
+    Record,
+    Component,
+    Incident,
+    Subscriber,
+    Metric,
+    User,
+)
 
 
+from statuspageio.batch import Batch, BatchResult
 from statuspageio.client import Client
+from statuspageio.multi_page import MultiPageClient
+
+import sys
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        # asyncio and aiohttp are heavy, only pay for them when the async client is used (PEP 562)
+        if name in ('AsyncClient', 'AsyncHttpClient'):
+            import statuspageio.aio
+            return getattr(statuspageio.aio, name)
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+elif sys.version_info >= (3, 6):
+    from statuspageio.aio import AsyncClient, AsyncHttpClient
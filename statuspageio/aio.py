@@ -0,0 +1,819 @@
+"""
+Asyncio counterpart of :class:`statuspageio.Client`.
+
+Requires Python 3.6+ and :module:`aiohttp`. Every service method of the blocking client
+has an awaitable twin with the same signature and return value. Helpers built on background
+threads or blocking iteration, such as ``metrics.batcher`` or ``subscribers.stream``, are not
+available and raise :class:`TypeError`::
+
+  >>> import statuspageio
+  >>> async with statuspageio.AsyncClient(api_key='<YOUR_PERSONAL_API_KEY>', page_id='<YOUR_PAGE_ID>') as client:
+  ...     components = await client.components.list()
+"""
+
+import asyncio
+
+from statuspageio.configuration import Configuration
+from statuspageio.errors import ConfigurationError
+from statuspageio.http_client import BaseHttpClient
+from statuspageio.rate_limit import RATE_LIMIT_STATUSES, TokenBucket, monotonic, retry_after
+from statuspageio.retry import Attempt, RetryPolicy
+from statuspageio.services import (
+    PageService,
+    ComponentsService,
+    IncidentsService,
+    SubscribersService,
+    MetricsService,
+    UsersService,
+)
+from statuspageio.transports import TransportResponse
+
+
+def blocking_only(name):
+    """
+    Stand-in for a helper of a blocking service which has no awaitable twin: it would call the
+    coroutines of the async service without awaiting them, so it refuses to run instead.
+
+    :param str name: Name of the helper, e.g. ``'metrics.batcher'``.
+    """
+
+    def method(self, *args, **kwargs):
+        raise TypeError('{0} is not supported by AsyncClient, use it from statuspageio.Client.'.format(name))
+
+    method.__name__ = name.rsplit('.', 1)[-1]
+    return method
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    Wrapper over :module:`aiohttp` that understands StatusPage.io envelope, encoding and decoding schema.
+
+    Shares url building, envelope handling and error mapping with :class:`statuspageio.HttpClient`.
+    The underlying :class:`aiohttp.ClientSession` is created on first request, inside the running loop,
+    and its connector honours ``pool_connections``, ``pool_maxsize`` and ``pool_block`` of the configuration.
+
+    When ``rate_limit`` is configured, requests of every task are paced by a shared
+    :class:`TokenBucket <statuspageio.rate_limit.TokenBucket>` without blocking the loop, and rate
+    limited requests are queued again, as with the blocking client.
+
+    Transient failures - statuses of the configured :class:`RetryPolicy <statuspageio.RetryPolicy>`,
+    connection errors and timeouts - are retried with jittered exponential backoff, sleeping with
+    :func:`asyncio.sleep`.
+
+    With a :class:`ResponseCache <statuspageio.ResponseCache>` configured, GET responses are served
+    from memory while fresh, revalidated with conditional requests once stale, and invalidated by writes.
+    """
+
+    def __init__(self, config):
+        """
+        :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+        """
+
+        super(AsyncHttpClient, self).__init__(config)
+        try:
+            import aiohttp
+        except ImportError:
+            raise ConfigurationError('aiohttp is required by the asyncio client. '
+                                     'Install it using: "pip install statuspageio[async]"')
+        self.aiohttp = aiohttp
+        self.session = None
+        self.rate_limiter = None
+        if self.config.rate_limit:
+            self.rate_limiter = TokenBucket(self.config.rate_limit, self.config.rate_limit_burst)
+        self.retry_policy = self.config.retry or RetryPolicy(max_attempts=1)
+        self.cache = self.config.cache
+        self.profiler = self.config.profile
+        if self.config.verbose:
+            self.enable_logging()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def get_session(self):
+        """
+        Return the shared :class:`aiohttp.ClientSession`, creating it on first use.
+
+        Must be called from a coroutine so the session binds to the running loop.
+
+        :rtype: :class:`aiohttp.ClientSession`
+        """
+
+        if self.session is None:
+            self.session = self.build_session()
+        return self.session
+
+    def build_session(self):
+        """
+        Build an :class:`aiohttp.ClientSession` with a connection pool sized according to the configuration.
+
+        Without ``pool_block`` the total connection limit is lifted, matching the behaviour of the
+        blocking client which opens extra connections when a host pool is exhausted.
+
+        :rtype: :class:`aiohttp.ClientSession`
+        """
+
+        if self.config.pool_block:
+            limit = self.config.pool_connections * self.config.pool_maxsize
+            limit_per_host = self.config.pool_maxsize
+        else:
+            limit = limit_per_host = 0
+
+        connector = self.aiohttp.TCPConnector(limit=limit,
+                                              limit_per_host=limit_per_host,
+                                              ssl=None if self.config.verify_ssl else False)
+        return self.aiohttp.ClientSession(connector=connector,
+                                          headers={'User-Agent': self.config.user_agent},
+                                          timeout=self.aiohttp.ClientTimeout(total=float(self.config.timeout)))
+
+    @property
+    def retryable_exceptions(self):
+        """
+        Session exceptions worth another attempt.
+
+        :rtype: tuple
+        """
+
+        return (self.aiohttp.ClientError, asyncio.TimeoutError)
+
+    async def close(self):
+        """
+        Close the underlying session and every pooled connection it holds.
+        """
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def get(self, url, params=None, **kwargs):
+        """
+        Send a GET request. See :meth:`statuspageio.HttpClient.get`.
+        """
+
+        return await self.request('get', url, params=params, **kwargs)
+
+    async def post(self, url, body=None, **kwargs):
+        """
+        Send a POST request. See :meth:`statuspageio.HttpClient.post`.
+        """
+
+        return await self.request('post', url, body=body, **kwargs)
+
+    async def put(self, url, body=None, **kwargs):
+        """
+        Send a PUT request. See :meth:`statuspageio.HttpClient.put`.
+        """
+
+        return await self.request('put', url, body=body, **kwargs)
+
+    async def patch(self, url, body=None, **kwargs):
+        """
+        Send a PATCH request. See :meth:`statuspageio.HttpClient.patch`.
+        """
+
+        return await self.request('patch', url, body=body, **kwargs)
+
+    async def delete(self, url, params=None, **kwargs):
+        """
+        Send a DELETE request. See :meth:`statuspageio.HttpClient.delete`.
+        """
+
+        return await self.request('delete', url, params=params, **kwargs)
+
+    async def request(self, method, url, params=None, body=None, **kwargs):
+        """
+        Send an HTTP request. See :meth:`statuspageio.HttpClient.request`, streamed responses are not supported.
+
+        :raises RequestError: if authentication failed, invalid query parameter etc.
+        :raises RateLimitError: if rate limit exceeded.
+        :raises ResourceError: if requests payload included invalid attributes or were missing.
+        :raises ServerError: if StatusPage.io backend servers encounterered an unexpected condition.
+        :raises TypeError: if ``stream`` is set.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        if 'stream' in kwargs and kwargs['stream']:
+            raise TypeError('Streamed responses are not supported by AsyncClient, use statuspageio.Client.')
+
+        path = url
+        profile = None
+        if self.profiler is not None:
+            profile = self.profiler.start(method, path)
+            started = monotonic()
+
+        request_headers = self.build_headers(**kwargs)
+        body = self.encode_body(body, request_headers, **kwargs)
+        if profile is not None:
+            profile.add('encode', monotonic() - started)
+
+        event = self.start_event(method, path, body)
+        if event is None and profile is None:
+            return await self.__request(method, path, params, body, request_headers, None, None, [], **kwargs)
+
+        if event is not None:
+            event.profile = profile
+        attempts = []
+        try:
+            result = await self.__request(method, path, params, body, request_headers, event, profile,
+                                          attempts, **kwargs)
+        except Exception as e:
+            if event is not None:
+                if event.status_code is None:
+                    event.attempts = len(attempts)
+                self.finish_event(event, e)
+            raise
+        finally:
+            if profile is not None:
+                self.profiler.finish(profile)
+        if event is not None:
+            self.finish_event(event)
+        return result
+
+    async def __request(self, method, path, params, body, request_headers, event, profile, attempts, **kwargs):
+        cacheable = self.cache is not None and method.lower() == 'get'
+        cached = None
+        if cacheable:
+            cache_key = self.cache.key(method, path, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if cached.fresh:
+                    return self.serve_cached(cached, path, event, profile, **kwargs)
+                request_headers.update(cached.conditional_headers())
+            generation = self.cache.generation
+
+        resp = await self.send(method, self.build_url(path), profile, attempts,
+                               params=params, data=body, headers=request_headers)
+        if profile is not None:
+            profile.response_bytes = len(resp.content)
+        if event is not None:
+            event.status_code, event.response_bytes, event.attempts = (
+                resp.status_code, len(resp.content), len(attempts))
+
+        if self.cache is not None and not cacheable:
+            self.cache.invalidate(path)
+
+        if cached is not None and resp.status_code == 304:
+            self.cache.refresh(cached)
+            return self.serve_cached(cached, path, event, profile, revalidated=True, **kwargs)
+
+        if not (200 <= resp.status_code < 300):
+            self.raise_for_error(resp.status_code, resp.content)
+
+        if cacheable:
+            self.cache.store(cache_key, path, resp.status_code, resp.headers, resp.content, generation)
+
+        resp_body = self.decode_body(resp.headers, resp.content, path=path, profile=profile, **kwargs)
+
+        return (resp.status_code, resp.headers, resp_body)
+
+    async def send(self, method, url, profile=None, attempts=None, **kwargs):
+        """
+        Send a prepared request, retrying transient failures according to the retry policy.
+        See :meth:`statuspageio.HttpClient.send`.
+
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile the network phases are recorded in.
+        :param list attempts: (optional) List the :class:`statuspageio.retry.Attempt` of every attempt is appended to.
+        :param dict **kwargs: Parameters passed to :meth:`aiohttp.ClientSession.request`.
+        :return: Response of the last attempt.
+        :rtype: :class:`statuspageio.transports.TransportResponse`
+        """
+
+        policy = self.retry_policy
+        if attempts is None:
+            attempts = []
+        number = 1
+        while True:
+            started = monotonic()
+            try:
+                resp = await self.send_paced(method, url, profile, **kwargs)
+            except self.retryable_exceptions as e:
+                attempts.append(Attempt(number, monotonic() - started, error=e))
+                if not policy.should_retry(method, number):
+                    raise
+                delay = policy.backoff(number)
+            else:
+                attempts.append(Attempt(number, monotonic() - started, status_code=resp.status_code))
+                wait = retry_after(resp.headers)
+                if not policy.should_retry(method, number, resp.status_code, wait):
+                    return resp
+                delay = policy.backoff(number, wait)
+
+            attempts[-1].delay = delay
+            if profile is not None:
+                profile.add('backoff', delay)
+            await asyncio.sleep(delay)
+            number += 1
+
+    async def send_paced(self, method, url, profile=None, **kwargs):
+        """
+        Send a prepared request, pacing it with the rate limiter if any. See :meth:`statuspageio.HttpClient.send_paced`.
+
+        :rtype: :class:`statuspageio.transports.TransportResponse`
+        """
+
+        if self.rate_limiter is None:
+            return await self.transmit(method, url, profile, **kwargs)
+
+        attempt = 0
+        while True:
+            waited = self.rate_limiter.reserve()
+            if waited > 0:
+                await asyncio.sleep(waited)
+            if profile is not None:
+                profile.add('pacing', waited)
+            resp = await self.transmit(method, url, profile, **kwargs)
+
+            delay = retry_after(resp.headers)
+            rate_limited = resp.status_code in RATE_LIMIT_STATUSES
+            if delay is None and rate_limited:
+                delay = self.rate_limiter.interval * 2 ** attempt
+            if delay is not None:
+                self.rate_limiter.pause(delay)
+
+            if not rate_limited or attempt >= self.config.rate_limit_retries:
+                return resp
+            attempt += 1
+
+    async def transmit(self, method, url, profile=None, **kwargs):
+        """
+        Send a single request through the session and read the whole response.
+
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile the ``transport`` and ``read``
+                                                      phases are recorded in.
+        :param dict **kwargs: Parameters passed to :meth:`aiohttp.ClientSession.request`.
+        :rtype: :class:`statuspageio.transports.TransportResponse`
+        """
+
+        session = self.get_session()
+        started = monotonic()
+        async with session.request(method, url, **kwargs) as resp:
+            received = monotonic()
+            content = await resp.read()
+        if profile is not None:
+            profile.add('transport', received - started)
+            profile.add('read', monotonic() - received)
+        return TransportResponse(resp.status, resp.headers, content, received - started)
+
+
+async def paginate(fetch, per_page=100, prefetch=False, start_page=1):
+    """
+    Asynchronous counterpart of :func:`statuspageio.pagination.paginate`, stopping as well at a page
+    identical to the previous one.
+
+    :param coroutine function fetch: Called with ``(page, per_page)``, returns the list of items of that page.
+    :param int per_page: (optional) Number of items requested per page. Default: **100**.
+    :param bool prefetch: (optional) Whether to request the next page in a background task
+                          while the current one is consumed. Default: ``False``.
+    :param int start_page: (optional) Number of the first page to fetch. Default: **1**.
+    :return: Asynchronous generator of items.
+    """
+
+    page = start_page
+    previous = None
+    pending = asyncio.ensure_future(fetch(page, per_page))
+    while True:
+        items = await pending
+        if items == previous:
+            return
+        last = len(items) < per_page
+        if not last:
+            page += 1
+            if prefetch:
+                pending = asyncio.ensure_future(fetch(page, per_page))
+            else:
+                pending = None
+
+        for item in items:
+            yield item
+
+        if last:
+            return
+        previous = items
+        if pending is None:
+            pending = asyncio.ensure_future(fetch(page, per_page))
+
+
+class AsyncPageService(PageService):
+    """
+    Awaitable :class:`statuspageio.PageService`.
+    """
+
+    async def get(self):
+        _, _, page = await self.http_client.get('/pages/{page_id}.json'.format(page_id=self.page_id))
+
+        return page
+
+    async def update(self, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.UPDATE_OPTS_KEYS_TO_PERSIST)
+
+        page = await self.http_client.patch('/pages/{page_id}.json'.format(page_id=self.page_id),
+                                            container=self.container,
+                                            body=attributes)
+
+        return page
+
+
+class AsyncComponentsService(ComponentsService):
+    """
+    Awaitable :class:`statuspageio.ComponentsService`.
+
+    :meth:`sync` plans with the :class:`statuspageio.reconcile.Reconciler` of the blocking service,
+    whose snapshot is kept current from every ``create``, ``update`` and ``delete``.
+    """
+
+    async def list(self):
+        _, _, components = await self.http_client.get(
+            '/pages/{page_id}/components.json'.format(page_id=self.page_id))
+        return components
+
+    async def create(self, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.OPTS_KEYS_TO_PERSIST)
+
+        _, _, component = await self.http_client.post(
+            '/pages/{page_id}/components.json'.format(
+                page_id=self.page_id), container=self.container, body=attributes)
+        self.reconciler.put(component)
+
+        return component
+
+    async def delete(self, component_id):
+        status_code, _, _ = await self.http_client.delete(
+            "/pages/{page_id}/components/{component_id}.json".format(
+                page_id=self.page_id, component_id=component_id))
+        self.reconciler.remove(component_id)
+        return status_code
+
+    async def update(self, component_id, **kwargs):
+        if not kwargs:
+            raise Exception('attributes for Contact are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.OPTS_KEYS_TO_PERSIST)
+
+        _, _, component = await self.http_client.patch(
+            "/pages/{page_id}/components/{component_id}.json".format(
+                page_id=self.page_id, component_id=component_id), container='component', body=attributes)
+        self.reconciler.put(component)
+        return component
+
+    async def sync(self, desired, delete_missing=False, refresh=False, max_workers=8):
+        if refresh or self.reconciler.snapshot is None:
+            self.reconciler.load(await self.list())
+
+        report, calls = self.reconciler.calls(desired, delete_missing)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(action, args, kwargs):
+            async with semaphore:
+                return await getattr(self, action)(*args, **kwargs)
+
+        results = await asyncio.gather(*[call(action, args, kwargs) for _, action, args, kwargs in calls],
+                                       return_exceptions=True)
+        for (key, action, _, _), result in zip(calls, results):
+            self.reconciler.record(report, key, action, result)
+
+        return report
+
+
+class AsyncIncidentsService(IncidentsService):
+    """
+    Awaitable :class:`statuspageio.IncidentsService`.
+    """
+
+    async def list(self):
+        _, _, incidents = await self.http_client.get(
+            '/pages/{page_id}/incidents.json'.format(page_id=self.page_id))
+        return incidents
+
+    async def iter_all(self, per_page=100, prefetch=False):
+        async def fetch(page, per_page):
+            _, _, incidents = await self.http_client.get(
+                '/pages/{page_id}/incidents.json'.format(page_id=self.page_id),
+                params={'page': page, 'per_page': per_page})
+            return incidents
+
+        async for incident in paginate(fetch, per_page=per_page, prefetch=prefetch):
+            yield incident
+
+    async def list_unresolved(self):
+        _, _, incidents = await self.http_client.get(
+            '/pages/{page_id}/incidents/unresolved.json'.format(page_id=self.page_id))
+        return incidents
+
+    async def list_scheduled(self):
+        _, _, incidents = await self.http_client.get(
+            '/pages/{page_id}/incidents/scheduled.json'.format(page_id=self.page_id))
+        return incidents
+
+    async def create(self, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
+
+        _, _, incident = await self.http_client.post(
+            '/pages/{page_id}/incidents.json'.format(
+                page_id=self.page_id), container=self.container, body=attributes)
+
+        return incident
+
+    async def create_scheduled(self, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_SCHEDULED_OPTS_KEYS_TO_PERSIST)
+
+        _, _, incident = await self.http_client.post(
+            '/pages/{page_id}/incidents.json'.format(
+                page_id=self.page_id), container=self.container, body=attributes)
+
+        return incident
+
+    async def delete(self, incident_id):
+        status_code, _, _ = await self.http_client.delete(
+            "/pages/{page_id}/incidents/{incident_id}.json".format(
+                page_id=self.page_id, incident_id=incident_id))
+        return status_code
+
+    async def update(self, incident_id, **kwargs):
+        if not kwargs:
+            raise Exception('attributes for Contact are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.UPDATE_OPTS_KEYS_TO_PERSIST)
+
+        _, _, incident = await self.http_client.patch(
+            "/pages/{page_id}/incidents/{incident_id}.json".format(
+                page_id=self.page_id, incident_id=incident_id), container=self.container, body=attributes)
+        return incident
+
+    coalescer = blocking_only('incidents.coalescer')
+
+
+class AsyncSubscribersService(SubscribersService):
+    """
+    Awaitable :class:`statuspageio.SubscribersService`.
+    """
+
+    async def list(self):
+        _, _, subscribers = await self.http_client.get(
+            '/pages/{page_id}/subscribers.json'.format(page_id=self.page_id))
+        return subscribers
+
+    async def iter_all(self, per_page=100, prefetch=False):
+        async def fetch(page, per_page):
+            _, _, subscribers = await self.http_client.get(
+                '/pages/{page_id}/subscribers.json'.format(page_id=self.page_id),
+                params={'page': page, 'per_page': per_page})
+            return subscribers
+
+        async for subscriber in paginate(fetch, per_page=per_page, prefetch=prefetch):
+            yield subscriber
+
+    stream = blocking_only('subscribers.stream')
+    export = blocking_only('subscribers.export')
+
+    async def create(self, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
+
+        _, _, subscriber = await self.http_client.post(
+            '/pages/{page_id}/subscribers.json'.format(
+                page_id=self.page_id), container=self.container, body=attributes)
+
+        return subscriber
+
+    bulk_import = blocking_only('subscribers.bulk_import')
+
+    async def delete(self, subscriber_id=None):
+        status_code, _, _ = await self.http_client.delete(
+            "/pages/{page_id}/subscribers/{subscriber_id}.json".format(
+                page_id=self.page_id, subscriber_id=subscriber_id))
+        return status_code
+
+
+class AsyncMetricsService(MetricsService):
+    """
+    Awaitable :class:`statuspageio.MetricsService`.
+    """
+
+    async def list_available(self):
+        _, _, providers = await self.http_client.get('/metrics_providers.json')
+        return providers
+
+    async def list_linked(self):
+        _, _, providers = await self.http_client.get(
+            '/pages/{page_id}/metrics_providers.json'.format(page_id=self.page_id))
+        return providers
+
+    async def list_metrics_for_provider(self, provider_id=None):
+        _, _, metrics = await self.http_client.get(
+            '/pages/{page_id}/metrics_providers/{metrics_provider_id}/metrics.json'.format(
+                page_id=self.page_id, metrics_provider_id=provider_id))
+        return metrics
+
+    async def create(self, provider_id=None, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
+
+        _, _, metric = await self.http_client.post(
+            '/pages/{page_id}/metrics_providers/{metrics_provider_id}/metrics.json'.format(
+                page_id=self.page_id, metrics_provider_id=provider_id), container=self.container, body=attributes)
+
+        return metric
+
+    async def submit_data(self, metric_id=None, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.DATA_OPTS_KEYS_TO_PERSIST)
+
+        _, _, metric = await self.http_client.post(
+            '/pages/{page_id}/metrics/{metric_id}/data.json'.format(
+                page_id=self.page_id, metric_id=metric_id), container='data', body=attributes)
+
+        return metric
+
+    async def submit_bulk_data(self, data):
+        if not data:
+            raise Exception('data points are missing')
+
+        points = dict((metric_id, [dict((k, v) for k, v in point.items()
+                                        if k in self.DATA_OPTS_KEYS_TO_PERSIST)
+                                   for point in metric_points])
+                      for metric_id, metric_points in data.items())
+
+        _, _, metric = await self.http_client.post(
+            '/pages/{page_id}/metrics/data.json'.format(
+                page_id=self.page_id), container='data', body=points)
+
+        return metric
+
+    batcher = blocking_only('metrics.batcher')
+    backfill = blocking_only('metrics.backfill')
+
+    async def delete_all_data(self, metric_id=None):
+        metric, _, _, = await self.http_client.delete(
+            "/pages/{page_id}/metrics/{metric_id}/data.json".format(
+                page_id=self.page_id, metric_id=metric_id))
+        return metric
+
+    async def delete(self, metric_id=None):
+        _, _, metric = await self.http_client.delete(
+            "/pages/{page_id}/metrics/{metric_id}.json".format(
+                page_id=self.page_id, metric_id=metric_id))
+        return metric
+
+
+class AsyncUsersService(UsersService):
+    """
+    Awaitable :class:`statuspageio.UsersService`.
+    """
+
+    async def list(self):
+        _, _, users = await self.http_client.get(
+            '/organizations/{organization_id}/users.json'.format(
+                organization_id=self.organization_id), container=self.container)
+        return users
+
+    async def iter_all(self, per_page=100, prefetch=False):
+        async def fetch(page, per_page):
+            _, _, users = await self.http_client.get(
+                '/organizations/{organization_id}/users.json'.format(
+                    organization_id=self.organization_id),
+                params={'page': page, 'per_page': per_page})
+            return users
+
+        async for user in paginate(fetch, per_page=per_page, prefetch=prefetch):
+            yield user
+
+    stream = blocking_only('users.stream')
+    export = blocking_only('users.export')
+
+    async def create(self, **kwargs):
+        if not kwargs:
+            raise Exception('attributes are missing')
+
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
+
+        _, _, user = await self.http_client.post(
+            '/organizations/{organization_id}/users.json'.format(
+                organization_id=self.organization_id), container=self.container, body=attributes)
+
+        return user
+
+    async def delete(self, user_id=None):
+        _, _, user = await self.http_client.delete(
+            "/organizations/{organization_id}/users/{user_id}.json".format(
+                organization_id=self.organization_id, user_id=user_id))
+        return user
+
+
+class AsyncClient(object):
+    """
+    The :class:`AsyncClient <AsyncClient>` is the asyncio entry point to all services and actions.
+
+    Accepts the same options as :class:`statuspageio.Client`. Services are the awaitable twins
+    of the blocking ones and share one :class:`AsyncHttpClient <AsyncHttpClient>` connection pool,
+    so many calls can be in flight concurrently on a single event loop.
+
+    :attribute :class:`Configuration <statuspageio.Configuration>` config: Current StatusPage.io client configuration.
+    :attribute :class:`AsyncHttpClient <statuspageio.aio.AsyncHttpClient>` http_client: Http client.
+    """
+
+    def __init__(self, **options):
+        """
+        Usage::
+
+          >>> import statuspageio
+          >>> client = statuspageio.AsyncClient(api_key='<YOUR_PERSONAL_API_KEY>', page_id='<YOUR_PAGE_ID>')
+          <statuspageio.AsyncClient>
+
+        :raises ConfigurationError: if ``aiohttp`` is not installed.
+        :raises ConfigurationError: if configuration is invalid, see :class:`statuspageio.Client`.
+        """
+
+        self.config = Configuration(**options)
+        self.config.validate()
+
+        self.http_client = AsyncHttpClient(self.config)
+        self.organization_id = self.config.organization_id
+
+        self.__pages = AsyncPageService(self.http_client, self.config.page_id)
+        self.__components = AsyncComponentsService(self.http_client, self.config.page_id)
+        self.__incidents = AsyncIncidentsService(self.http_client, self.config.page_id)
+        self.__subscribers = AsyncSubscribersService(self.http_client, self.config.page_id)
+        self.__metrics = AsyncMetricsService(self.http_client, self.config.page_id)
+        self.__users = AsyncUsersService(self.http_client, self.organization_id)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Release the pooled connections shared by every service of this client.
+        """
+
+        await self.http_client.close()
+
+    @property
+    def stats(self):
+        """
+        Request statistics, ``None`` unless the ``stats`` option is set.
+
+        :rtype: :class:`statuspageio.StatsCollector`
+        """
+
+        return self.http_client.stats
+
+    @property
+    def pages(self):
+        return self.__pages
+
+    @property
+    def components(self):
+        return self.__components
+
+    @property
+    def incidents(self):
+        return self.__incidents
+
+    @property
+    def subscribers(self):
+        return self.__subscribers
+
+    @property
+    def metrics(self):
+        return self.__metrics
+
+    @property
+    def users(self):
+        return self.__users
@@ -0,0 +1,107 @@
+import atexit
+import threading
+
+from statuspageio.rate_limit import monotonic
+
+
+"""
+Flushers not closed yet, closed at interpreter exit. Closed ones are dropped so they can be collected.
+"""
+OPEN_FLUSHERS = set()
+OPEN_FLUSHERS_LOCK = threading.Lock()
+
+
+def close_open_flushers():
+    with OPEN_FLUSHERS_LOCK:
+        flushers = list(OPEN_FLUSHERS)
+    for flusher in flushers:
+        flusher.close()
+
+
+atexit.register(close_open_flushers)
+
+
+class BackgroundFlusher(object):
+    """
+    In-memory buffer flushed by a daemon thread, base of :class:`statuspageio.MetricsBatcher` and
+    :class:`statuspageio.IncidentUpdateCoalescer`.
+
+    Subclasses guard their buffer with ``_lock``, notify ``_wakeup`` when buffered data may have become
+    due, and implement :meth:`_poll`, :meth:`_flush_due` and :meth:`flush`. The worker waits until
+    :meth:`_poll` reports due data and hands it to :meth:`_flush_due` outside of the lock.
+    Pending data is flushed on :meth:`close` and, for flushers still open, at interpreter exit.
+    """
+
+    def __init__(self, name):
+        """
+        Starts the worker, so the state read by :meth:`_poll` must be set up before.
+
+        :param str name: Name of the worker thread.
+        """
+
+        self._closed = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+
+        self.__worker = threading.Thread(target=self.__run, name=name)
+        self.__worker.daemon = True
+        with OPEN_FLUSHERS_LOCK:
+            OPEN_FLUSHERS.add(self)
+        self.__worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def flush(self):
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Stop the background thread and flush the pending data.
+        """
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+
+        self.__worker.join()
+        self.flush()
+        with OPEN_FLUSHERS_LOCK:
+            OPEN_FLUSHERS.discard(self)
+
+    def _poll(self, now):
+        """
+        Called by the worker with ``_lock`` held.
+
+        :param float now: Current :func:`statuspageio.rate_limit.monotonic` time.
+        :return: Tuple of ``(due, timeout)``: the data to flush or ``None`` if nothing is due yet, and the
+                 seconds to wait before polling again, ``None`` to wait for a notification.
+        :rtype: tuple
+        """
+
+        raise NotImplementedError
+
+    def _flush_due(self, due):
+        """
+        Called by the worker, without the lock, with data reported by :meth:`_poll`.
+        """
+
+        raise NotImplementedError
+
+    def __run(self):
+        while True:
+            with self._lock:
+                while not self._closed:
+                    due, timeout = self._poll(monotonic())
+                    if due is not None:
+                        break
+                    self._wakeup.wait(timeout)
+                if self._closed:
+                    return
+
+            self._flush_due(due)
@@ -0,0 +1,119 @@
+class BatchResult(object):
+    """
+    Outcome of one call of a :class:`Batch <Batch>`.
+
+    :attribute value: Return value of the call, ``None`` if it failed.
+    :attribute Exception error: Exception raised by the call, ``None`` if it succeeded.
+    """
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return '<BatchResult value={0!r}>'.format(self.value)
+        return '<BatchResult error={0!r}>'.format(self.error)
+
+
+class ServiceProxy(object):
+    """
+    Stands for a service inside a batch: calling any of its actions schedules the call
+    and returns a :class:`concurrent.futures.Future`.
+    """
+
+    def __init__(self, batch, service):
+        self.__batch = batch
+        self.__service = service
+
+    def __getattr__(self, name):
+        action = getattr(self.__service, name)
+        if not callable(action):
+            return action
+
+        def submit(*args, **kwargs):
+            return self.__batch.submit(action, *args, **kwargs)
+
+        return submit
+
+
+class Batch(object):
+    """
+    Runs many service calls concurrently on a thread pool sharing the client connection pool.
+
+    Calls are scheduled either through the service proxies (``batch.components.update(...)``) or
+    :meth:`submit`, and return futures. A failing call does not stop the others: :meth:`results`
+    returns one :class:`BatchResult <BatchResult>` per call, in submission order.
+
+    Usage::
+
+      >>> with client.batch(max_workers=16) as batch:
+      ...     for component_id in component_ids:
+      ...         batch.components.update(component_id, status='major_outage')
+      >>> failed = [result.error for result in batch.results() if not result.ok]
+
+    Keep ``max_workers`` at most ``pool_maxsize`` so every worker gets a kept-alive connection.
+    Normally you will build it with :meth:`statuspageio.Client.batch`.
+    """
+
+    def __init__(self, client, max_workers=8):
+        """
+        :param :class:`statuspageio.Client` client: Client whose services are called.
+        :param int max_workers: (optional) Maximum number of concurrent calls. Default: **8**.
+        """
+
+        self.client = client
+        self.max_workers = max_workers
+        self.futures = []
+
+        from concurrent.futures import ThreadPoolExecutor
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return ServiceProxy(self, getattr(self.client, name))
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule a call of any callable, typically a service action.
+
+        :param callable fn: Callable to run on the pool.
+        :return: Future of the call.
+        :rtype: :class:`concurrent.futures.Future`
+        """
+
+        future = self.__executor.submit(fn, *args, **kwargs)
+        self.futures.append(future)
+        return future
+
+    def results(self):
+        """
+        Wait for every scheduled call.
+
+        :return: One result per call, in submission order.
+        :rtype: list of :class:`BatchResult <BatchResult>`
+        """
+
+        results = []
+        for future in self.futures:
+            error = future.exception()
+            results.append(BatchResult(error=error) if error is not None else BatchResult(future.result()))
+        return results
+
+    def close(self):
+        """
+        Wait for every scheduled call and release the worker threads.
+        """
+
+        self.__executor.shutdown(wait=True)
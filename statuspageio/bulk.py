@@ -0,0 +1,143 @@
+"""
+Building blocks shared by the long running bulk jobs: subscriber import, export and metrics backfill.
+
+The jobs send their requests through the service they are given, so they are paced by the client:
+configure ``rate_limit`` on :class:`statuspageio.Client` to stay under the API rate limit.
+"""
+
+import json
+import os
+import threading
+
+
+"""
+File formats by extension.
+"""
+FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+}
+
+
+def format_of(path):
+    """
+    :param str path: Path of a file.
+    :return: Format of the file guessed from its extension, ``None`` if unknown.
+    :rtype: str
+    """
+
+    return FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+class BulkReport(object):
+    """
+    Base of the outcomes of bulk jobs, handed to their ``progress`` callback while they run.
+
+    :attribute float elapsed: Seconds spent so far.
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    @property
+    def processed(self):
+        """
+        Units of work - rows, records, points - completed so far.
+
+        :rtype: int
+        """
+
+        raise NotImplementedError
+
+    @property
+    def rate(self):
+        """
+        Units of work completed per second.
+
+        :rtype: float
+        """
+
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+def load_checkpoint(path):
+    """
+    :param str path: Checkpoint file.
+    :return: The json document of the file, or ``None`` if it does not exist.
+    """
+
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path) as source:
+        return json.load(source)
+
+
+def save_checkpoint(path, state):
+    """
+    Replace a checkpoint file atomically, so an interruption leaves either the previous state or the new one.
+
+    :param str path: Checkpoint file.
+    :param dict state: Json serializable state.
+    """
+
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as output:
+        json.dump(state, output)
+    if os.name == 'nt' and os.path.exists(path):
+        # rename does not replace on Windows
+        os.remove(path)
+    os.rename(temporary, path)
+
+
+class BoundedExecutor(object):
+    """
+    Thread pool whose :meth:`submit` blocks while ``2 * max_workers`` calls are pending - the ones in
+    flight plus one queued per worker - so a job over a large input holds a bounded part of it in memory.
+
+    A failure that should stop the job is recorded with :meth:`fail`, the job checks :attr:`error`
+    before submitting more work and raises it once :meth:`shutdown` returned.
+    """
+
+    def __init__(self, max_workers):
+        """
+        :param int max_workers: Maximum number of concurrent calls.
+        """
+
+        from concurrent.futures import ThreadPoolExecutor
+        self.error = None
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__slots = threading.BoundedSemaphore(2 * max_workers)
+
+    def submit(self, done, function, *args, **kwargs):
+        """
+        Call ``function(*args, **kwargs)`` in a worker thread.
+
+        :param callable done: Called with the completed :class:`concurrent.futures.Future`, in the worker thread.
+        """
+
+        self.__slots.acquire()
+        future = self.__executor.submit(function, *args, **kwargs)
+        future.add_done_callback(lambda future: self.__done(future, done))
+
+    def fail(self, error):
+        """
+        Record the error stopping the job, the first one is kept.
+
+        :param Exception error: The error.
+        """
+
+        if self.error is None:
+            self.error = error
+
+    def shutdown(self):
+        """
+        Wait for the pending calls.
+        """
+
+        self.__executor.shutdown(wait=True)
+
+    def __done(self, future, done):
+        self.__slots.release()
+        done(future)
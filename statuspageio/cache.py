@@ -0,0 +1,212 @@
+import fnmatch
+import threading
+from collections import OrderedDict
+
+from statuspageio.rate_limit import monotonic
+
+
+class CacheEntry(object):
+    """
+    Raw response kept by :class:`ResponseCache <ResponseCache>`.
+
+    The undecoded content is stored so every hit is decoded afresh and callers never share
+    (and mutate) the same munchified object.
+    """
+
+    def __init__(self, path, status_code, headers, content, expires_at):
+        self.path = path
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+        self.etag = headers.get('ETag')
+        self.last_modified = headers.get('Last-Modified')
+
+    @property
+    def fresh(self):
+        return monotonic() < self.expires_at
+
+    @property
+    def revalidatable(self):
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self):
+        """
+        Headers turning a request for this resource into a conditional one.
+
+        :rtype: dict
+        """
+
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """
+    Bounded LRU cache of GET responses with per-endpoint TTLs, used by :class:`statuspageio.HttpClient`.
+
+    Entries are keyed by method, sub URL and query parameters. Once an entry expires it is revalidated
+    with ``If-None-Match``/``If-Modified-Since`` when the server sent an ``ETag`` or ``Last-Modified``
+    header, otherwise fetched again. Any write (POST, PUT, PATCH, DELETE) drops the cached reads of
+    the resource collection it touches, e.g. ``components.update`` invalidates ``components.list``,
+    and of the collections listing the same resources, see :attr:`RELATED_COLLECTIONS`.
+
+    Usage::
+
+      >>> cache = statuspageio.ResponseCache(default_ttl=30, ttls={'/pages/*/incidents/unresolved.json': 5})
+      >>> client = statuspageio.Client(api_key='...', page_id='...', cache=cache)
+    """
+
+    """
+    Collections of a page whose listings a write to another collection changes: metrics are written
+    under ``metrics`` and ``metrics_providers`` and listed under ``metrics_providers``, and incidents
+    change the status of their components.
+    """
+    RELATED_COLLECTIONS = {
+        'incidents': ('components',),
+        'metrics': ('metrics_providers',),
+        'metrics_providers': ('metrics',),
+    }
+
+    def __init__(self, default_ttl=30.0, ttls=None, max_entries=256):
+        """
+        :param float default_ttl: (optional) Seconds a response stays fresh. Default: **30** seconds.
+        :param dict ttls: (optional) Mapping of sub URL glob patterns to TTLs overriding ``default_ttl``,
+                          a TTL of ``0`` disables caching of the matching endpoints. Default: ``{}``.
+        :param int max_entries: (optional) Maximum number of cached responses. Default: **256**.
+        """
+
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def key(method, path, params=None):
+        """
+        Build the cache key of a request.
+
+        :param str method: Http method.
+        :param str path: Sub URL of the request.
+        :param dict params: (optional) Query parameters, list values included.
+        :rtype: tuple
+        """
+
+        params = [(name, tuple(value) if isinstance(value, (list, tuple)) else value)
+                  for name, value in (params or {}).items()]
+        return (method.lower(), path, tuple(sorted(params, key=lambda param: param[0])))
+
+    @property
+    def generation(self):
+        """
+        Number of invalidations so far. Read it before sending a request and pass it to :meth:`store`,
+        so a response fetched while a write invalidated the cache is not stored.
+
+        :rtype: int
+        """
+
+        return self.__generation
+
+    def ttl(self, path):
+        """
+        TTL of an endpoint.
+
+        :param str path: Sub URL of the request.
+        :rtype: float
+        """
+
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key):
+        """
+        Look up an entry, fresh or stale, marking it as recently used.
+
+        :rtype: :class:`CacheEntry <CacheEntry>` or ``None``
+        """
+
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is None:
+                return None
+            if entry.fresh or entry.revalidatable:
+                self.__entries[key] = entry
+                return entry
+            return None
+
+    def store(self, key, path, status_code, headers, content, generation=None):
+        """
+        Cache a successful response, evicting the least recently used entries beyond ``max_entries``.
+
+        :param int generation: (optional) :attr:`generation` read before the request was sent. The response
+                               is dropped if the cache was invalidated since, it may predate the write.
+        """
+
+        ttl = self.ttl(path)
+        if ttl <= 0:
+            return
+
+        entry = CacheEntry(path, status_code, headers, content, monotonic() + ttl)
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            self.__entries.pop(key, None)
+            self.__entries[key] = entry
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def refresh(self, entry):
+        """
+        Extend the lifetime of an entry the server confirmed as not modified.
+        """
+
+        entry.expires_at = monotonic() + self.ttl(entry.path)
+
+    def invalidate(self, path):
+        """
+        Drop cached reads of the resource collection a write went to.
+
+        ``/pages/{page_id}/components/{component_id}.json`` invalidates everything under
+        ``/pages/{page_id}/components``, plus the :attr:`RELATED_COLLECTIONS` of ``components``, while a write
+        to ``/pages/{page_id}.json`` invalidates the whole page. Paths are compared segment by segment,
+        so a write to page ``ab`` leaves page ``abc`` alone.
+
+        :param str path: Sub URL of the write request.
+        """
+
+        segments = path.rsplit('.json', 1)[0].strip('/').split('/')
+        if len(segments) > 2:
+            collections = (segments[2],) + self.RELATED_COLLECTIONS.get(segments[2], ())
+            prefixes = ['/' + '/'.join(segments[:2] + [collection]) for collection in collections]
+        else:
+            prefixes = ['/' + '/'.join(segments)]
+        with self.__lock:
+            self.__generation += 1
+            for key in [key for key, entry in self.__entries.items()
+                        if any(self.__under(entry.path, prefix) for prefix in prefixes)]:
+                del self.__entries[key]
+
+    def clear(self):
+        """
+        Drop every cached response.
+        """
+
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    @staticmethod
+    def __under(path, prefix):
+        path = path.rsplit('.json', 1)[0]
+        return path == prefix or path.startswith(prefix + '/')
@@ -1,5 +1,9 @@
+import threading
+
 from statuspageio.configuration import Configuration
 from statuspageio.http_client import HttpClient
+from statuspageio.batch import Batch
+from statuspageio.mirror import PageMirror
 import statuspageio.services
 
 
@@ -30,6 +34,14 @@ class Client(object):
         :param bool verbose: (optional) Verbose/debug mode. Default: ``False``.
         :param int timeout: (optional) Connection and response timeout. Default: **30** seconds.
         :param bool verify_ssl: (optional) Whether to verify ssl or not. Default: ``True``.
+        :param int pool_connections: (optional) Number of per-host connection pools to keep. Default: **10**.
+        :param int pool_maxsize: (optional) Maximum number of keep-alive connections per host. Default: **10**.
+        :param bool pool_block: (optional) Whether to block when a host pool is exhausted. Default: ``False``.
+        :param list before_request: (optional) Hooks called with a :class:`statuspageio.RequestEvent` before every request.
+        :param list after_request: (optional) Hooks called with the completed :class:`statuspageio.RequestEvent`.
+        :param :class:`statuspageio.StatsCollector` stats: (optional) Per-endpoint statistics, ``True`` for defaults.
+        :param profile: (optional) Phase by phase request timings, ``True`` or a callable receiving each :class:`statuspageio.Profile`.
+        :param float profile_sample_rate: (optional) Fraction of requests profiled. Default: **1**.
 
         :raises ConfigurationError: if no ``access_token`` provided.
         :raises ConfigurationError: if provided ``access_token`` is invalid - contains disallowed characters.
@@ -43,35 +55,112 @@ class Client(object):
         self.http_client = HttpClient(self.config)
         self.organization_id = self.config.organization_id
 
-        
-        self.__pages = statuspageio.services.PageService(self.http_client, self.config.page_id)
-        self.__components = statuspageio.services.ComponentsService(self.http_client, self.config.page_id)
-        self.__incidents = statuspageio.services.IncidentsService(self.http_client, self.config.page_id)
-        self.__subscribers = statuspageio.services.SubscribersService(self.http_client, self.config.page_id)
-        self.__metrics = statuspageio.services.MetricsService(self.http_client, self.config.page_id)
-        self.__users = statuspageio.services.UsersService(self.http_client,self.organization_id)
+        # services are built on first access, most programs only use one or two of them
+        self.__services = {}
+        self.__lock = threading.Lock()
+        self.__mirror = None
+        self.__mirror_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Release the pooled connections shared by every service of this client.
+        """
+
+        self.http_client.close()
+
+    def batch(self, max_workers=8):
+        """
+        Run service calls concurrently and collect per-call results.
+
+        Usage::
+
+          >>> with client.batch(max_workers=16) as batch:
+          ...     futures = [batch.subscribers.delete(subscriber_id) for subscriber_id in subscriber_ids]
+          >>> batch.results()
+          [<BatchResult value=200>, <BatchResult error=ResourceError(...)>, ...]
+
+        :param int max_workers: (optional) Maximum number of concurrent calls. Default: **8**.
+        :rtype: :class:`statuspageio.batch.Batch`
+        """
+
+        return Batch(self, max_workers=max_workers)
+
+    @property
+    def stats(self):
+        """
+        Request statistics, ``None`` unless the ``stats`` option is set.
+
+        :rtype: :class:`statuspageio.StatsCollector`
+        """
 
+        return self.http_client.stats
+
+    @property
+    def mirror(self):
+        """
+        In-memory state of the page, loaded on first access.
+
+        Components, incidents and custom metrics are listed once, then kept current from the
+        responses of the ``create``, ``update`` and ``delete`` calls of this client, so lookups
+        by id, name or ``group_id`` never reach the network.
+
+        Usage::
+
+          >>> client.mirror.components.find('EU API')
+          >>> client.mirror.components.in_group(group_id)
+
+        :rtype: :class:`statuspageio.PageMirror`
+        """
+
+        mirror = self.__mirror
+        if mirror is None:
+            with self.__mirror_lock:
+                mirror = self.__mirror
+                if mirror is None:
+                    mirror = PageMirror(self)
+                    # wired before the first listing, writes made while it loads are replayed over it
+                    self.components.mirror = mirror.components
+                    self.incidents.mirror = mirror.incidents
+                    self.metrics.mirror = mirror.metrics
+                    mirror.refresh()
+                    self.__mirror = mirror
+        return mirror
+
+    def __service(self, service_class, owner_id):
+        service = self.__services.get(service_class)
+        if service is None:
+            with self.__lock:
+                service = self.__services.get(service_class)
+                if service is None:
+                    service = self.__services[service_class] = service_class(self.http_client, owner_id)
+        return service
 
     @property
     def pages(self):
-        return self.__pages
-    
-    @property   
+        return self.__service(statuspageio.services.PageService, self.config.page_id)
+
+    @property
     def components(self):
-        return self.__components
-    
-    @property   
+        return self.__service(statuspageio.services.ComponentsService, self.config.page_id)
+
+    @property
     def incidents(self):
-        return self.__incidents
-    
+        return self.__service(statuspageio.services.IncidentsService, self.config.page_id)
+
     @property
     def subscribers(self):
-        return self.__subscribers
-        
+        return self.__service(statuspageio.services.SubscribersService, self.config.page_id)
+
     @property
     def metrics(self):
-        return self.__metrics
-    
+        return self.__service(statuspageio.services.MetricsService, self.config.page_id)
+
     @property
     def users(self):
-        return self.__users
\ No newline at end of file
+        return self.__service(statuspageio.services.UsersService, self.organization_id)
@@ -1,42 +1,135 @@
 from statuspageio.version import VERSION
 from statuspageio.errors import ConfigurationError
+from statuspageio.cache import ResponseCache
+from statuspageio.instrumentation import StatsCollector
+from statuspageio.profiling import Profiler
+from statuspageio.transports import TRANSPORTS
+from statuspageio.json_codec import CODECS
+from statuspageio.retry import RetryPolicy
 import warnings
 
 
 class Configuration(object):
 
+    """
+    Supported ways of returning json responses.
+    """
+    RESPONSE_MODELS = ('munch', 'model', 'raw')
+
+    """
+    Whether the missing ``organization_id`` warning was already emitted by this process.
+    """
+    _organization_id_warned = False
 
 
     def __init__(self, **options):
         """
         :param str api_key: Personal access token.
         :param str page_id:  The page_id you wish to manage
+        :param list page_ids: (optional) The page ids managed by a :class:`statuspageio.MultiPageClient`, instead of ``page_id``.
         :param str organization_id: (optional) The organization id, used for managing user accounts
+        :param str base_url: (optional) Base url for the api. Default: ``https://api.statuspage.io``.
         :param bool verbose: (optional) Verbose/debug mode. Default: ``False``.
         :param int timeout: (optional) Connection and response timeout. Default: **30** seconds.
         :param bool verify_ssl: (optional) Whether to verify ssl or not. Default: ``True``.
+        :param int pool_connections: (optional) Number of per-host connection pools to keep. Default: **10**.
+        :param int pool_maxsize: (optional) Maximum number of keep-alive connections per host. Default: **10**.
+        :param bool pool_block: (optional) Whether to block when a host pool has no free connection
+                                instead of opening a throwaway one. Default: ``False``.
+        :param float rate_limit: (optional) Requests per second the client paces itself to. Default: ``None`` - no pacing.
+        :param int rate_limit_burst: (optional) Requests allowed back to back before pacing kicks in. Default: **1**.
+        :param int rate_limit_retries: (optional) How many times a rate limited request is queued again
+                                       before :class:`RateLimitError` is raised. Default: **3**.
+        :param :class:`statuspageio.RetryPolicy` retry: (optional) Retry policy for transient failures,
+                                                        ``None`` disables retries. Default: ``RetryPolicy()`` -
+                                                        3 attempts of idempotent requests.
+        :param :class:`statuspageio.ResponseCache` cache: (optional) Cache of GET responses, ``True`` for a cache
+                                                          with default settings. Default: ``None`` - no caching.
+        :param str response_model: (optional) How json responses are returned: ``'munch'`` - recursively munchified,
+                                   ``'model'`` - compact :mod:`statuspageio.models` records decoded lazily,
+                                   ``'raw'`` - plain dictionaries and lists. Default: ``'munch'``.
+        :param list before_request: (optional) Callables called with a :class:`statuspageio.RequestEvent`
+                                    before every request is sent. Default: ``[]``.
+        :param list after_request: (optional) Callables called with the completed :class:`statuspageio.RequestEvent`
+                                   of every request, failed ones included. Default: ``[]``.
+        :param :class:`statuspageio.StatsCollector` stats: (optional) Collector of per-endpoint counters and
+                                                           latency histograms, ``True`` for one with default
+                                                           buckets. Default: ``None`` - no statistics.
+        :param profile: (optional) Record a phase by phase :class:`statuspageio.Profile` of requests: ``True`` to keep
+                        the last one per thread in ``http_client.last_profile``, a callable to also receive every
+                        profile. Default: ``None`` - no profiling.
+        :param float profile_sample_rate: (optional) Fraction of requests profiled. Default: **1**.
+        :param transport: (optional) How requests are sent: ``'requests'``, ``'urllib3'``, ``'httpx'`` (HTTP/2) or a
+                          :class:`statuspageio.transports.Transport` instance such as a
+                          :class:`statuspageio.FakeTransport`. Default: ``'requests'``.
+        :param json_codec: (optional) Json library encoding bodies and decoding responses: ``'json'``, ``'orjson'``,
+                           ``'ujson'``, ``'auto'`` for the fastest one installed, or a
+                           :class:`statuspageio.json_codec.JsonCodec` instance. Default: ``'auto'``.
         """
 
         self.api_key = options.get('api_key')
-        self.page_id = options['page_id']
+        self.page_id = options.get('page_id')
+        self.page_ids = list(options['page_ids']) if 'page_ids' in options else []
         self.organization_id = options['organization_id'] if 'organization_id' in options else False
-        self.base_url = 'https://api.statuspage.io'
+        self.base_url = options['base_url'] if 'base_url' in options else 'https://api.statuspage.io'
         self.user_agent = 'StatusPage/v1 Python/{0}'.format(VERSION)
         self.verbose = options['verbose'] if 'verbose' in options else False
         self.timeout = options['timeout'] if 'timeout' in options else 30
         self.verify_ssl = options['verify_ssl'] if 'verify_ssl' in options else True
+        self.pool_connections = options['pool_connections'] if 'pool_connections' in options else 10
+        self.pool_maxsize = options['pool_maxsize'] if 'pool_maxsize' in options else 10
+        self.pool_block = options['pool_block'] if 'pool_block' in options else False
+        self.rate_limit = options['rate_limit'] if 'rate_limit' in options else None
+        self.rate_limit_burst = options['rate_limit_burst'] if 'rate_limit_burst' in options else 1
+        self.rate_limit_retries = options['rate_limit_retries'] if 'rate_limit_retries' in options else 3
+        self.retry = options['retry'] if 'retry' in options else RetryPolicy()
+        self.cache = options['cache'] if 'cache' in options else None
+        if self.cache is True:
+            self.cache = ResponseCache()
+        elif self.cache is False:
+            self.cache = None
+        self.response_model = options['response_model'] if 'response_model' in options else 'munch'
+        self.before_request = options['before_request'] if 'before_request' in options else []
+        if callable(self.before_request):
+            self.before_request = [self.before_request]
+        self.after_request = options['after_request'] if 'after_request' in options else []
+        if callable(self.after_request):
+            self.after_request = [self.after_request]
+        self.stats = options['stats'] if 'stats' in options else None
+        if self.stats is True:
+            self.stats = StatsCollector()
+        elif self.stats is False:
+            self.stats = None
+        self.transport = options['transport'] if 'transport' in options else 'requests'
+        self.json_codec = options['json_codec'] if 'json_codec' in options else 'auto'
+        self.profile_sample_rate = options['profile_sample_rate'] if 'profile_sample_rate' in options else 1.0
+        self.profile = options['profile'] if 'profile' in options else None
+        if self.profile is True:
+            self.profile = Profiler(sample_rate=self.profile_sample_rate)
+        elif self.profile is False:
+            self.profile = None
+        elif self.profile is not None and not isinstance(self.profile, Profiler):
+            self.profile = Profiler(self.profile, sample_rate=self.profile_sample_rate)
         
 
         if self.verbose:
-            print "StatusPage client configuration: " + str(self.__dict__)
+            print("StatusPage client configuration: " + str(self.__dict__))
 
-    def validate(self):
+    def validate(self, page_required=True):
         """Validates whether a configuration is valid.
 
+        :param bool page_required: (optional) Whether ``page_id`` is mandatory, which is not the case for
+                                   a :class:`statuspageio.MultiPageClient`. Default: ``True``.
         :rtype: bool
         :raises ConfigurationError: if no ``api_key`` provided.
         :raises ConfigurationError: if no ``page_id`` provided.
-        :warns 'No organization_id provided.' if no ``organization_id`` provided
+        :raises ConfigurationError: if connection pool sizes are not positive integers.
+        :raises ConfigurationError: if ``rate_limit`` is not a positive number.
+        :raises ConfigurationError: if ``profile_sample_rate`` is not in ]0, 1].
+        :raises ConfigurationError: if ``transport`` is an unknown name.
+        :raises ConfigurationError: if ``json_codec`` is an unknown name.
+        :raises ConfigurationError: if ``response_model`` is unknown.
+        :warns 'No organization_id provided.' if no ``organization_id`` provided, once per process
         """
         if self.api_key is None:
             raise ConfigurationError('No api_key provided. '
@@ -45,12 +138,41 @@ class Configuration(object):
 
 
 
-        if not self.page_id:
+        if page_required and not self.page_id:
             raise ConfigurationError('No page_id provided.'
                                      'Set your page id during client initialization using: '
                                      '"statuspageiocrm.Client(page_id= <YOUR_PERSONAL_page_id>)"')
+
+        for option in ('pool_connections', 'pool_maxsize'):
+            value = getattr(self, option)
+            if not isinstance(value, int) or value < 1:
+                raise ConfigurationError('Provided {0} is invalid. '
+                                         'It must be a positive integer.'.format(option))
+
+        if self.rate_limit is not None and not self.rate_limit > 0:
+            raise ConfigurationError('Provided rate_limit is invalid. '
+                                     'It must be a positive number of requests per second.')
+
+        if not 0 < self.profile_sample_rate <= 1:
+            raise ConfigurationError('Provided profile_sample_rate is invalid. '
+                                     'It must be a fraction between 0 (excluded) and 1.')
+
+        if isinstance(self.transport, (str, type(u''))) and self.transport not in TRANSPORTS:
+            raise ConfigurationError('Provided transport is invalid. '
+                                     'It must be one of: {0}, or a Transport instance.'.format(
+                                         ', '.join(sorted(TRANSPORTS))))
+
+        if isinstance(self.json_codec, (str, type(u''))) and self.json_codec != 'auto' and self.json_codec not in CODECS:
+            raise ConfigurationError('Provided json_codec is invalid. '
+                                     'It must be one of: auto, {0}, or a JsonCodec instance.'.format(
+                                         ', '.join(sorted(CODECS))))
+
+        if self.response_model not in self.RESPONSE_MODELS:
+            raise ConfigurationError('Provided response_model is invalid. '
+                                     'It must be one of: {0}.'.format(', '.join(self.RESPONSE_MODELS)))
             
-        if not self.organization_id:
+        if not self.organization_id and not Configuration._organization_id_warned:
+            Configuration._organization_id_warned = True
             warnings.warn('No organization_id provided.'
                           'You will be unable to manage users. Set your organization_id during client initialization using: '
                           '"statuspageiocrm.Client(organization_id= <YOUR_PERSONAL_page_id>)"')
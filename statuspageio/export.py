@@ -0,0 +1,372 @@
+"""
+Streaming export of resources to CSV, JSON Lines or Parquet files.
+
+Resources are written in a single pass, so memory holds the current page of the api and, for Parquet,
+the current row group only. Writers which must see every resource to choose their columns or types
+spool them to a temporary file first.
+"""
+
+import io
+import json
+import numbers
+import sys
+import tempfile
+
+from statuspageio.bulk import BulkReport, format_of
+from statuspageio.errors import ConfigurationError
+from statuspageio.json_codec import StdlibCodec
+from statuspageio.models import Record
+from statuspageio.rate_limit import monotonic
+
+
+def plain(resource):
+    """
+    Json decoded dictionary behind a resource in any response model.
+
+    :rtype: dict
+    """
+
+    return resource.to_dict() if isinstance(resource, Record) else resource
+
+
+def flat(value):
+    """
+    Scalar value of a table cell: nested objects and lists are json encoded.
+    """
+
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+class Spool(object):
+    """
+    Temporary file holding resources as json lines, for writers which must see every resource before
+    writing the first one, while keeping a single resource in memory.
+    """
+
+    def __init__(self):
+        self.__file = tempfile.TemporaryFile()
+
+    def __iter__(self):
+        self.__file.seek(0)
+        for line in self.__file:
+            yield json.loads(line.decode('utf-8'))
+
+    def write(self, resource):
+        line = json.dumps(resource)
+        self.__file.write((line if isinstance(line, bytes) else line.encode('utf-8')) + b'\n')
+
+    def close(self):
+        self.__file.close()
+
+
+class ExportWriter(object):
+    """
+    Writes resources to a file, one at a time.
+    """
+
+    def write(self, resource):
+        """
+        :param dict resource: Json decoded resource.
+        """
+
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+
+class CsvWriter(ExportWriter):
+    """
+    One row per resource under a header line. Nested values are json encoded, booleans written
+    as ``true`` and ``false`` and missing values left empty.
+
+    Without ``columns`` the header lists every attribute found in any resource, in order of first
+    appearance, so resources are spooled to a temporary file and the CSV is written on :meth:`close`.
+    """
+
+    def __init__(self, path, columns=None, **options):
+        """
+        :param str path: Output file.
+        :param list columns: (optional) Columns of the file, other attributes are left out.
+                             Default: every attribute of the resources.
+        """
+
+        import csv
+        if sys.version_info[0] >= 3:
+            self.__output = io.open(path, 'w', encoding='utf-8', newline='')
+        else:
+            # the csv module of Python 2 writes utf-8 encoded byte strings
+            self.__output = open(path, 'wb')
+        self.__writer = csv.writer(self.__output)
+        self.columns = None
+        self.__spool = None
+        if columns is not None:
+            self.__header(columns)
+        else:
+            self.__spool = Spool()
+            self.__found = []
+            self.__known = set()
+
+    def write(self, resource):
+        if self.__spool is None:
+            self.__row(resource)
+            return
+
+        for column in resource:
+            if column not in self.__known:
+                self.__known.add(column)
+                self.__found.append(column)
+        self.__spool.write(resource)
+
+    def close(self):
+        try:
+            if self.__spool is not None:
+                self.__header(self.__found)
+                for resource in self.__spool:
+                    self.__row(resource)
+        finally:
+            if self.__spool is not None:
+                self.__spool.close()
+            self.__output.close()
+
+    def __header(self, columns):
+        self.columns = list(columns)
+        self.__writer.writerow([self.__cell(column) for column in self.columns])
+
+    def __row(self, resource):
+        self.__writer.writerow([self.__cell(resource.get(column)) for column in self.columns])
+
+    def __cell(self, value):
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        value = flat(value)
+        if sys.version_info[0] < 3 and isinstance(value, type(u'')):
+            return value.encode('utf-8')
+        return value
+
+
+class JsonlWriter(ExportWriter):
+    """
+    One json object per line, as received from the api.
+    """
+
+    def __init__(self, path, codec=None, **options):
+        """
+        :param str path: Output file.
+        :param :class:`statuspageio.JsonCodec` codec: (optional) Json encoder. Default: the standard library.
+        """
+
+        self.__output = open(path, 'wb')
+        self.__dumps = (codec if codec is not None else StdlibCodec()).dumps
+
+    def write(self, resource):
+        line = self.__dumps(resource)
+        if not isinstance(line, bytes):
+            line = line.encode('utf-8')
+        self.__output.write(line + b'\n')
+
+    def close(self):
+        self.__output.close()
+
+
+class ParquetWriter(ExportWriter):
+    """
+    Columnar Parquet file written with :mod:`pyarrow`, one row group per ``batch_size`` resources.
+    Nested values are json encoded.
+
+    With a ``schema`` resources are written as they come, and a value not matching the type of its
+    column fails the export. Otherwise resources are spooled to a temporary file and the types are
+    chosen on :meth:`close`, from every value of each column: booleans, integers, floats when integers
+    and floats are mixed, and strings for anything else or for columns without any value.
+    """
+
+    def __init__(self, path, columns=None, schema=None, batch_size=10000, **options):
+        """
+        :param str path: Output file.
+        :param list columns: (optional) Columns of the file, other attributes are left out.
+                             Default: every attribute of the resources.
+        :param schema: (optional) A :class:`pyarrow.Schema`, or a list of ``(column, pyarrow type)`` pairs,
+                       setting the columns and their types. Default: inferred from the resources.
+        :param int batch_size: (optional) Resources per row group, held in memory. Default: **10000**.
+        :raises ConfigurationError: if pyarrow is not installed.
+        """
+
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ConfigurationError('pyarrow is required by the parquet export format. '
+                                     'Install it using: "pip install pyarrow"')
+        self.__pyarrow = pyarrow
+        self.path = path
+        self.batch_size = batch_size
+        self.__batch = []
+        self.__writer = None
+        self.__spool = None
+        if schema is not None:
+            self.schema = schema if isinstance(schema, pyarrow.Schema) else pyarrow.schema(schema)
+            self.columns = list(self.schema.names)
+        else:
+            self.schema = None
+            self.columns = list(columns) if columns is not None else []
+            self.__fixed = columns is not None
+            self.__kinds = dict((column, set()) for column in self.columns)
+            self.__spool = Spool()
+
+    def write(self, resource):
+        if self.__spool is None:
+            self.__append([flat(resource.get(column)) for column in self.columns])
+            return
+
+        row = {}
+        for column, value in resource.items():
+            if column not in self.__kinds:
+                if self.__fixed:
+                    continue
+                self.columns.append(column)
+                self.__kinds[column] = set()
+            value = flat(value)
+            if value is not None:
+                self.__kinds[column].add(self.__kind(value))
+            row[column] = value
+        self.__spool.write(row)
+
+    def close(self):
+        try:
+            if self.__spool is not None:
+                self.schema = self.__pyarrow.schema([(column, self.__type(self.__kinds[column]))
+                                                     for column in self.columns])
+                strings = [index for index, field in enumerate(self.schema)
+                           if self.__pyarrow.types.is_string(field.type)]
+                for row in self.__spool:
+                    values = [row.get(column) for column in self.columns]
+                    for index in strings:
+                        values[index] = self.__text(values[index])
+                    self.__append(values)
+            if self.__batch or self.__writer is None:
+                self.__flush()
+            self.__writer.close()
+        finally:
+            if self.__spool is not None:
+                self.__spool.close()
+
+    @staticmethod
+    def __kind(value):
+        if isinstance(value, bool):
+            return 'bool'
+        if isinstance(value, numbers.Integral):
+            return 'int'
+        if isinstance(value, numbers.Real):
+            return 'float'
+        return 'string'
+
+    def __type(self, kinds):
+        pyarrow = self.__pyarrow
+        if kinds == set(['bool']):
+            return pyarrow.bool_()
+        if kinds == set(['int']):
+            return pyarrow.int64()
+        if kinds and kinds <= set(['int', 'float']):
+            return pyarrow.float64()
+        return pyarrow.string()
+
+    @staticmethod
+    def __text(value):
+        if value is None or isinstance(value, type(u'')):
+            return value
+        if isinstance(value, bytes):
+            return value.decode('utf-8')
+        # numbers and booleans of a column of mixed types, written as in json
+        return type(u'')(json.dumps(value))
+
+    def __append(self, values):
+        self.__batch.append(values)
+        if len(self.__batch) >= self.batch_size:
+            self.__flush()
+
+    def __flush(self):
+        pyarrow = self.__pyarrow
+        if self.__writer is None:
+            self.__writer = pyarrow.parquet.ParquetWriter(self.path, self.schema)
+        values = [[row[index] for row in self.__batch] for index in range(len(self.columns))]
+        self.__batch = []
+        table = pyarrow.Table.from_arrays([pyarrow.array(column, type=field.type)
+                                           for column, field in zip(values, self.schema)], schema=self.schema)
+        self.__writer.write_table(table)
+
+
+"""
+Writers by format.
+"""
+WRITERS = {
+    'csv': CsvWriter,
+    'jsonl': JsonlWriter,
+    'parquet': ParquetWriter,
+}
+
+
+class ExportReport(BulkReport):
+    """
+    Outcome of an export, also handed to the ``progress`` callback while it runs.
+
+    :attribute str path: Output file.
+    :attribute int records: Resources written so far.
+    :attribute float elapsed: Seconds spent so far.
+    """
+
+    def __init__(self, path):
+        super(ExportReport, self).__init__()
+        self.path = path
+        self.records = 0
+
+    @property
+    def processed(self):
+        return self.records
+
+    def __repr__(self):
+        return '<ExportReport records={0} elapsed={1:.1f}s rate={2:.1f}/s>'.format(
+            self.records, self.elapsed, self.rate)
+
+
+def export_records(resources, path, format=None, progress=None, progress_every=1000, **options):
+    """
+    Write resources to a file in a single pass.
+
+    :param resources: Iterable of resources in any response model, e.g. a lazy ``iter_all`` generator.
+    :param str path: Output file.
+    :param str format: (optional) ``'csv'``, ``'jsonl'`` or ``'parquet'``. Default: guessed from the extension.
+    :param callable progress: (optional) Called with the :class:`ExportReport <ExportReport>` in progress
+                              every ``progress_every`` resources and at the end.
+    :param int progress_every: (optional) Resources between progress calls. Default: **1000**.
+    :param dict **options: Options of the writer: ``columns``, ``codec``, or ``schema`` and ``batch_size``.
+    :rtype: :class:`ExportReport <ExportReport>`
+    :raises ValueError: if the format is unknown.
+    :raises ConfigurationError: if the library of the format is not installed.
+    """
+
+    if format is None:
+        format = format_of(path)
+    if format not in WRITERS:
+        raise ValueError('Unknown format of {0}, expected one of: {1}.'.format(path, ', '.join(sorted(WRITERS))))
+
+    writer = WRITERS[format](path, **options)
+    report = ExportReport(path)
+    started = monotonic()
+    try:
+        for resource in resources:
+            writer.write(plain(resource))
+            report.records += 1
+            if progress is not None and report.records % progress_every == 0:
+                report.elapsed = monotonic() - started
+                progress(report)
+    finally:
+        writer.close()
+
+    report.elapsed = monotonic() - started
+    if progress is not None:
+        progress(report)
+    return report
@@ -0,0 +1,663 @@
+"""
+In-process stand-in for the StatusPage.io v1 API.
+
+:class:`FakeStatusPage` keeps pages, components, incidents, subscribers, metrics and users in memory
+and answers the requests every service sends, so automations can be tested and benchmarked at full
+speed through :class:`statuspageio.FakeTransport`, without network. Rate limiting (420) and server
+errors (5xx) can be injected at random or on demand, and every response can be delayed.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+
+
+class FakeError(Exception):
+
+    def __init__(self, status_code, message, headers=None):
+        super(FakeError, self).__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.headers = headers or {}
+
+
+def now():
+    return time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+
+
+class FakeStatusPage(object):
+    """
+    In-memory StatusPage.io backend.
+
+    Usage::
+
+      >>> backend = statuspageio.FakeStatusPage(latency=0.005, rate_limit_rate=0.01, error_rate=0.01, seed=1)
+      >>> client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+      ...                              transport=statuspageio.FakeTransport(backend))
+      >>> client.components.create(name='API')
+      >>> backend.inject(503, count=2)
+
+    Pages and organizations spring into existence on first use. Unknown routes answer 404, invalid
+    payloads 422 and, when ``api_key`` is set, requests with another key 401.
+
+    :attribute int request_count: Number of requests handled, injected failures included.
+    """
+
+    def __init__(self, api_key=None, latency=0.0, rate_limit_rate=0.0, error_rate=0.0,
+                 error_statuses=(500, 502, 503), retry_after=1, seed=None):
+        """
+        :param str api_key: (optional) Only accept requests with this api key. Default: any key.
+        :param latency: (optional) Seconds every response is delayed by, or a ``(min, max)`` tuple
+                        for a uniformly random delay. Default: **0**.
+        :param float rate_limit_rate: (optional) Fraction of requests answered with a 420. Default: **0**.
+        :param float error_rate: (optional) Fraction of requests answered with one of ``error_statuses``.
+                                 Default: **0**.
+        :param tuple error_statuses: (optional) Statuses of injected server errors. Default: **500, 502, 503**.
+        :param float retry_after: (optional) ``Retry-After`` seconds of rate limited responses. Default: **1**.
+        :param int seed: (optional) Seed of the generator deciding injected failures and latencies.
+        """
+
+        self.api_key = api_key
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self.request_count = 0
+
+        import random
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__injected = []
+        self.__sequence = 0
+        self.__pages = {}
+        self.__organizations = {}
+        self.__providers = [{'id': 'self', 'type': 'Self', 'disabled': False}]
+
+        self.routes = [(method, re.compile('^' + pattern + r'\.json$'), handler) for method, pattern, handler in (
+            ('GET', '/pages/([^/]+)', self.get_page),
+            ('PATCH', '/pages/([^/]+)', self.update_page),
+            ('GET', '/pages/([^/]+)/components', self.list_components),
+            ('POST', '/pages/([^/]+)/components', self.create_component),
+            ('PATCH', '/pages/([^/]+)/components/([^/]+)', self.update_component),
+            ('DELETE', '/pages/([^/]+)/components/([^/]+)', self.delete_component),
+            ('GET', '/pages/([^/]+)/incidents', self.list_incidents),
+            ('GET', '/pages/([^/]+)/incidents/unresolved', self.list_unresolved_incidents),
+            ('GET', '/pages/([^/]+)/incidents/scheduled', self.list_scheduled_incidents),
+            ('POST', '/pages/([^/]+)/incidents', self.create_incident),
+            ('PATCH', '/pages/([^/]+)/incidents/([^/]+)', self.update_incident),
+            ('DELETE', '/pages/([^/]+)/incidents/([^/]+)', self.delete_incident),
+            ('GET', '/pages/([^/]+)/subscribers', self.list_subscribers),
+            ('POST', '/pages/([^/]+)/subscribers', self.create_subscriber),
+            ('DELETE', '/pages/([^/]+)/subscribers/([^/]+)', self.delete_subscriber),
+            ('GET', '/metrics_providers', self.list_available_providers),
+            ('GET', '/pages/([^/]+)/metrics_providers', self.list_linked_providers),
+            ('GET', '/pages/([^/]+)/metrics_providers/([^/]+)/metrics', self.list_metrics),
+            ('POST', '/pages/([^/]+)/metrics_providers/([^/]+)/metrics', self.create_metric),
+            ('POST', '/pages/([^/]+)/metrics/data', self.submit_bulk_data),
+            ('POST', '/pages/([^/]+)/metrics/([^/]+)/data', self.submit_data),
+            ('DELETE', '/pages/([^/]+)/metrics/([^/]+)/data', self.delete_data),
+            ('DELETE', '/pages/([^/]+)/metrics/([^/]+)', self.delete_metric),
+            ('GET', '/organizations/([^/]+)/users', self.list_users),
+            ('POST', '/organizations/([^/]+)/users', self.create_user),
+            ('DELETE', '/organizations/([^/]+)/users/([^/]+)', self.delete_user),
+        )]
+
+    def inject(self, status_code, count=1, retry_after=None):
+        """
+        Answer the next ``count`` requests with ``status_code``, whatever they are.
+
+        :param int status_code: Status of the injected responses, e.g. 420 or 503.
+        :param int count: (optional) Number of requests to fail. Default: **1**.
+        :param float retry_after: (optional) ``Retry-After`` header of the injected responses.
+        """
+
+        with self.__lock:
+            self.__injected.extend([(status_code, retry_after)] * count)
+
+    def page(self, page_id):
+        """
+        State of a page: ``page``, ``components``, ``incidents``, ``subscribers``, ``metrics`` and ``data``
+        dictionaries, keyed by id.
+
+        :rtype: dict
+        """
+
+        with self.__lock:
+            return self.__page(page_id)
+
+    def users(self, organization_id):
+        """
+        Users of an organization, keyed by id.
+
+        :rtype: dict
+        """
+
+        with self.__lock:
+            return self.__organizations.setdefault(organization_id, {})
+
+    def handle(self, method, path, params, body, headers):
+        """
+        Answer a request.
+
+        :param str method: Http method, upper case.
+        :param str path: Url path, with or without the ``/v1`` prefix.
+        :param dict params: Query parameters.
+        :param str body: Json encoded request body or ``None``.
+        :param dict headers: Request headers.
+        :return: Tuple of ``(status_code, headers, content)``.
+        :rtype: tuple
+        """
+
+        with self.__lock:
+            self.request_count += 1
+            delay = self.__delay()
+            failure = self.__failure()
+
+        if delay:
+            time.sleep(delay)
+
+        try:
+            if failure is not None:
+                raise failure
+            self.__authenticate(headers)
+            status_code, payload = self.__route(method, path[3:] if path.startswith('/v1/') else path,
+                                                params, body)
+        except FakeError as e:
+            return e.status_code, dict(e.headers, **{'Content-Type': 'application/json'}), \
+                json.dumps({'error': e.message}).encode('utf-8')
+
+        if payload is None:
+            return status_code, {}, b''
+        return status_code, {'Content-Type': 'application/json; charset=utf-8'}, json.dumps(payload).encode('utf-8')
+
+    def __delay(self):
+        if isinstance(self.latency, (tuple, list)):
+            return self.__random.uniform(*self.latency)
+        return self.latency
+
+    def __failure(self):
+        if self.__injected:
+            status_code, retry_after = self.__injected.pop(0)
+            return self.__error(status_code, retry_after)
+        if self.rate_limit_rate and self.__random.random() < self.rate_limit_rate:
+            return self.__error(420, self.retry_after)
+        if self.error_rate and self.__random.random() < self.error_rate:
+            return self.__error(self.__random.choice(self.error_statuses))
+        return None
+
+    def __error(self, status_code, retry_after=None):
+        headers = {} if retry_after is None else {'Retry-After': str(retry_after)}
+        message = 'Rate limit exceeded' if status_code in (420, 429) else 'Injected failure'
+        return FakeError(status_code, message, headers)
+
+    def __authenticate(self, headers):
+        if self.api_key is None:
+            return
+        authorization = dict((key.lower(), value) for key, value in headers.items()).get('authorization')
+        if authorization != 'OAuth ' + self.api_key:
+            raise FakeError(401, 'Unauthorized')
+
+    def __route(self, method, path, params, body):
+        allowed = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+
+            attributes = {}
+            if body:
+                try:
+                    attributes = json.loads(body if isinstance(body, str) else body.decode('utf-8'))
+                except ValueError:
+                    raise FakeError(400, 'Invalid json body')
+            with self.__lock:
+                return handler(params, attributes, *match.groups())
+
+        raise FakeError(405 if allowed else 404, 'Method not allowed' if allowed else 'Not found')
+
+    def __identifier(self):
+        self.__sequence += 1
+        return '{0:012x}'.format(self.__sequence)
+
+    def __page(self, page_id):
+        page = self.__pages.get(page_id)
+        if page is None:
+            page = self.__pages[page_id] = {
+                'page': {'id': page_id, 'name': page_id, 'url': None, 'time_zone': 'UTC',
+                         'created_at': now(), 'updated_at': now()},
+                'components': {}, 'incidents': {}, 'subscribers': {}, 'metrics': {}, 'data': {},
+            }
+        return page
+
+    def __found(self, resources, resource_id):
+        if resource_id not in resources:
+            raise FakeError(404, 'Not found')
+        return resources[resource_id]
+
+    @staticmethod
+    def __unwrap(attributes, container):
+        return attributes[container] if isinstance(attributes.get(container), dict) else attributes
+
+    @staticmethod
+    def __paginate(resources, params):
+        if 'page' not in params:
+            return resources
+        per_page = int(params.get('per_page', 100))
+        start = (int(params['page']) - 1) * per_page
+        return resources[start:start + per_page]
+
+    # Pages
+
+    def get_page(self, params, attributes, page_id):
+        return 200, self.__page(page_id)['page']
+
+    def update_page(self, params, attributes, page_id):
+        page = self.__page(page_id)['page']
+        page.update(self.__unwrap(attributes, 'page'), updated_at=now())
+        return 200, page
+
+    # Components
+
+    def list_components(self, params, attributes, page_id):
+        components = sorted(self.__page(page_id)['components'].values(), key=lambda component: component['position'])
+        return 200, components
+
+    def create_component(self, params, attributes, page_id):
+        attributes = self.__unwrap(attributes, 'component')
+        if not attributes.get('name'):
+            raise FakeError(422, ['Name can\'t be blank'])
+        components = self.__page(page_id)['components']
+        component = {'id': self.__identifier(), 'page_id': page_id, 'group_id': None, 'description': None,
+                     'status': 'operational', 'position': len(components) + 1, 'showcase': True,
+                     'created_at': now(), 'updated_at': now()}
+        component.update(attributes)
+        components[component['id']] = component
+        return 201, component
+
+    def update_component(self, params, attributes, page_id, component_id):
+        component = self.__found(self.__page(page_id)['components'], component_id)
+        component.update(self.__unwrap(attributes, 'component'), updated_at=now())
+        return 200, component
+
+    def delete_component(self, params, attributes, page_id, component_id):
+        self.__found(self.__page(page_id)['components'], component_id)
+        del self.__page(page_id)['components'][component_id]
+        return 204, None
+
+    # Incidents
+
+    def list_incidents(self, params, attributes, page_id):
+        incidents = sorted(self.__page(page_id)['incidents'].values(),
+                           key=lambda incident: incident['created_at'], reverse=True)
+        return 200, self.__paginate(incidents, params)
+
+    def list_unresolved_incidents(self, params, attributes, page_id):
+        return 200, [incident for incident in self.list_incidents({}, {}, page_id)[1]
+                     if incident['scheduled_for'] is None and incident['status'] != 'resolved']
+
+    def list_scheduled_incidents(self, params, attributes, page_id):
+        return 200, [incident for incident in self.list_incidents({}, {}, page_id)[1]
+                     if incident['scheduled_for'] is not None and incident['status'] != 'completed']
+
+    def create_incident(self, params, attributes, page_id):
+        attributes = self.__unwrap(attributes, 'incident')
+        if not attributes.get('name'):
+            raise FakeError(422, ['Name can\'t be blank'])
+        scheduled = attributes.get('scheduled_for') is not None
+        incident = {'id': self.__identifier(), 'page_id': page_id, 'impact': 'none',
+                    'status': 'scheduled' if scheduled else 'investigating',
+                    'scheduled_for': None, 'scheduled_until': None, 'resolved_at': None,
+                    'incident_updates': [], 'components': [], 'created_at': now(), 'updated_at': now()}
+        self.__apply_incident(page_id, incident, attributes)
+        self.__page(page_id)['incidents'][incident['id']] = incident
+        return 201, incident
+
+    def update_incident(self, params, attributes, page_id, incident_id):
+        incident = self.__found(self.__page(page_id)['incidents'], incident_id)
+        self.__apply_incident(page_id, incident, self.__unwrap(attributes, 'incident'))
+        return 200, incident
+
+    def __apply_incident(self, page_id, incident, attributes):
+        message = attributes.pop('message', None)
+        component_ids = attributes.pop('component_ids', None)
+        attributes.pop('wants_twitter_update', None)
+        if 'impact_override' in attributes:
+            attributes['impact'] = attributes.pop('impact_override')
+        incident.update(attributes, updated_at=now())
+
+        if component_ids is not None:
+            components = self.__page(page_id)['components']
+            incident['components'] = [dict(components[component_id]) for component_id in component_ids
+                                      if component_id in components]
+        if incident['status'] == 'resolved' and incident['resolved_at'] is None:
+            incident['resolved_at'] = now()
+        incident['incident_updates'].insert(0, {
+            'id': self.__identifier(), 'incident_id': incident['id'], 'status': incident['status'],
+            'body': message, 'created_at': now(), 'updated_at': now(), 'display_at': now()})
+
+    def delete_incident(self, params, attributes, page_id, incident_id):
+        incident = self.__found(self.__page(page_id)['incidents'], incident_id)
+        del self.__page(page_id)['incidents'][incident_id]
+        return 200, incident
+
+    # Subscribers
+
+    def list_subscribers(self, params, attributes, page_id):
+        subscribers = sorted(self.__page(page_id)['subscribers'].values(), key=lambda subscriber: subscriber['id'])
+        return 200, self.__paginate(subscribers, params)
+
+    def create_subscriber(self, params, attributes, page_id):
+        attributes = self.__unwrap(attributes, 'subscriber')
+        if not (attributes.get('email') or attributes.get('phone_number') or attributes.get('endpoint')):
+            raise FakeError(422, ['Email, phone number or endpoint is required'])
+        subscribers = self.__page(page_id)['subscribers']
+        email = attributes.get('email')
+        if email and any(subscriber.get('email') == email for subscriber in subscribers.values()):
+            raise FakeError(422, ['Email has already been taken'])
+        subscriber = {'id': self.__identifier(), 'email': None, 'phone_number': None, 'phone_country': None,
+                      'endpoint': None, 'mode': 'email', 'quarantined_at': None, 'created_at': now()}
+        subscriber.update(attributes)
+        subscribers[subscriber['id']] = subscriber
+        return 201, subscriber
+
+    def delete_subscriber(self, params, attributes, page_id, subscriber_id):
+        subscriber = self.__found(self.__page(page_id)['subscribers'], subscriber_id)
+        del self.__page(page_id)['subscribers'][subscriber_id]
+        return 200, subscriber
+
+    # Metrics
+
+    def list_available_providers(self, params, attributes):
+        return 200, list(self.__providers)
+
+    def list_linked_providers(self, params, attributes, page_id):
+        return 200, list(self.__providers)
+
+    def list_metrics(self, params, attributes, page_id, provider_id):
+        return 200, [metric for metric in self.__page(page_id)['metrics'].values()
+                     if metric['metrics_provider_id'] == provider_id]
+
+    def create_metric(self, params, attributes, page_id, provider_id):
+        attributes = self.__unwrap(attributes, 'metric')
+        if not attributes.get('name'):
+            raise FakeError(422, ['Name can\'t be blank'])
+        metric = {'id': self.__identifier(), 'metrics_provider_id': provider_id, 'display': True,
+                  'created_at': now(), 'updated_at': now()}
+        metric.update(attributes)
+        self.__page(page_id)['metrics'][metric['id']] = metric
+        return 201, metric
+
+    def submit_data(self, params, attributes, page_id, metric_id):
+        point = self.__unwrap(attributes, 'data')
+        self.__found(self.__page(page_id)['metrics'], metric_id)
+        self.__page(page_id)['data'].setdefault(metric_id, []).append(point)
+        return 201, point
+
+    def submit_bulk_data(self, params, attributes, page_id):
+        data = attributes.get('data', {})
+        page = self.__page(page_id)
+        unknown = [metric_id for metric_id in data if metric_id not in page['metrics']]
+        if unknown:
+            raise FakeError(422, ['Unknown metrics: ' + ', '.join(sorted(unknown))])
+        for metric_id, points in data.items():
+            page['data'].setdefault(metric_id, []).extend(points)
+        return 201, data
+
+    def delete_data(self, params, attributes, page_id, metric_id):
+        self.__found(self.__page(page_id)['metrics'], metric_id)
+        self.__page(page_id)['data'].pop(metric_id, None)
+        return 204, None
+
+    def delete_metric(self, params, attributes, page_id, metric_id):
+        metric = self.__found(self.__page(page_id)['metrics'], metric_id)
+        del self.__page(page_id)['metrics'][metric_id]
+        self.__page(page_id)['data'].pop(metric_id, None)
+        return 200, metric
+
+    # Users
+
+    def list_users(self, params, attributes, organization_id):
+        users = sorted(self.__organizations.setdefault(organization_id, {}).values(), key=lambda user: user['id'])
+        return 200, self.__paginate(users, params)
+
+    def create_user(self, params, attributes, organization_id):
+        attributes = self.__unwrap(attributes, 'user')
+        if not attributes.get('email'):
+            raise FakeError(422, ['Email can\'t be blank'])
+        attributes.pop('password', None)
+        user = {'id': self.__identifier(), 'organization_id': organization_id, 'first_name': None,
+                'last_name': None, 'created_at': now(), 'updated_at': now()}
+        user.update(attributes)
+        self.__organizations.setdefault(organization_id, {})[user['id']] = user
+        return 201, user
+
+    def delete_user(self, params, attributes, organization_id, user_id):
+        users = self.__organizations.setdefault(organization_id, {})
+        user = self.__found(users, user_id)
+        del users[user_id]
+        return 200, user
+
+
+class FakeServer(object):
+    """
+    Serves a :class:`FakeStatusPage <FakeStatusPage>` over http on a local port, for load tests and
+    programs which can't use :class:`statuspageio.FakeTransport`, such as other processes.
+
+    With ``http2=True`` it speaks cleartext HTTP/2 with prior knowledge (h2c) instead of HTTP/1.1,
+    answering the streams of a connection concurrently, as the ``httpx`` transport expects.
+
+    Usage::
+
+      >>> with statuspageio.FakeServer(statuspageio.FakeStatusPage()) as server:
+      ...     client = statuspageio.Client(api_key='key', page_id='page', base_url=server.url)
+      ...     client.components.list()
+    """
+
+    def __init__(self, backend=None, host='127.0.0.1', port=0, http2=False):
+        """
+        :param :class:`FakeStatusPage` backend: (optional) Backend answering the requests. Default: a new one.
+        :param str host: (optional) Interface to listen on. Default: ``127.0.0.1``.
+        :param int port: (optional) Port to listen on, ``0`` picks a free one. Default: **0**.
+        :param bool http2: (optional) Speak h2c instead of HTTP/1.1, requires :mod:`h2`. Default: **False**.
+        """
+
+        self.backend = backend if backend is not None else FakeStatusPage()
+        self.host = host
+        self.port = port
+        self.http2 = http2
+        self.server = None
+        self.__thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self):
+        """
+        Base url to configure clients with.
+
+        :rtype: str
+        """
+
+        return 'http://{0}:{1}'.format(self.host, self.port)
+
+    def start(self):
+        """
+        Start serving from a background thread.
+
+        :rtype: :class:`FakeServer <FakeServer>`
+        """
+
+        try:
+            from http.server import HTTPServer
+            from socketserver import ThreadingMixIn
+        except ImportError:
+            # Python 2
+            from BaseHTTPServer import HTTPServer
+            from SocketServer import ThreadingMixIn
+
+        class Server(ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+            def handle_error(self, request, client_address):
+                # clients closing connections early, e.g. when they stop reading a streamed response
+                if not isinstance(sys.exc_info()[1], IOError):
+                    HTTPServer.handle_error(self, request, client_address)
+
+        handler = self.__http2_handler() if self.http2 else self.__http1_handler()
+        self.server = Server((self.host, self.port), handler)
+        self.port = self.server.server_address[1]
+        self.__thread = threading.Thread(target=self.server.serve_forever, name='statuspageio-fake-server')
+        self.__thread.daemon = True
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the listening socket.
+        """
+
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.__thread.join()
+            self.server = None
+
+    def __handle(self, method, url, headers, body):
+        try:
+            from urllib.parse import parse_qsl, urlsplit
+        except ImportError:
+            # Python 2
+            from urlparse import parse_qsl, urlsplit
+
+        url = urlsplit(url)
+        return self.backend.handle(method, url.path, dict(parse_qsl(url.query)), body, headers)
+
+    def __http1_handler(self):
+        try:
+            from http.server import BaseHTTPRequestHandler
+        except ImportError:
+            # Python 2
+            from BaseHTTPServer import BaseHTTPRequestHandler
+
+        handle = self.__handle
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # headers and content go out in separate writes, don't wait for delayed acks between them
+            disable_nagle_algorithm = True
+
+            def handle_request(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode('utf-8') if length else None
+                status_code, headers, content = handle(self.command, self.path, dict(self.headers.items()), body)
+                self.send_response(status_code)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = handle_request
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __http2_handler(self):
+        try:
+            from socketserver import BaseRequestHandler
+        except ImportError:
+            # Python 2
+            from SocketServer import BaseRequestHandler
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+
+        handle = self.__handle
+
+        class Handler(BaseRequestHandler):
+
+            def setup(self):
+                self.connection = h2.connection.H2Connection(
+                    h2.config.H2Configuration(client_side=False, header_encoding='utf-8'))
+                # guards the connection state and the socket, shared by the stream threads
+                self.condition = threading.Condition()
+                self.streams = {}
+                self.closed = False
+
+            def handle(self):
+                with self.condition:
+                    self.connection.initiate_connection()
+                    self.request.sendall(self.connection.data_to_send())
+
+                try:
+                    while True:
+                        data = self.request.recv(65536)
+                        if not data:
+                            break
+                        with self.condition:
+                            for event in self.connection.receive_data(data):
+                                self.dispatch(event)
+                            self.request.sendall(self.connection.data_to_send())
+                            self.condition.notify_all()
+                finally:
+                    # release the stream threads waiting for a window update which will never come
+                    with self.condition:
+                        self.closed = True
+                        self.condition.notify_all()
+
+            def dispatch(self, event):
+                if isinstance(event, h2.events.RequestReceived):
+                    self.streams[event.stream_id] = (dict(event.headers), [])
+                elif isinstance(event, h2.events.DataReceived):
+                    self.streams[event.stream_id][1].append(event.data)
+                    self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, chunks = self.streams.pop(event.stream_id)
+                    thread = threading.Thread(target=self.respond, args=(event.stream_id, headers, chunks))
+                    thread.daemon = True
+                    thread.start()
+                elif isinstance(event, h2.events.StreamReset):
+                    self.streams.pop(event.stream_id, None)
+
+            def respond(self, stream_id, headers, chunks):
+                body = b''.join(chunks).decode('utf-8') or None
+                status_code, response_headers, content = handle(headers.pop(':method'), headers.pop(':path'),
+                                                                headers, body)
+                response_headers = [(':status', str(status_code)), ('content-length', str(len(content)))] + \
+                    [(key.lower(), value) for key, value in response_headers.items()]
+
+                try:
+                    with self.condition:
+                        self.connection.send_headers(stream_id, response_headers, end_stream=not content)
+                        while content:
+                            if self.closed:
+                                return
+                            window = min(self.connection.local_flow_control_window(stream_id),
+                                         self.connection.max_outbound_frame_size)
+                            if window <= 0:
+                                # flush what the window allowed, the client acknowledges it with an update
+                                self.request.sendall(self.connection.data_to_send())
+                                self.condition.wait(1.0)
+                                continue
+                            self.connection.send_data(stream_id, content[:window], end_stream=len(content) <= window)
+                            content = content[window:]
+                        self.request.sendall(self.connection.data_to_send())
+                except (h2.exceptions.StreamClosedError, IOError):
+                    # reset by the client, or the connection is gone
+                    pass
+
+        return Handler
@@ -1,14 +1,23 @@
-import requests
-import json
-
-from munch import munchify
+import threading
+import time
 
+from statuspageio import models
 from statuspageio.errors import RateLimitError, RequestError, ResourceError, ServerError
+from statuspageio.instrumentation import RequestEvent
+from statuspageio.json_codec import build_codec
+from statuspageio.rate_limit import RATE_LIMIT_STATUSES, TokenBucket, monotonic, retry_after
+from statuspageio.retry import Attempt, RetryPolicy
+from statuspageio.streaming import JsonArrayParser
+from statuspageio.transports import build_transport
 
 
-class HttpClient(object):
+class BaseHttpClient(object):
     """
-    Wrapper over :module:`requests` that understands StatusPage.io envelope, encoding and decoding schema.
+    Transport agnostic part of the http client: url building, StatusPage.io envelope,
+    encoding and decoding schema and mapping of error responses to exceptions.
+
+    Shared by the blocking :class:`HttpClient <HttpClient>` and the asyncio based
+    :class:`AsyncHttpClient <statuspageio.aio.AsyncHttpClient>`.
     """
 
     """
@@ -22,16 +31,326 @@ class HttpClient(object):
         """
 
         self.config = config
+        self.stats = config.stats
+        self.before_request = list(config.before_request)
+        self.after_request = list(config.after_request)
+        if self.stats is not None:
+            self.after_request.append(self.stats.record)
+        self.__codec = None
+
+    @property
+    def codec(self):
+        """
+        Json codec of the ``json_codec`` option, resolved on first use.
+
+        :rtype: :class:`statuspageio.json_codec.JsonCodec`
+        """
+
+        if self.__codec is None:
+            self.__codec = build_codec(self.config.json_codec)
+        return self.__codec
+
+    def build_url(self, url):
+        """
+        Prefix a sub URL with base url and api version.
+
+        :param str url: Sub URL for the request.
+        :rtype: str
+        """
+
+        return "{base_url}{version}{resource}".format(base_url=self.config.base_url,
+                                                      version=self.API_VERSION,
+                                                      resource=url)
+
+    def build_headers(self, **kwargs):
+        """
+        Build request headers, merging in user supplied ``headers`` keyword argument.
+
+        :rtype: dict
+        """
+
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": "OAuth " + self.config.api_key
+        }
+
+        if 'headers' in kwargs and isinstance(kwargs['headers'], dict):
+            headers.update(kwargs['headers'])
+
+        return headers
+
+    def encode_body(self, body, headers, **kwargs):
+        """
+        Wrap the body with envelope (unless ``raw``) and json encode it.
+
+        :param dict body: Dictionary of body attributes.
+        :param dict headers: Request headers, ``Content-Type`` is updated in place.
+        :return: Json encoded body or ``None`` when there is no body.
+        :rtype: str or bytes
+        """
+
+        if body is None:
+            return None
+
+        raw = bool(kwargs['raw']) if 'raw' in kwargs else False
+        headers['Content-Type'] = 'application/json'
+        payload = body if raw else self.wrap_envelope(kwargs['container'], body)
+        return self.codec.dumps(payload)
+
+    def decode_body(self, headers, content, path=None, profile=None, **kwargs):
+        """
+        Json decode the response content if the media type represents json,
+        unwrap the envelope (unless ``raw``) and wrap what has left according to
+        the configured ``response_model``: munchified for JavaScript like access,
+        compact :mod:`statuspageio.models` records, or plain dictionaries.
+
+        :param headers: Response headers (case insensitive mapping).
+        :param bytes content: Raw response content.
+        :param str path: (optional) Sub URL of the request, selects the record class in ``model`` mode.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile the ``parse`` and ``build`` phases are recorded in.
+        :return: Decoded json or plain content.
+        """
+
+        raw = bool(kwargs['raw']) if 'raw' in kwargs else False
+
+        if not (content and 'Content-Type' in headers and 'json' in headers['Content-Type']):
+            return content
+
+        if profile is None:
+            return self.build_body(self.codec.loads(content), path, raw)
+
+        started = monotonic()
+        payload = self.codec.loads(content)
+        parsed = monotonic()
+        body = self.build_body(payload, path, raw)
+        profile.add('parse', parsed - started)
+        profile.add('build', monotonic() - parsed)
+        return body
+
+    def build_body(self, payload, path=None, raw=False):
+        """
+        Wrap a json decoded payload according to the configured ``response_model``.
+
+        :param payload: Json decoded response.
+        :param str path: (optional) Sub URL of the request, selects the record class in ``model`` mode.
+        :param bool raw: (optional) Whether to keep the envelope. Default: ``False``.
+        """
+
+        if self.config.response_model == 'munch':
+            from munch import munchify
+            return munchify(payload) if raw else self.unwrap_envelope(payload)
+
+        if not raw and isinstance(payload, dict) and 'items' in payload:
+            payload = payload['items']
+        if self.config.response_model == 'raw':
+            return payload
+        return models.decode(payload, models.model_for(path or ''))
+
+    def start_event(self, method, path, body):
+        """
+        Build the :class:`RequestEvent <statuspageio.RequestEvent>` of a request and run the
+        ``before_request`` hooks.
+
+        :param str method: Http method.
+        :param str path: Sub URL of the request.
+        :param str body: Encoded request body or ``None``.
+        :return: The event, or ``None`` when no hook is registered and instrumentation is skipped.
+        :rtype: :class:`statuspageio.RequestEvent`
+        """
+
+        if not (self.before_request or self.after_request):
+            return None
+
+        event = RequestEvent(method, path, len(body) if body else 0)
+        for hook in self.before_request:
+            hook(event)
+        return event
+
+    def finish_event(self, event, error=None):
+        """
+        Complete a :class:`RequestEvent <statuspageio.RequestEvent>` and run the ``after_request`` hooks.
+
+        :param :class:`statuspageio.RequestEvent` event: Event returned by :meth:`start_event`.
+        :param Exception error: (optional) Exception raised by the request.
+        """
+
+        event.elapsed = monotonic() - event.started
+        event.error = error
+        for hook in self.after_request:
+            hook(event)
+
+    def serve_cached(self, entry, path, event=None, profile=None, revalidated=False, **kwargs):
+        """
+        Answer a request from the response cache.
+
+        :param :class:`statuspageio.cache.CacheEntry` entry: Cached response.
+        :param str path: Sub URL of the request.
+        :param :class:`statuspageio.RequestEvent` event: (optional) Event of the request, marked as cached.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile of the request, marked as cached.
+        :param bool revalidated: (optional) Whether the server answered 304 Not Modified, rather than the entry
+                                 being fresh and no request sent. Default: ``False``.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        if event is not None:
+            if not revalidated:
+                event.status_code, event.response_bytes = entry.status_code, len(entry.content)
+            event.cached = True
+        if profile is not None:
+            if not revalidated:
+                profile.response_bytes = len(entry.content)
+            profile.cached = True
+        return (entry.status_code, entry.headers,
+                self.decode_body(entry.headers, entry.content, path=path, profile=profile, **kwargs))
+
+    def raise_for_error(self, status_code, content):
+        """
+        Raise the exception matching an error response.
+
+        :param int status_code: Http status code.
+        :param bytes content: Raw response content, expected to be json.
+        :raises RequestError: if authentication failed, invalid query parameter etc.
+        :raises RateLimitError: if rate limit exceeded.
+        :raises ResourceError: if requests payload included invalid attributes or were missing.
+        :raises ServerError: if StatusPage.io backend servers encounterered an unexpected condition.
+        """
+
+        try:
+            errors = self.codec.loads(content)
+        except:
+            raise Exception('Unknown HTTP error response. Json expected. '
+                            'HTTP response code={0}. '
+                            'HTTP response body={1}'.format(status_code,
+                                                            content.decode('utf-8', 'replace')))
+        if status_code == 422:
+            raise ResourceError(status_code, errors)
+        elif status_code == 420:
+            raise RateLimitError()
+        elif 400 <= status_code < 500:
+            raise RequestError(status_code, errors)
+        elif 500 <= status_code < 600:
+            raise ServerError(status_code, errors)
+        else:
+            raise Exception('Unknown HTTP error response')
+
+    @staticmethod
+    def wrap_envelope(container, body):
+        """ Wrap the body with the correct container to match the API """
+        return {container : body}
+
+    @staticmethod
+    def unwrap_envelope(body):
+        from munch import munchify
+        # lists are searched item by item by ``in``, only objects can be an envelope
+        if isinstance(body, dict) and 'items' in body:
+            return [munchify(item) for item in body['items']]
+        return munchify(body)
+
+    def enable_logging(self):
+        import logging
+        try:
+            import http.client as http_client
+        except ImportError:
+            # Python 2
+            import httplib as http_client
+        http_client.HTTPConnection.debuglevel = 1
+
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.DEBUG)
+        requests_log = logging.getLogger("requests.packages.urllib3")
+        requests_log.setLevel(logging.DEBUG)
+        requests_log.propagate = True
+
+
+class HttpClient(BaseHttpClient):
+    """
+    Blocking http client that understands StatusPage.io envelope, encoding and decoding schema.
+
+    Requests go through a pluggable :class:`Transport <statuspageio.transports.Transport>` selected by the
+    ``transport`` option: a pooled :class:`requests.Session` by default, :mod:`urllib3` directly, or an
+    in-process fake backend. The transport is kept for the lifetime of the client, so keep-alive
+    connections to the API are reused by every service sharing this instance.
+    Call :meth:`close` (or use the client as a context manager) to release the pooled connections.
+
+    When ``rate_limit`` is configured, requests from every thread are paced by a shared
+    :class:`TokenBucket <statuspageio.rate_limit.TokenBucket>`. ``Retry-After`` and rate limit headers
+    pause the bucket, and rate limited requests are queued again instead of failing straight away.
+
+    Transient failures - statuses of the configured :class:`RetryPolicy <statuspageio.RetryPolicy>` and
+    transport errors - are retried with jittered exponential backoff. Timings of every attempt of the
+    last request made by the current thread are available through :attr:`last_attempts`.
+
+    With a :class:`ResponseCache <statuspageio.ResponseCache>` configured, GET responses are served
+    from memory while fresh, revalidated with conditional requests once stale, and invalidated by writes.
+    """
+
+    def __init__(self, config):
+        """
+        :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+        """
+
+        super(HttpClient, self).__init__(config)
+        self.__transport = None
+        self.__transport_lock = threading.Lock()
+        self.rate_limiter = None
+        if self.config.rate_limit:
+            self.rate_limiter = TokenBucket(self.config.rate_limit, self.config.rate_limit_burst)
+        self.retry_policy = self.config.retry or RetryPolicy(max_attempts=1)
+        self.cache = self.config.cache
+        self.profiler = self.config.profile
+        self.__local = threading.local()
         if self.config.verbose:
             self.enable_logging()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def transport(self):
+        """
+        Transport sending the requests, built on first use so its library is only imported when needed.
+
+        :rtype: :class:`statuspageio.transports.Transport`
+        """
+
+        if self.__transport is None:
+            with self.__transport_lock:
+                if self.__transport is None:
+                    self.__transport = build_transport(self.config.transport, self.config)
+        return self.__transport
+
+    @property
+    def retryable_exceptions(self):
+        """
+        Transport exceptions worth another attempt.
+
+        :rtype: tuple
+        """
+
+        return self.transport.retryable_exceptions
+
+    def close(self):
+        """
+        Close the transport and every pooled connection it holds.
+        """
+
+        with self.__transport_lock:
+            if self.__transport is not None:
+                self.__transport.close()
+                if isinstance(self.config.transport, (str, type(u''))):
+                    self.__transport = None
+
     def get(self, url, params=None, **kwargs):
         """
         Send a GET request.
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -44,7 +363,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -57,7 +376,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -70,7 +389,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -84,7 +403,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -92,7 +411,6 @@ class HttpClient(object):
         return self.request('delete', url, params=params, **kwargs)
 
     def request(self, method, url, params=None, body=None, **kwargs):
-        print method, url, params, body, kwargs
         """
         Send an HTTP request.
 
@@ -106,7 +424,7 @@ class HttpClient(object):
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :raises RequestError: if authentication failed, invalid query parameter etc.
         :raises RateLimitError: if rate limit exceeded.
         :raises ResourceError: if requests payload included invalid attributes or were missing.
@@ -117,88 +435,281 @@ class HttpClient(object):
         :Keyword Arguments:
             * :param dict headers: (optional) Dictionary of headers. Default: ``{}``.
             * :param bool raw: (optional) Whether to wrap and uwrap the envelope. Default: ``False``.
+            * :param bool stream: (optional) Whether to return a generator decoding the elements of a json
+                                  array response while it is received, instead of the decoded response.
+                                  Streamed responses are never cached. Default: ``False``.
         """
 
-        url = "{base_url}{version}{resource}".format(base_url=self.config.base_url,
-                                                     version=self.API_VERSION,
-                                                     resource=url)
+        path = url
+        profile = None
+        if self.profiler is not None:
+            profile = self.__local.profile = self.profiler.start(method, path)
+            started = monotonic()
+
+        request_headers = self.build_headers(**kwargs)
+        body = self.encode_body(body, request_headers, **kwargs)
+        if profile is not None:
+            profile.add('encode', monotonic() - started)
+
+        event = self.start_event(method, path, body)
+        if 'stream' in kwargs and kwargs['stream']:
+            return self.__stream(method, path, params, body, request_headers, event, profile, **kwargs)
+        if event is None and profile is None:
+            return self.__request(method, path, params, body, request_headers, None, None, **kwargs)
+
+        if event is not None:
+            event.profile = profile
+        try:
+            result = self.__request(method, path, params, body, request_headers, event, profile, **kwargs)
+        except Exception as e:
+            if event is not None:
+                if event.status_code is None:
+                    event.attempts = len(self.last_attempts)
+                self.finish_event(event, e)
+            raise
+        finally:
+            if profile is not None:
+                self.profiler.finish(profile)
+        if event is not None:
+            self.finish_event(event)
+        return result
+
+    def __request(self, method, path, params, body, request_headers, event, profile, **kwargs):
+        url = self.build_url(path)
+        cacheable = self.cache is not None and method.lower() == 'get'
+        cached = None
+        if cacheable:
+            cache_key = self.cache.key(method, path, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if cached.fresh:
+                    return self.serve_cached(cached, path, event, profile, **kwargs)
+                request_headers.update(cached.conditional_headers())
+            generation = self.cache.generation
+
+        resp = self.send(method, url, profile=profile, params=params, data=body, headers=request_headers)
+        if event is not None:
+            event.status_code, event.response_bytes, event.attempts = (
+                resp.status_code, len(resp.content), len(self.last_attempts))
+        if profile is not None:
+            profile.response_bytes = len(resp.content)
+
+        if self.cache is not None and not cacheable:
+            self.cache.invalidate(path)
+
+        if cached is not None and resp.status_code == 304:
+            self.cache.refresh(cached)
+            return self.serve_cached(cached, path, event, profile, revalidated=True, **kwargs)
 
-        
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded", 
-            "Authorization": "OAuth " + self.config.api_key
-        }   
+        if not (200 <= resp.status_code < 300):
+            self.handle_error_response(resp)
 
-        user_headers = {}
-        if  'headers' in kwargs and isinstance(kwargs['headers'], dict):
-            user_headers = kwargs['headers']
+        if cacheable:
+            self.cache.store(cache_key, path, resp.status_code, resp.headers, resp.content, generation)
 
-        headers.update(user_headers)
+        resp_body = self.decode_body(resp.headers, resp.content, path=path, profile=profile, **kwargs)
 
-        raw = bool(kwargs['raw']) if 'raw' in kwargs else False
+        return (resp.status_code, resp.headers, resp_body)
 
-        if body is not None:
-            headers['Content-Type'] = 'application/json'
-            payload = body if raw else self.wrap_envelope(kwargs['container'],body)
-            body = json.dumps(payload)
+    def __stream(self, method, path, params, body, request_headers, event, profile, **kwargs):
+        if event is not None:
+            event.profile = profile
+        try:
+            resp = self.send(method, self.build_url(path), profile=profile, stream=True,
+                             params=params, data=body, headers=request_headers)
+            if event is not None:
+                event.status_code, event.attempts = resp.status_code, len(self.last_attempts)
+
+            if self.cache is not None and method.lower() != 'get':
+                self.cache.invalidate(path)
+
+            if not (200 <= resp.status_code < 300):
+                self.handle_error_response(resp)
+        except Exception as e:
+            if event is not None:
+                if event.status_code is None:
+                    event.attempts = len(self.last_attempts)
+                self.finish_event(event, e)
+            if profile is not None:
+                self.profiler.finish(profile)
+            raise
+
+        return resp.status_code, resp.headers, self.decode_stream(resp, path, event, profile, **kwargs)
+
+    def decode_stream(self, resp, path=None, event=None, profile=None, **kwargs):
+        """
+        Decode a streamed json array response element by element, as it is received, and wrap every
+        element according to the configured ``response_model``. The connection is released and the
+        ``after_request`` hooks run once the generator is exhausted or closed.
+
+        :param :class:`statuspageio.transports.StreamedResponse` resp: Response of a streamed request.
+        :param str path: (optional) Sub URL of the request, selects the record class in ``model`` mode.
+        :param :class:`statuspageio.RequestEvent` event: (optional) Event completed once the response is read.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile completed once the response is read.
+        :return: Generator of the elements of the array, or of the content if it is not json.
+        :rtype: generator
+        """
 
-        resp = requests.request(method, url,
-                                params=params,
-                                data=body,
-                                headers=headers,
-                                timeout=float(self.config.timeout),
-                                verify=self.config.verify_ssl)
+        received = 0
+        error = None
+        spent = 0.0
+        try:
+            started = monotonic()
+            if not ('Content-Type' in resp.headers and 'json' in resp.headers['Content-Type']):
+                content = resp.content
+                received = len(content)
+                if content:
+                    yield content
+                return
+
+            parser = JsonArrayParser()
+            build_body = self.build_body
+            for chunk in resp.iter_content():
+                received += len(chunk)
+                for item in parser.feed(chunk):
+                    item = build_body(item, path, True)
+                    spent += monotonic() - started
+                    yield item
+                    started = monotonic()
+            for item in parser.close():
+                yield build_body(item, path, True)
+            spent += monotonic() - started
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            resp.close()
+            if event is not None:
+                event.response_bytes = received
+                self.finish_event(event, error)
+            if profile is not None:
+                # reading, parsing and building interleave while streaming, they all count as read
+                profile.add('read', spent)
+                profile.response_bytes = received
+                self.profiler.finish(profile)
+
+    @property
+    def last_attempts(self):
+        """
+        Attempts of the last request sent by the current thread.
 
-        if not (200 <= resp.status_code < 300):
-            self.handle_error_response(resp)
+        :rtype: list of :class:`statuspageio.retry.Attempt`
+        """
 
-        if 'Content-Type' in resp.headers and 'json' in resp.headers['Content-Type']:
-            resp_body = munchify(resp.json()) if raw else self.unwrap_envelope(resp.json())
-        else:
-            resp_body = resp.content
+        return getattr(self.__local, 'attempts', [])
 
-        return (resp.status_code, resp.headers, resp_body)
+    @property
+    def last_profile(self):
+        """
+        Phase timings of the last request sent by the current thread, ``None`` unless profiling
+        is enabled and the request was sampled.
 
-    def handle_error_response(self, resp):
-        try:
-            errors = resp.json()
-        except:
-            raise Exception('Unknown HTTP error response. Json expected. '
-                            'HTTP response code={0}. '
-                            'HTTP response body={1}'.format(resp.status_code,
-                                                            resp.text))
-        resp_code = resp.status_code
-        if resp_code == 422:
-            raise ResourceError(resp_code, errors)
-        elif resp_code == 420:
-            raise RateLimitError()
-        elif 400 <= resp_code < 500:
-            raise RequestError(resp_code, errors)
-        elif 500 <= resp_code < 600:
-            raise ServerError(resp_code, errors)
-        else:
-            raise Exception('Unknown HTTP error response')
+        :rtype: :class:`statuspageio.Profile`
+        """
 
-    @staticmethod
-    def wrap_envelope(container, body):
-        """ Wrap the body with the correct container to match the API """
-        return {container : body}
+        return getattr(self.__local, 'profile', None)
 
-    @staticmethod
-    def unwrap_envelope(body):
-        return [munchify(item) for item in body['items']] if 'items' in body else munchify(body)
-    
-    def enable_logging(self):
-        import logging
-        try:
-            import http.client as http_client
-        except ImportError:
-            # Python 2
-            import httplib as http_client
-        http_client.HTTPConnection.debuglevel = 1
+    def send(self, method, url, profile=None, stream=False, **kwargs):
+        """
+        Send a prepared request, retrying transient failures according to the retry policy.
+
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile the network phases are recorded in.
+        :param bool stream: (optional) Whether to return once the response headers are received, see
+                            :meth:`statuspageio.transports.Transport.stream`. Default: ``False``.
+        :param dict **kwargs: Parameters passed to :meth:`statuspageio.transports.Transport.request`.
+        :return: Response of the last attempt.
+        :rtype: :class:`requests.Response` or :class:`statuspageio.transports.TransportResponse`
+        """
 
-        logging.basicConfig()
-        logging.getLogger().setLevel(logging.DEBUG)
-        requests_log = logging.getLogger("requests.packages.urllib3")
-        requests_log.setLevel(logging.DEBUG)
-        requests_log.propagate = True
\ No newline at end of file
+        policy = self.retry_policy
+        attempts = self.__local.attempts = []
+        number = 1
+        while True:
+            started = monotonic()
+            try:
+                resp = self.send_paced(method, url, profile, stream, **kwargs)
+            except self.retryable_exceptions as e:
+                attempts.append(Attempt(number, monotonic() - started, error=e))
+                if not policy.should_retry(method, number):
+                    raise
+                delay = policy.backoff(number)
+            else:
+                attempts.append(Attempt(number, monotonic() - started, status_code=resp.status_code))
+                wait = retry_after(resp.headers)
+                if not policy.should_retry(method, number, resp.status_code, wait):
+                    return resp
+                if stream:
+                    resp.close()
+                delay = policy.backoff(number, wait)
+
+            attempts[-1].delay = delay
+            if profile is not None:
+                profile.add('backoff', delay)
+            time.sleep(delay)
+            number += 1
+
+    def send_paced(self, method, url, profile=None, stream=False, **kwargs):
+        """
+        Send a prepared request through the transport, pacing it with the rate limiter if any.
+
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile the network phases are recorded in.
+        :param bool stream: (optional) Whether to return once the response headers are received. Default: ``False``.
+        :param dict **kwargs: Parameters passed to :meth:`statuspageio.transports.Transport.request`.
+        :rtype: :class:`requests.Response` or :class:`statuspageio.transports.TransportResponse`
+        """
+
+        if self.rate_limiter is None:
+            return self.transmit(method, url, profile, stream, **kwargs)
+
+        attempt = 0
+        while True:
+            waited = self.rate_limiter.acquire()
+            if profile is not None:
+                profile.add('pacing', waited)
+            resp = self.transmit(method, url, profile, stream, **kwargs)
+
+            delay = retry_after(resp.headers)
+            rate_limited = resp.status_code in RATE_LIMIT_STATUSES
+            if delay is None and rate_limited:
+                delay = self.rate_limiter.interval * 2 ** attempt
+            if delay is not None:
+                self.rate_limiter.pause(delay)
+
+            if not rate_limited or attempt >= self.config.rate_limit_retries:
+                return resp
+            if stream:
+                resp.close()
+            attempt += 1
+
+    def transmit(self, method, url, profile=None, stream=False, **kwargs):
+        """
+        Send a single request through the transport.
+
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param :class:`statuspageio.Profile` profile: (optional) Profile the ``transport`` and ``read``
+                                                      phases are recorded in.
+        :param bool stream: (optional) Whether to return once the response headers are received. Default: ``False``.
+        :param dict **kwargs: Parameters passed to :meth:`statuspageio.transports.Transport.request`.
+        :rtype: :class:`requests.Response` or :class:`statuspageio.transports.TransportResponse`
+        """
+
+        send = self.transport.stream if stream else self.transport.request
+        if profile is None:
+            return send(method, url, **kwargs)
+
+        started = monotonic()
+        resp = send(method, url, **kwargs)
+        elapsed = monotonic() - started
+        # transports stop their clock once the response headers are parsed, the rest is reading the body
+        transport = min(resp.elapsed.total_seconds(), elapsed)
+        profile.add('transport', transport)
+        profile.add('read', elapsed - transport)
+        return resp
+
+    def handle_error_response(self, resp):
+        self.raise_for_error(resp.status_code, resp.content)
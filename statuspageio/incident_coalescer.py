@@ -0,0 +1,138 @@
+import threading
+
+from statuspageio.background import BackgroundFlusher
+from statuspageio.rate_limit import monotonic
+
+
+class IncidentUpdateCoalescer(BackgroundFlusher):
+    """
+    Collects incident changes in memory and sends them from a background thread, one PATCH per
+    incident for a burst of changes.
+
+    Every change to ``status`` or ``message`` of an incident generates an incident update and
+    notifies the subscribers. Changes queued for the same incident are merged - later values win -
+    and sent through :meth:`IncidentsService.update <statuspageio.IncidentsService.update>` once no
+    new change arrived for ``window`` seconds, or at the latest ``max_delay`` seconds after the first
+    one. Pending changes are sent on :meth:`flush`, :meth:`close` and at interpreter exit.
+
+    Usage::
+
+      >>> coalescer = client.incidents.coalescer(window=5)
+      >>> coalescer.update('<INCIDENT_ID>', status='identified')
+      >>> coalescer.update('<INCIDENT_ID>', message='The database failed over, recovering.')
+      >>> coalescer.flush()
+
+    Normally you will build it with :meth:`statuspageio.IncidentsService.coalescer`.
+
+    :attribute int sent: Number of PATCH requests sent.
+    :attribute int coalesced: Number of changes merged into another one instead of being sent on their own.
+    """
+
+    def __init__(self, incidents_service, window=2.0, max_delay=10.0, message_separator=None, on_error=None):
+        """
+        :param :class:`statuspageio.IncidentsService` incidents_service: Service used to send the updates.
+        :param float window: (optional) Seconds without a new change before an incident is sent. Default: **2** seconds.
+        :param float max_delay: (optional) Maximum seconds a change waits, even if changes keep coming.
+                                Default: **10** seconds.
+        :param str message_separator: (optional) Join the distinct messages of merged changes with this
+                                      separator, e.g. ``'\\n\\n'``. Default: ``None`` - the last message wins.
+        :param callable on_error: (optional) Called with ``(exception, incident_id, attributes)`` when an update
+                                  fails. Default: the failure is logged and the changes are discarded.
+        """
+
+        self.incidents_service = incidents_service
+        self.window = window
+        self.max_delay = max_delay
+        self.message_separator = message_separator
+        self.on_error = on_error
+
+        self.sent = 0
+        self.coalesced = 0
+        self.__pending = {}
+        self.__flush_lock = threading.Lock()
+        super(IncidentUpdateCoalescer, self).__init__('statuspageio-incident-coalescer')
+
+    def __len__(self):
+        return len(self.__pending)
+
+    def update(self, incident_id, **kwargs):
+        """
+        Queue changes of an incident. Never blocks on the network.
+
+        :param str incident_id: The id of the incident.
+        :param dict **kwargs: Incident attributes to update, as for :meth:`statuspageio.IncidentsService.update`.
+        :raises Exception: if the coalescer is closed.
+        """
+
+        if not kwargs:
+            raise Exception('attributes for Incident are missing')
+
+        now = monotonic()
+        with self._lock:
+            if self._closed:
+                raise Exception('incident update coalescer is closed')
+
+            pending = self.__pending.get(incident_id)
+            if pending is None:
+                self.__pending[incident_id] = {'attributes': dict(kwargs), 'first': now, 'last': now}
+            else:
+                self.__merge(pending['attributes'], kwargs)
+                pending['last'] = now
+                self.coalesced += 1
+            self._wakeup.notify()
+
+    def flush(self, incident_id=None):
+        """
+        Send the pending changes now.
+
+        :param str incident_id: (optional) Only send the changes of this incident. Default: every incident.
+        :return: Number of sent updates.
+        :rtype: int
+        """
+
+        with self._lock:
+            incident_ids = list(self.__pending) if incident_id is None else [incident_id]
+        return self.__send(incident_ids)
+
+    def __merge(self, attributes, changes):
+        for key, value in changes.items():
+            if (key == 'message' and self.message_separator is not None and attributes.get('message')
+                    and value and value != attributes['message']):
+                value = attributes['message'] + self.message_separator + value
+            attributes[key] = value
+
+    def __due(self, pending):
+        return min(pending['last'] + self.window, pending['first'] + self.max_delay)
+
+    def __send(self, incident_ids):
+        with self.__flush_lock:
+            sent = 0
+            for incident_id in incident_ids:
+                with self._lock:
+                    pending = self.__pending.pop(incident_id, None)
+                if pending is None:
+                    continue
+                try:
+                    self.incidents_service.update(incident_id, **pending['attributes'])
+                    sent += 1
+                except Exception as e:
+                    if self.on_error is not None:
+                        self.on_error(e, incident_id, pending['attributes'])
+                    else:
+                        import logging
+                        logging.getLogger(__name__).exception('Failed to update incident %s', incident_id)
+
+            with self._lock:
+                self.sent += sent
+            return sent
+
+    def _poll(self, now):
+        due = [incident_id for incident_id, pending in self.__pending.items() if self.__due(pending) <= now]
+        if due:
+            return due, None
+        if self.__pending:
+            return None, min(self.__due(pending) for pending in self.__pending.values()) - now
+        return None, None
+
+    def _flush_due(self, due):
+        self.__send(due)
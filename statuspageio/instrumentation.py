@@ -0,0 +1,273 @@
+import threading
+
+from statuspageio.rate_limit import monotonic
+
+
+"""
+Path segments which name an action rather than a resource id.
+"""
+LITERAL_SEGMENTS = frozenset(['unresolved', 'scheduled', 'data'])
+
+
+def endpoint_template(path):
+    """
+    Replace the resource ids of a sub URL with placeholders, so requests to the same endpoint
+    are grouped together whatever resource they touch.
+
+    Usage::
+
+      >>> endpoint_template('/pages/abc123/components/xyz789.json')
+      '/pages/{page_id}/components/{component_id}.json'
+
+    :param str path: Sub URL of the request.
+    :rtype: str
+    """
+
+    path, suffix = (path[:-5], '.json') if path.endswith('.json') else (path, '')
+    segments = path.split('/')
+    # sub URLs alternate collection names and ids: /pages/{page_id}/components/{component_id}
+    for index in range(2, len(segments), 2):
+        if segments[index] not in LITERAL_SEGMENTS:
+            collection = segments[index - 1]
+            segments[index] = '{' + (collection[:-1] if collection.endswith('s') else collection) + '_id}'
+    return '/'.join(segments) + suffix
+
+
+class RequestEvent(object):
+    """
+    A request as seen by instrumentation hooks.
+
+    The same instance is passed to the ``before_request`` hooks, with only the request attributes set,
+    and then to the ``after_request`` hooks once the request completed. Hooks may set extra attributes
+    on it to carry state from one to the other, e.g. a tracing span.
+
+    :attribute str method: Http method, upper case.
+    :attribute str path: Sub URL of the request.
+    :attribute str endpoint: Sub URL with ids replaced by placeholders, see :func:`endpoint_template`.
+    :attribute int request_bytes: Size of the encoded request body.
+    :attribute int status_code: Http status of the response, ``None`` when the transport failed.
+    :attribute int response_bytes: Size of the response content.
+    :attribute float elapsed: Seconds spent on the request, including retries, pacing and decoding.
+    :attribute int attempts: Number of attempts sent, ``0`` when served from the cache.
+    :attribute bool cached: Whether the response was served from the :class:`statuspageio.ResponseCache`.
+    :attribute Exception error: Exception raised by the request, ``None`` on success.
+    :attribute :class:`statuspageio.Profile` profile: Phase timings, ``None`` unless profiling is enabled
+                                                      and the request was sampled.
+    """
+
+    def __init__(self, method, path, request_bytes=0):
+        self.method = method.upper()
+        self.path = path
+        self.endpoint = endpoint_template(path)
+        self.request_bytes = request_bytes
+        self.status_code = None
+        self.response_bytes = 0
+        self.elapsed = 0.0
+        self.attempts = 0
+        self.cached = False
+        self.error = None
+        self.profile = None
+        self.started = monotonic()
+
+    def __repr__(self):
+        return '<RequestEvent {0} {1} status_code={2} elapsed={3:.3f}>'.format(
+            self.method, self.endpoint, self.status_code, self.elapsed)
+
+
+class EndpointStats(object):
+    """
+    Counters and latency histogram of a single ``(method, endpoint)`` pair of a :class:`StatsCollector`.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.statuses = {}
+        self.count = 0
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.elapsed_sum = 0.0
+        self.elapsed_max = 0.0
+
+    def record(self, event):
+        status = event.status_code if event.status_code is not None else 'error'
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.count += 1
+        if event.error is not None:
+            self.errors += 1
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+        self.elapsed_sum += event.elapsed
+        self.elapsed_max = max(self.elapsed_max, event.elapsed)
+
+        index = 0
+        while index < len(self.buckets) and event.elapsed > self.buckets[index]:
+            index += 1
+        self.bucket_counts[index] += 1
+
+    def percentile(self, fraction):
+        """
+        Estimate a latency percentile by linear interpolation within the histogram buckets,
+        the way Prometheus ``histogram_quantile`` does.
+
+        :param float fraction: Percentile as a fraction, e.g. ``0.99``.
+        :rtype: float
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.bucket_counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.elapsed_max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.elapsed_max)
+            seen += count
+        return self.elapsed_max
+
+
+class StatsCollector(object):
+    """
+    Per-endpoint request counters and latency histograms, fed by the ``after_request`` hook
+    of :class:`statuspageio.HttpClient`.
+
+    Usage::
+
+      >>> client = statuspageio.Client(api_key='...', page_id='...', stats=True)
+      >>> client.components.list()
+      >>> client.stats.as_dict()['GET /pages/{page_id}/components.json']['latency']['p99']
+      0.084
+      >>> print(client.stats.to_prometheus())
+
+    Recording costs a lock and a few additions per request. When no collector (and no hook) is configured
+    the http client skips instrumentation altogether.
+    """
+
+    """
+    Upper bounds, in seconds, of the latency histogram buckets.
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets=BUCKETS):
+        """
+        :param tuple buckets: (optional) Sorted upper bounds of the latency buckets, in seconds.
+                              Default: :attr:`BUCKETS`, **5ms** to **30s**.
+        """
+
+        self.buckets = tuple(sorted(buckets))
+        self.__lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Forget every recorded request.
+        """
+
+        with self.__lock:
+            self.__endpoints = {}
+            self.started = monotonic()
+
+    def record(self, event):
+        """
+        Account for a completed request.
+
+        :param :class:`RequestEvent <RequestEvent>` event: The request, as passed to ``after_request`` hooks.
+        """
+
+        key = (event.method, event.endpoint)
+        with self.__lock:
+            stats = self.__endpoints.get(key)
+            if stats is None:
+                stats = self.__endpoints[key] = EndpointStats(self.buckets)
+            stats.record(event)
+
+    def endpoints(self):
+        """
+        Snapshot of the per-endpoint statistics.
+
+        :return: Sorted list of ``((method, endpoint), stats)`` tuples.
+        :rtype: list
+        """
+
+        import copy
+        with self.__lock:
+            return sorted((key, copy.deepcopy(stats)) for key, stats in self.__endpoints.items())
+
+    def as_dict(self):
+        """
+        Statistics keyed by ``'<METHOD> <endpoint>'``, with counters, throughput in requests
+        per second since the collector was created or reset, and latency percentiles in seconds.
+
+        :rtype: dict
+        """
+
+        uptime = max(monotonic() - self.started, 1e-9)
+        result = {}
+        for (method, endpoint), stats in self.endpoints():
+            result['{0} {1}'.format(method, endpoint)] = {
+                'count': stats.count,
+                'errors': stats.errors,
+                'statuses': dict(stats.statuses),
+                'request_bytes': stats.request_bytes,
+                'response_bytes': stats.response_bytes,
+                'throughput': stats.count / uptime,
+                'latency': {
+                    'mean': stats.elapsed_sum / stats.count,
+                    'max': stats.elapsed_max,
+                    'p50': stats.percentile(0.50),
+                    'p95': stats.percentile(0.95),
+                    'p99': stats.percentile(0.99),
+                },
+            }
+        return result
+
+    def to_prometheus(self, prefix='statuspageio'):
+        """
+        Statistics in the Prometheus text exposition format.
+
+        :param str prefix: (optional) Prefix of the metric names. Default: ``'statuspageio'``.
+        :rtype: str
+        """
+
+        endpoints = self.endpoints()
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append('# HELP {0}_{1} {2}'.format(prefix, name, help_text))
+            lines.append('# TYPE {0}_{1} {2}'.format(prefix, name, kind))
+
+        def sample(name, labels, value):
+            lines.append('{0}_{1}{{{2}}} {3}'.format(prefix, name, ','.join(
+                '{0}="{1}"'.format(label, escape_label(label_value)) for label, label_value in labels), value))
+
+        metric('requests_total', 'counter', 'Requests sent to the StatusPage.io API.')
+        for (method, endpoint), stats in endpoints:
+            for status, count in sorted(stats.statuses.items(), key=lambda item: str(item[0])):
+                sample('requests_total', [('method', method), ('endpoint', endpoint), ('status', status)], count)
+
+        metric('request_duration_seconds', 'histogram', 'Latency of requests to the StatusPage.io API.')
+        for (method, endpoint), stats in endpoints:
+            labels = [('method', method), ('endpoint', endpoint)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), stats.bucket_counts):
+                cumulative += count
+                sample('request_duration_seconds_bucket', labels + [('le', bound)], cumulative)
+            sample('request_duration_seconds_sum', labels, repr(stats.elapsed_sum))
+            sample('request_duration_seconds_count', labels, stats.count)
+
+        metric('request_bytes_total', 'counter', 'Encoded request bodies sent to the StatusPage.io API.')
+        for (method, endpoint), stats in endpoints:
+            sample('request_bytes_total', [('method', method), ('endpoint', endpoint)], stats.request_bytes)
+
+        metric('response_bytes_total', 'counter', 'Response content received from the StatusPage.io API.')
+        for (method, endpoint), stats in endpoints:
+            sample('response_bytes_total', [('method', method), ('endpoint', endpoint)], stats.response_bytes)
+
+        return '\n'.join(lines) + '\n'
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
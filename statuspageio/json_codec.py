@@ -0,0 +1,112 @@
+import json
+import sys
+
+from statuspageio.errors import ConfigurationError
+
+
+class JsonCodec(object):
+    """
+    Encodes request bodies and decodes response content.
+
+    Implementations decode straight from the response bytes and may encode to either text or bytes,
+    every transport sends both.
+    """
+
+    """
+    Name of the codec in :data:`CODECS`.
+    """
+    name = None
+
+    def dumps(self, payload):
+        """
+        :param payload: Json serializable request body.
+        :rtype: str or bytes
+        """
+
+        raise NotImplementedError
+
+    def loads(self, content):
+        """
+        :param bytes content: Utf-8 encoded json.
+        """
+
+        raise NotImplementedError
+
+
+class StdlibCodec(JsonCodec):
+    """
+    :mod:`json` of the standard library, always available.
+    """
+
+    name = 'json'
+
+    def dumps(self, payload):
+        return json.dumps(payload)
+
+    def loads(self, content):
+        return json.loads(content.decode('utf-8'))
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    :mod:`orjson`, the fastest of the supported codecs. Encodes to bytes.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class UjsonCodec(JsonCodec):
+    """
+    :mod:`ujson`, also available on Python 2.
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self.dumps = ujson.dumps
+        self.loads = ujson.loads
+
+
+"""
+Codecs selectable by name with the ``json_codec`` option.
+"""
+CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': StdlibCodec,
+}
+
+"""
+Order in which ``'auto'`` tries the codecs. On Python 3 the standard library decodes as fast as
+:mod:`ujson`, which only pays off on Python 2, where :mod:`orjson` is not available.
+"""
+AUTO_ORDER = ('orjson', 'json') if sys.version_info[0] >= 3 else ('ujson', 'json')
+
+
+def build_codec(codec):
+    """
+    :param codec: ``'auto'`` for the fastest codec installed, the name of one of :data:`CODECS`,
+                  or a :class:`JsonCodec <JsonCodec>` instance.
+    :rtype: :class:`JsonCodec <JsonCodec>`
+    :raises ConfigurationError: if the library of a named codec is not installed.
+    """
+
+    if not isinstance(codec, (str, type(u''))):
+        return codec
+    if codec != 'auto':
+        try:
+            return CODECS[codec]()
+        except ImportError:
+            raise ConfigurationError('{0} is required by the {0} json_codec. '
+                                     'Install it using: "pip install {0}"'.format(codec))
+    for name in AUTO_ORDER:
+        try:
+            return CODECS[name]()
+        except ImportError:
+            continue
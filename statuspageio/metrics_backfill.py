@@ -0,0 +1,317 @@
+"""
+Historical backfill of custom metric data.
+
+Timestamps are converted and points downsampled to the resolution of the api with :mod:`numpy`
+when it is installed, with plain Python otherwise. The points are then submitted in bulk requests
+sent concurrently, and the submitted ranges recorded in an optional checkpoint file.
+"""
+
+import calendar
+import datetime
+import threading
+
+from statuspageio.bulk import BoundedExecutor, BulkReport, load_checkpoint, save_checkpoint
+from statuspageio.rate_limit import monotonic
+
+
+def to_seconds(timestamp):
+    """
+    :param timestamp: Unix timestamp in seconds, or :class:`datetime.datetime` - naive ones are taken as UTC.
+    :return: Unix timestamp in whole seconds.
+    :rtype: int
+    """
+
+    if isinstance(timestamp, datetime.datetime):
+        return calendar.timegm(timestamp.utctimetuple())
+    return int(timestamp // 1)
+
+
+def split_pairs(data, values=None):
+    """
+    Timestamps and values of the supported inputs: a pandas series indexed by time, a sequence of
+    timestamps with a sequence of ``values``, a ``(n, 2)`` array or an iterable of pairs.
+
+    :rtype: tuple
+    """
+
+    if values is not None:
+        return data, values
+    index = getattr(data, 'index', None)
+    if index is not None and hasattr(data, 'to_numpy'):
+        return index, data.to_numpy(dtype='float64', na_value=float('nan'))
+    if getattr(data, 'ndim', None) == 2:
+        return data[:, 0], data[:, 1]
+    pairs = list(data)
+    if not pairs:
+        return [], []
+    timestamps, values = zip(*pairs)
+    return list(timestamps), list(values)
+
+
+def downsample(timestamps, values, resolution, aggregate='mean'):
+    """
+    Convert the timestamps and aggregate the values of every ``resolution`` seconds interval.
+    Missing values - ``None`` and NaN - are dropped.
+
+    :param timestamps: Sequence of unix timestamps, datetimes or a :class:`numpy.ndarray` / pandas index
+                       of ``datetime64``.
+    :param values: Sequence of numbers.
+    :param int resolution: Interval in seconds.
+    :param str aggregate: (optional) ``'mean'``, ``'min'``, ``'max'`` or ``'last'``. Default: ``'mean'``.
+    :return: Tuple of ascending interval starts and aggregated values, as numpy arrays if available.
+    :rtype: tuple
+    """
+
+    if aggregate not in ('mean', 'min', 'max', 'last'):
+        raise ValueError('Unknown aggregate {0!r}, expected one of: mean, min, max, last.'.format(aggregate))
+    try:
+        import numpy
+    except ImportError:
+        return downsample_python(timestamps, values, resolution, aggregate)
+
+    if getattr(timestamps, 'tz', None) is not None:
+        # timezone aware pandas index
+        timestamps = timestamps.tz_convert('UTC').tz_localize(None)
+    timestamps = numpy.asarray(timestamps)
+    if timestamps.dtype.kind == 'M':
+        seconds = timestamps.astype('datetime64[s]').astype('int64')
+    elif timestamps.dtype.kind in 'iuf':
+        seconds = numpy.floor(timestamps).astype('int64')
+    else:
+        seconds = numpy.fromiter((to_seconds(timestamp) for timestamp in timestamps), 'int64', len(timestamps))
+
+    values = numpy.asarray([numpy.nan if value is None else value for value in values]
+                           if not hasattr(values, 'dtype') else values, dtype='float64')
+    if len(seconds) != len(values):
+        raise ValueError('{0} timestamps for {1} values'.format(len(seconds), len(values)))
+    present = ~numpy.isnan(values)
+    buckets = seconds[present] // resolution * resolution
+    values = values[present]
+    if not len(values):
+        return buckets, values
+
+    order = numpy.argsort(buckets, kind='stable')
+    buckets, values = buckets[order], values[order]
+    starts = numpy.flatnonzero(numpy.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = numpy.append(starts[1:], len(values))
+    if aggregate == 'mean':
+        aggregated = numpy.add.reduceat(values, starts) / (ends - starts)
+    elif aggregate == 'min':
+        aggregated = numpy.minimum.reduceat(values, starts)
+    elif aggregate == 'max':
+        aggregated = numpy.maximum.reduceat(values, starts)
+    else:
+        aggregated = values[ends - 1]
+    return buckets[starts], aggregated
+
+
+def downsample_python(timestamps, values, resolution, aggregate='mean'):
+    """
+    :func:`downsample` without :mod:`numpy`.
+    """
+
+    intervals = {}
+    for timestamp, value in zip(timestamps, values):
+        if value is None or value != value:
+            continue
+        bucket = to_seconds(timestamp) // resolution * resolution
+        current = intervals.get(bucket)
+        if current is None:
+            intervals[bucket] = [value, 1]
+        elif aggregate == 'mean':
+            current[0] += value
+            current[1] += 1
+        elif aggregate == 'min':
+            current[0] = min(current[0], value)
+        elif aggregate == 'max':
+            current[0] = max(current[0], value)
+        else:
+            current[0] = value
+
+    buckets = sorted(intervals)
+    return buckets, [float(intervals[bucket][0]) / intervals[bucket][1] for bucket in buckets]
+
+
+def take(sequence, indexes):
+    """
+    Items of a list or numpy array at ``indexes``, as a list of Python values.
+    """
+
+    if hasattr(sequence, 'dtype'):
+        return sequence[indexes].tolist()
+    return [sequence[index] for index in indexes]
+
+
+class BackfillReport(BulkReport):
+    """
+    Outcome of :meth:`statuspageio.MetricsService.backfill`, also handed to the ``progress`` callback.
+
+    :attribute int points: Data points given.
+    :attribute int intervals: Points left after downsampling.
+    :attribute int skipped: Points submitted by an earlier run, according to the checkpoint.
+    :attribute int submitted: Points submitted by this run.
+    :attribute int requests: Bulk requests sent by this run.
+    :attribute float elapsed: Seconds taken so far.
+    """
+
+    def __init__(self):
+        super(BackfillReport, self).__init__()
+        self.points = 0
+        self.intervals = 0
+        self.skipped = 0
+        self.submitted = 0
+        self.requests = 0
+
+    @property
+    def processed(self):
+        return self.submitted
+
+    def __repr__(self):
+        return '<BackfillReport intervals={0} submitted={1} skipped={2} requests={3} rate={4:.1f}/s>'.format(
+            self.intervals, self.submitted, self.skipped, self.requests, self.rate)
+
+
+class MetricsBackfill(object):
+    """
+    Submits the history of a custom metric in concurrent bulk requests.
+
+    The points are downsampled to one per ``resolution`` seconds, sorted and cut into chunks of
+    ``points_per_request``. With a ``checkpoint`` file, the time ranges of the submitted chunks are
+    recorded as they complete: a run stopped by a failure or an interruption can be started again
+    with the same data and checkpoint, and only sends the points not submitted yet.
+
+    Normally you will use :meth:`statuspageio.MetricsService.backfill`.
+    """
+
+    """
+    Seconds between the data points the api keeps for a custom metric.
+    """
+    RESOLUTION = 30
+
+    def __init__(self, metrics_service, metric_id, resolution=RESOLUTION, aggregate='mean', points_per_request=1000,
+                 max_workers=4, checkpoint=None, progress=None):
+        """
+        :param :class:`statuspageio.MetricsService` metrics_service: Service submitting the points.
+        :param str metric_id: The id of the custom metric.
+        :param int resolution: (optional) Seconds per data point. Default: **30**.
+        :param str aggregate: (optional) How points within a ``resolution`` interval are combined:
+                              ``'mean'``, ``'min'``, ``'max'`` or ``'last'``. Default: ``'mean'``.
+        :param int points_per_request: (optional) Maximum points per bulk request. Default: **1000**.
+        :param int max_workers: (optional) Maximum number of concurrent requests. Default: **4**.
+        :param str checkpoint: (optional) File recording the submitted ranges. Default: ``None`` - no resume.
+        :param callable progress: (optional) Called with the :class:`BackfillReport <BackfillReport>` in progress
+                                  after every request.
+        """
+
+        self.metrics_service = metrics_service
+        self.metric_id = metric_id
+        self.resolution = resolution
+        self.aggregate = aggregate
+        self.points_per_request = points_per_request
+        self.max_workers = max_workers
+        self.checkpoint = checkpoint
+        self.progress = progress
+
+        self.report = BackfillReport()
+        self.__until = None
+        self.__done = {}
+        self.__spans = []
+        self.__next = 0
+        self.__started = None
+        self.__lock = threading.Lock()
+
+    def run(self, data, values=None):
+        """
+        :param data: A pandas series indexed by time, a numpy array of ``(timestamp, value)`` rows, an iterable
+                     of ``(timestamp, value)`` pairs, or the timestamps when ``values`` is given. Timestamps are
+                     unix seconds, datetimes or ``datetime64``.
+        :param values: (optional) Values matching the timestamps of ``data``.
+        :rtype: :class:`BackfillReport <BackfillReport>`
+        :raises ValueError: if the checkpoint belongs to another metric or resolution.
+        """
+
+        self.__started = monotonic()
+        timestamps, values = split_pairs(data, values)
+        self.report.points = len(values)
+        timestamps, values = downsample(timestamps, values, self.resolution, self.aggregate)
+        self.report.intervals = len(timestamps)
+
+        self.__load_checkpoint()
+        pending = self.__pending(timestamps)
+        self.report.skipped = len(timestamps) - len(pending)
+        chunks = [pending[start:start + self.points_per_request]
+                  for start in range(0, len(pending), self.points_per_request)]
+        # chunks complete in any order, the checkpoint only moves past the contiguous prefix of done ones
+        self.__spans = [(int(timestamps[chunk[0]]), int(timestamps[chunk[-1]])) for chunk in chunks]
+
+        executor = BoundedExecutor(self.max_workers)
+        try:
+            for number, chunk in enumerate(chunks):
+                if executor.error is not None:
+                    break
+                points = [{'timestamp': int(timestamp), 'value': float(value)}
+                          for timestamp, value in zip(take(timestamps, chunk), take(values, chunk))]
+                executor.submit(
+                    lambda future, number=number, size=len(points): self.__finished(future, number, size, executor),
+                    self.metrics_service.submit_bulk_data, {self.metric_id: points})
+        finally:
+            executor.shutdown()
+            with self.__lock:
+                self.__save_checkpoint()
+
+        if executor.error is not None:
+            raise executor.error
+        return self.report
+
+    def __pending(self, timestamps):
+        until, spans = self.__until, list(self.__done.values())
+        if not hasattr(timestamps, 'dtype'):
+            return [index for index, timestamp in enumerate(timestamps)
+                    if not (until is not None and timestamp <= until or
+                            any(first <= timestamp <= last for first, last in spans))]
+
+        import numpy
+        pending = numpy.ones(len(timestamps), dtype=bool)
+        if until is not None:
+            pending &= timestamps > until
+        for first, last in spans:
+            pending &= (timestamps < first) | (timestamps > last)
+        return numpy.flatnonzero(pending)
+
+    def __finished(self, future, number, size, executor):
+        error = future.exception()
+        if error is not None:
+            executor.fail(error)
+            return
+
+        with self.__lock:
+            self.report.submitted += size
+            self.report.requests += 1
+            self.__done[number] = self.__spans[number]
+            while self.__next in self.__done:
+                self.__until = self.__done.pop(self.__next)[1]
+                self.__next += 1
+            self.__save_checkpoint()
+
+        if self.progress is not None:
+            self.progress(self.report)
+
+    def __load_checkpoint(self):
+        state = load_checkpoint(self.checkpoint)
+        if state is None:
+            return
+        if state['metric_id'] != self.metric_id or state['resolution'] != self.resolution:
+            raise ValueError('Checkpoint {0} belongs to metric {1} at a {2}s resolution'.format(
+                self.checkpoint, state['metric_id'], state['resolution']))
+        self.__until = state['until']
+        # ranges of a previous run, keyed apart from the chunk numbers of this run
+        self.__done = dict((('previous', index), tuple(span)) for index, span in enumerate(state['done']))
+
+    def __save_checkpoint(self):
+        self.report.elapsed = monotonic() - self.__started
+        if self.checkpoint is None:
+            return
+        save_checkpoint(self.checkpoint, {'metric_id': self.metric_id, 'resolution': self.resolution,
+                                          'until': self.__until,
+                                          'done': sorted(span for span in self.__done.values()
+                                                         if self.__until is None or span[1] > self.__until)})
@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+
+from statuspageio.background import BackgroundFlusher
+from statuspageio.rate_limit import monotonic
+
+
+class MetricsBatcher(BackgroundFlusher):
+    """
+    Buffers custom metric data points in memory and submits them in bulk from a background thread.
+
+    Points are grouped per ``metric_id`` and sent through
+    :meth:`MetricsService.submit_bulk_data <statuspageio.MetricsService.submit_bulk_data>`, so one
+    request covers many points across many metrics. A flush is triggered when ``flush_size`` points
+    are buffered or ``flush_interval`` seconds have passed, whichever comes first.
+    Remaining points are flushed on :meth:`close` and at interpreter exit.
+
+    Usage::
+
+      >>> batcher = client.metrics.batcher(flush_interval=10)
+      >>> batcher.submit('<METRIC_ID>', 42.0)
+      >>> batcher.flush()
+
+    Normally you will build it with :meth:`statuspageio.MetricsService.batcher`.
+    """
+
+    def __init__(self, metrics_service, flush_size=500, flush_interval=5.0,
+                 max_buffered_points=10000, max_points_per_request=1000, on_error=None):
+        """
+        :param :class:`statuspageio.MetricsService` metrics_service: Service used to submit the points.
+        :param int flush_size: (optional) Number of buffered points triggering a flush. Default: **500**.
+        :param float flush_interval: (optional) Maximum seconds a point waits in the buffer. Default: **5** seconds.
+        :param int max_buffered_points: (optional) Upper bound of buffered points. When reached the oldest
+                                        point of the submitted metric is dropped. Default: **10000**.
+        :param int max_points_per_request: (optional) Maximum points sent in a single request. Default: **1000**.
+        :param callable on_error: (optional) Called with ``(exception, data)`` when a bulk submission fails.
+                                  Default: the failure is logged and the points are discarded.
+        """
+
+        self.metrics_service = metrics_service
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_buffered_points = max_buffered_points
+        self.max_points_per_request = max_points_per_request
+        self.on_error = on_error
+
+        self.dropped = 0
+        self.__buffer = {}
+        self.__buffered = 0
+        self.__deadline = monotonic() + flush_interval
+        self.__flush_lock = threading.Lock()
+        super(MetricsBatcher, self).__init__('statuspageio-metrics-batcher')
+
+    def __len__(self):
+        return self.__buffered
+
+    def submit(self, metric_id, value, timestamp=None):
+        """
+        Buffer a data point. Never blocks on the network.
+
+        :param str metric_id: The id of the custom metric.
+        :param float value: The value of the data point.
+        :param int timestamp: (optional) Unix timestamp of the data point. Default: now.
+        :raises Exception: if the batcher is closed.
+        """
+
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        with self._lock:
+            if self._closed:
+                raise Exception('metrics batcher is closed')
+
+            points = self.__buffer.get(metric_id)
+            if self.__buffered >= self.max_buffered_points:
+                self.dropped += 1
+                if not points:
+                    # no entry for a metric whose points would all be dropped
+                    return
+                points.popleft()
+                self.__buffered -= 1
+            elif points is None:
+                points = self.__buffer[metric_id] = deque()
+
+            points.append({'timestamp': timestamp, 'value': value})
+            self.__buffered += 1
+
+            if self.__buffered >= self.flush_size:
+                self._wakeup.notify()
+
+    def flush(self):
+        """
+        Submit every buffered point now, in as few requests as ``max_points_per_request`` allows.
+
+        :return: Number of submitted points.
+        :rtype: int
+        """
+
+        with self.__flush_lock:
+            with self._lock:
+                buffer, self.__buffer = self.__buffer, {}
+                self.__buffered = 0
+                self.__deadline = monotonic() + self.flush_interval
+
+            submitted = 0
+            for data in self.__chunks(buffer):
+                try:
+                    self.metrics_service.submit_bulk_data(data)
+                    submitted += sum(len(points) for points in data.values())
+                except Exception as e:
+                    if self.on_error is not None:
+                        self.on_error(e, data)
+                    else:
+                        import logging
+                        logging.getLogger(__name__).exception('Failed to submit metrics data')
+
+            return submitted
+
+    def __chunks(self, buffer):
+        data, size = {}, 0
+        for metric_id, points in buffer.items():
+            while points:
+                take = min(len(points), self.max_points_per_request - size)
+                data.setdefault(metric_id, []).extend(points.popleft() for _ in range(take))
+                size += take
+                if size >= self.max_points_per_request:
+                    yield data
+                    data, size = {}, 0
+        if data:
+            yield data
+
+    def _poll(self, now):
+        if self.__buffered >= self.flush_size or now >= self.__deadline:
+            return True, None
+        return None, self.__deadline - now
+
+    def _flush_due(self, due):
+        self.flush()
@@ -0,0 +1,212 @@
+"""
+In-memory mirror of the state of a page.
+
+:class:`PageMirror` loads the components, incidents and custom metrics of a page once and is then
+kept current from the responses of ``create``, ``update`` and ``delete`` calls made through the same
+:class:`statuspageio.Client`, so lookups by id, name or group are answered from memory.
+"""
+
+import threading
+
+
+class ResourceIndex(object):
+    """
+    Resources of one collection, indexed by ``id``, ``name`` and ``group_id``.
+
+    Lookups are dictionary accesses. Resources are returned as received from the API, in the
+    response model of the client, and should be treated as read-only.
+
+    Normally you won't instantiate this class directly, use :attr:`statuspageio.Client.mirror`.
+    """
+
+    def __init__(self):
+        self.__by_id = {}
+        self.__by_name = {}
+        self.__by_group = {}
+        # writes reported during a reload, applied again on top of the listing
+        self.__writes = None
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__by_id)
+
+    def __contains__(self, resource_id):
+        return resource_id in self.__by_id
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def get(self, resource_id, default=None):
+        """
+        :param str resource_id: The id of the resource.
+        :return: The resource, or ``default`` if unknown.
+        """
+
+        return self.__by_id.get(resource_id, default)
+
+    def find(self, name):
+        """
+        :param str name: The name of the resource.
+        :return: The first resource with this name, or ``None``.
+        """
+
+        with self.__lock:
+            ids = self.__by_name.get(name)
+            return self.__by_id[ids[0]] if ids else None
+
+    def named(self, name):
+        """
+        :param str name: The name of the resources.
+        :return: Every resource with this name.
+        :rtype: list
+        """
+
+        with self.__lock:
+            return [self.__by_id[resource_id] for resource_id in self.__by_name.get(name, ())]
+
+    def in_group(self, group_id):
+        """
+        :param str group_id: The id of the group, e.g. of a component group.
+        :return: Every resource of the group.
+        :rtype: list
+        """
+
+        with self.__lock:
+            return [self.__by_id[resource_id] for resource_id in self.__by_group.get(group_id, ())]
+
+    def all(self):
+        """
+        :rtype: list
+        """
+
+        with self.__lock:
+            return list(self.__by_id.values())
+
+    def load(self, resources):
+        """
+        Replace the content of the index.
+
+        :param resources: Iterable of resources.
+        """
+
+        with self.__lock:
+            self.__by_id.clear()
+            self.__by_name.clear()
+            self.__by_group.clear()
+            for resource in resources:
+                self.__add(resource)
+
+    def reload(self, list_resources):
+        """
+        Replace the content of the index with a fresh listing.
+
+        A write reported through :meth:`put` or :meth:`remove` while the listing is fetched may be
+        missing from it, so such writes are applied again on top of the listing.
+
+        :param callable list_resources: Called without arguments, returns an iterable of resources.
+        """
+
+        with self.__lock:
+            self.__writes = []
+        resources = None
+        try:
+            resources = list(list_resources())
+        finally:
+            with self.__lock:
+                writes, self.__writes = self.__writes, None
+                if resources is not None:
+                    self.__by_id.clear()
+                    self.__by_name.clear()
+                    self.__by_group.clear()
+                    for resource in resources:
+                        self.__add(resource)
+                    for resource_id, resource in writes:
+                        self.__discard(resource_id)
+                        if resource is not None:
+                            self.__add(resource)
+
+    def put(self, resource):
+        """
+        Add a resource, or replace the resource with the same id.
+
+        :param resource: Resource as returned by the API.
+        """
+
+        with self.__lock:
+            self.__discard(resource['id'])
+            self.__add(resource)
+            if self.__writes is not None:
+                self.__writes.append((resource['id'], resource))
+
+    def remove(self, resource_id):
+        """
+        :param str resource_id: The id of the removed resource, ignored if unknown.
+        """
+
+        with self.__lock:
+            self.__discard(resource_id)
+            if self.__writes is not None:
+                self.__writes.append((resource_id, None))
+
+    def __add(self, resource):
+        resource_id = resource['id']
+        self.__by_id[resource_id] = resource
+        for index, key in ((self.__by_name, resource.get('name')), (self.__by_group, resource.get('group_id'))):
+            if key is not None:
+                index.setdefault(key, []).append(resource_id)
+
+    def __discard(self, resource_id):
+        resource = self.__by_id.pop(resource_id, None)
+        if resource is None:
+            return
+        for index, key in ((self.__by_name, resource.get('name')), (self.__by_group, resource.get('group_id'))):
+            ids = index.get(key)
+            if ids is None:
+                continue
+            ids.remove(resource_id)
+            if not ids:
+                del index[key]
+
+
+class PageMirror(object):
+    """
+    Components, incidents and custom metrics of a page, loaded once and kept current from the
+    responses of the write calls made through the services of the client.
+
+    Changes made by other clients or in the web interface are only seen after :meth:`refresh`.
+
+    Usage::
+
+      >>> client.mirror.components.find('EU API')
+      >>> client.mirror.components.in_group('<GROUP_COMPONENT_ID>')
+      >>> client.mirror.incidents.get('<INCIDENT_ID>')
+
+    Normally you won't instantiate this class directly, use :attr:`statuspageio.Client.mirror`.
+
+    :attribute :class:`ResourceIndex <ResourceIndex>` components: Components of the page.
+    :attribute :class:`ResourceIndex <ResourceIndex>` incidents: Incidents of the page, scheduled ones included.
+    :attribute :class:`ResourceIndex <ResourceIndex>` metrics: Custom metrics of every linked metrics provider.
+    """
+
+    def __init__(self, client):
+        """
+        :param :class:`statuspageio.Client` client: Client whose services are mirrored.
+        """
+
+        self.client = client
+        self.components = ResourceIndex()
+        self.incidents = ResourceIndex()
+        self.metrics = ResourceIndex()
+        self.__lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reload every collection from the API. Writes made through the client meanwhile are kept.
+        """
+
+        client = self.client
+        with self.__lock:
+            self.components.reload(client.components.list)
+            self.incidents.reload(client.incidents.iter_all)
+            self.metrics.reload(lambda: [metric for provider in client.metrics.list_linked()
+                                         for metric in client.metrics.list_metrics_for_provider(provider['id'])])
@@ -0,0 +1,205 @@
+"""
+Compact response records, an alternative to recursive :func:`munch.munchify`.
+
+Records keep a reference to the decoded json dictionary instead of copying it, and wrap nested
+dictionaries and lists only when they are accessed. Attribute and item access behave like
+:class:`munch.Munch`, so code written against the default response mode keeps working.
+"""
+
+
+class Record(object):
+    """
+    Attribute-style view over a json object.
+
+    :attribute tuple FIELDS: Documented attributes of the resource, missing ones read as ``None``.
+    :attribute dict NESTED: Mapping of attribute names to the record class of their nested objects.
+    """
+
+    __slots__ = ('_data', '_decoded')
+
+    FIELDS = ()
+    NESTED = {}
+
+    def __init__(self, data):
+        """
+        :param dict data: Json decoded object, kept by reference.
+        """
+
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_decoded', None)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            if name in self.FIELDS:
+                return None
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __getitem__(self, name):
+        value = self._data[name]
+        if not isinstance(value, (dict, list)):
+            return value
+
+        decoded = self._decoded
+        if decoded is None:
+            decoded = {}
+            object.__setattr__(self, '_decoded', decoded)
+        if name not in decoded:
+            decoded[name] = decode(value, self.NESTED.get(name, Record))
+        return decoded[name]
+
+    def __setitem__(self, name, value):
+        self._data[name] = value
+        if self._decoded is not None:
+            self._decoded.pop(name, None)
+
+    def __delitem__(self, name):
+        del self._data[name]
+        if self._decoded is not None:
+            self._decoded.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))) | set(self.FIELDS) | set(self._data))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self._data)
+
+    def __reduce__(self):
+        return (type(self), (dict(self._data),))
+
+    def get(self, name, default=None):
+        return self[name] if name in self._data else default
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return [self[name] for name in self._data]
+
+    def items(self):
+        return [(name, self[name]) for name in self._data]
+
+    def to_dict(self):
+        """
+        Plain dictionary with the current content of the record.
+
+        :rtype: dict
+        """
+
+        return self._data
+
+    toDict = to_dict
+
+
+class Component(Record):
+    __slots__ = ()
+    FIELDS = ('id', 'page_id', 'group_id', 'name', 'description', 'status', 'position',
+              'showcase', 'created_at', 'updated_at')
+
+
+class IncidentUpdate(Record):
+    __slots__ = ()
+    FIELDS = ('id', 'incident_id', 'status', 'body', 'display_at', 'twitter_updated_at',
+              'wants_twitter_update', 'affected_components', 'created_at', 'updated_at')
+
+
+class Incident(Record):
+    __slots__ = ()
+    FIELDS = ('id', 'page_id', 'name', 'status', 'impact', 'impact_override', 'shortlink',
+              'postmortem_body', 'scheduled_for', 'scheduled_until', 'scheduled_remind_prior',
+              'scheduled_auto_in_progress', 'scheduled_auto_completed', 'monitoring_at',
+              'resolved_at', 'components', 'incident_updates', 'created_at', 'updated_at')
+    NESTED = {'components': Component, 'incident_updates': IncidentUpdate}
+
+
+class Subscriber(Record):
+    __slots__ = ()
+    FIELDS = ('id', 'email', 'phone_number', 'phone_country', 'display_phone_number', 'endpoint',
+              'mode', 'skip_confirmation_notification', 'quarantined_at', 'purge_at',
+              'created_at', 'updated_at')
+
+
+class Metric(Record):
+    __slots__ = ()
+    FIELDS = ('id', 'metrics_provider_id', 'metric_identifier', 'name', 'display', 'tooltip_description',
+              'backfilled', 'y_axis_min', 'y_axis_max', 'y_axis_hidden', 'suffix', 'decimal_places',
+              'most_recent_data_at', 'last_fetched_at', 'created_at', 'updated_at')
+
+
+class User(Record):
+    __slots__ = ()
+    FIELDS = ('id', 'organization_id', 'email', 'first_name', 'last_name', 'created_at', 'updated_at')
+
+
+"""
+Record class of every resource collection of the API.
+"""
+MODELS = {
+    'components': Component,
+    'incidents': Incident,
+    'subscribers': Subscriber,
+    'metrics': Metric,
+    'users': User,
+}
+
+
+def model_for(path):
+    """
+    Find the record class matching the resource a sub URL points to.
+
+    :param str path: Sub URL of the request, e.g. ``/pages/{page_id}/components/{component_id}.json``.
+    :return: Record class, :class:`Record <Record>` for resources without a dedicated one.
+    """
+
+    segments = path.rsplit('.json', 1)[0].strip('/').split('/')
+    if segments[-1] in MODELS:
+        return MODELS[segments[-1]]
+    if len(segments) > 1 and segments[-2] in MODELS and segments[-1] != 'data':
+        return MODELS[segments[-2]]
+    return Record
+
+
+def decode(payload, model=Record):
+    """
+    Wrap json decoded payload into records. Only the top level is wrapped, nested values on access.
+
+    :param payload: Json decoded object or list of objects.
+    :param model: (optional) Record class of the objects. Default: :class:`Record <Record>`.
+    """
+
+    if isinstance(payload, dict):
+        return model(payload)
+    if isinstance(payload, list):
+        return [decode(item, model) for item in payload]
+    return payload
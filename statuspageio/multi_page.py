@@ -0,0 +1,220 @@
+import threading
+from collections import OrderedDict
+
+from statuspageio.batch import BatchResult
+from statuspageio.configuration import Configuration
+from statuspageio.http_client import HttpClient
+import statuspageio.services
+
+
+class PageClient(object):
+    """
+    Page scoped services of a :class:`MultiPageClient <MultiPageClient>`.
+
+    Services are built on first access and share the http client (and connection pool)
+    of the multi-page client.
+
+    Normally you won't instantiate this class directly, use :meth:`MultiPageClient.page`.
+    """
+
+    def __init__(self, http_client, page_id):
+        """
+        :param :class:`statuspageio.HttpClient` http_client: Shared http client.
+        :param str page_id: The page managed by these services.
+        """
+
+        self.http_client = http_client
+        self.page_id = page_id
+        self.__services = {}
+        self.__lock = threading.Lock()
+
+    def __service(self, service_class):
+        service = self.__services.get(service_class)
+        if service is None:
+            with self.__lock:
+                service = self.__services.get(service_class)
+                if service is None:
+                    service = self.__services[service_class] = service_class(self.http_client, self.page_id)
+        return service
+
+    @property
+    def pages(self):
+        return self.__service(statuspageio.services.PageService)
+
+    @property
+    def components(self):
+        return self.__service(statuspageio.services.ComponentsService)
+
+    @property
+    def incidents(self):
+        return self.__service(statuspageio.services.IncidentsService)
+
+    @property
+    def subscribers(self):
+        return self.__service(statuspageio.services.SubscribersService)
+
+    @property
+    def metrics(self):
+        return self.__service(statuspageio.services.MetricsService)
+
+
+class MultiPageClient(object):
+    """
+    The :class:`MultiPageClient <MultiPageClient>` manages many status pages of one account
+    through a single configuration and a single pooled :class:`HttpClient <statuspageio.HttpClient>`.
+
+    Usage::
+
+      >>> multi = statuspageio.MultiPageClient(api_key='<YOUR_PERSONAL_API_KEY>', page_ids=['<PAGE_A>', '<PAGE_B>'])
+      >>> multi.page('<PAGE_A>').components.list()
+      >>> multi.list_unresolved_incidents()
+
+    :attribute :class:`Configuration <statuspageio.Configuration>` config: Current StatusPage.io client configuration.
+    :attribute :class:`HttpClient <statuspageio.HttpClient>` http_client: Http client shared by every page.
+    :attribute list page_ids: Pages fanned out to by default.
+    """
+
+    def __init__(self, **options):
+        """
+        Accepts the options of :class:`statuspageio.Client`, with ``page_ids`` instead of ``page_id``.
+
+        :param list page_ids: (optional) Pages the fan-out helpers run against. Default: ``[]``.
+        :param int max_workers: (optional) Maximum number of concurrent per-page calls. Default: **8**.
+        :raises ConfigurationError: if configuration is invalid, see :class:`statuspageio.Client`.
+        """
+
+        self.max_workers = options.pop('max_workers', 8)
+        self.config = Configuration(**options)
+        self.config.validate(page_required=False)
+
+        self.http_client = HttpClient(self.config)
+        self.organization_id = self.config.organization_id
+        self.page_ids = self.config.page_ids or ([self.config.page_id] if self.config.page_id else [])
+
+        self.__pages = {}
+        self.__users = None
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Release the pooled connections shared by every page.
+        """
+
+        self.http_client.close()
+
+    @property
+    def stats(self):
+        """
+        Request statistics, ``None`` unless the ``stats`` option is set.
+
+        :rtype: :class:`statuspageio.StatsCollector`
+        """
+
+        return self.http_client.stats
+
+    def page(self, page_id):
+        """
+        Services of a single page, built lazily and cached.
+
+        :param str page_id: The page to manage, not necessarily one of :attr:`page_ids`.
+        :rtype: :class:`PageClient <PageClient>`
+        """
+
+        page = self.__pages.get(page_id)
+        if page is None:
+            with self.__lock:
+                page = self.__pages.get(page_id)
+                if page is None:
+                    page = self.__pages[page_id] = PageClient(self.http_client, page_id)
+        return page
+
+    @property
+    def users(self):
+        if self.__users is None:
+            with self.__lock:
+                if self.__users is None:
+                    self.__users = statuspageio.services.UsersService(self.http_client, self.organization_id)
+        return self.__users
+
+    def fan_out(self, action, page_ids=None, max_workers=None):
+        """
+        Call ``action`` for every page concurrently.
+
+        Usage::
+
+          >>> multi.fan_out(lambda page: page.components.list())
+          OrderedDict([('<PAGE_A>', <BatchResult value=[...]>), ('<PAGE_B>', <BatchResult error=...>)])
+
+        :param callable action: Called with the :class:`PageClient <PageClient>` of each page.
+        :param list page_ids: (optional) Pages to call. Default: :attr:`page_ids`.
+        :param int max_workers: (optional) Maximum number of concurrent calls. Default: ``max_workers`` option.
+        :return: Ordered mapping of page id to :class:`BatchResult <statuspageio.BatchResult>`.
+        :rtype: :class:`collections.OrderedDict`
+        """
+
+        page_ids = self.page_ids if page_ids is None else page_ids
+        results = OrderedDict()
+        if not page_ids:
+            return results
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(max_workers or self.max_workers, len(page_ids))) as executor:
+            futures = [(page_id, executor.submit(action, self.page(page_id))) for page_id in page_ids]
+
+        for page_id, future in futures:
+            error = future.exception()
+            results[page_id] = BatchResult(error=error) if error is not None else BatchResult(future.result())
+        return results
+
+    def merge(self, action, page_ids=None):
+        """
+        Fan out ``action`` and concatenate the lists it returns, in page order.
+
+        :param callable action: Called with the :class:`PageClient <PageClient>` of each page, returns a list.
+        :param list page_ids: (optional) Pages to call. Default: :attr:`page_ids`.
+        :raises Exception: the first error raised by a page call, once every call completed.
+        :rtype: list
+        """
+
+        merged = []
+        for result in self.fan_out(action, page_ids).values():
+            if not result.ok:
+                raise result.error
+            merged.extend(result.value)
+        return merged
+
+    def list_components(self, page_ids=None):
+        """
+        List components of every page
+
+        :calls: ``get pages/{page_id}/components.json`` for every page, concurrently
+        :rtype: list
+        """
+
+        return self.merge(lambda page: page.components.list(), page_ids)
+
+    def list_unresolved_incidents(self, page_ids=None):
+        """
+        List unresolved incidents of every page
+
+        :calls: ``get pages/{page_id}/incidents/unresolved.json`` for every page, concurrently
+        :rtype: list
+        """
+
+        return self.merge(lambda page: page.incidents.list_unresolved(), page_ids)
+
+    def list_scheduled_incidents(self, page_ids=None):
+        """
+        List scheduled incidents of every page
+
+        :calls: ``get pages/{page_id}/incidents/scheduled.json`` for every page, concurrently
+        :rtype: list
+        """
+
+        return self.merge(lambda page: page.incidents.list_scheduled(), page_ids)
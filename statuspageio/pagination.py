@@ -0,0 +1,78 @@
+import threading
+
+
+class PageFetcher(threading.Thread):
+    """
+    Fetches a single page in the background, keeping either its items or the raised exception.
+    """
+
+    def __init__(self, fetch, page, per_page):
+        super(PageFetcher, self).__init__(name='statuspageio-page-{0}'.format(page))
+        self.daemon = True
+        self.fetch = fetch
+        self.page = page
+        self.per_page = per_page
+        self.items = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.items = self.fetch(self.page, self.per_page)
+        except Exception as e:
+            self.error = e
+
+    def result(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.items
+
+
+def paginate(fetch, per_page=100, prefetch=False, start_page=1):
+    """
+    Lazily walk a ``page``/``per_page`` paginated endpoint, yielding one item at a time.
+
+    Pages are requested on demand and iteration stops at the first page holding less than
+    ``per_page`` items, or at a page identical to the previous one: an endpoint ignoring ``page``
+    answers every request with its first page, which would otherwise be walked forever.
+    Only the current and the previous page (and the next one, with ``prefetch``) are kept in memory.
+
+    :param callable fetch: Called with ``(page, per_page)``, returns the list of items of that page.
+    :param int per_page: (optional) Number of items requested per page. Default: **100**.
+    :param bool prefetch: (optional) Whether to request the next page in a background thread
+                          while the current one is consumed. Default: ``False``.
+    :param int start_page: (optional) Number of the first page to fetch. Default: **1**.
+    :return: Generator of items.
+    """
+
+    page = start_page
+    previous = None
+    if not prefetch:
+        while True:
+            items = fetch(page, per_page)
+            if items == previous:
+                return
+            for item in items:
+                yield item
+            if len(items) < per_page:
+                return
+            previous = items
+            page += 1
+
+    pending = PageFetcher(fetch, page, per_page)
+    pending.start()
+    while True:
+        items = pending.result()
+        if items == previous:
+            return
+        if len(items) < per_page:
+            for item in items:
+                yield item
+            return
+
+        page += 1
+        pending = PageFetcher(fetch, page, per_page)
+        pending.start()
+        for item in items:
+            yield item
+        previous = items
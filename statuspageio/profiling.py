@@ -0,0 +1,123 @@
+from statuspageio.instrumentation import endpoint_template
+
+
+class Profile(object):
+    """
+    Where the time of a single request went, phase by phase.
+
+    Phases, in seconds:
+
+    * ``encode``: building headers and json encoding the body.
+    * ``pacing``: waiting for the rate limiter.
+    * ``transport``: from sending the request until the response headers were parsed - DNS, connect,
+      TLS handshake and server time, as reported by ``requests`` in ``Response.elapsed``.
+    * ``read``: downloading the response content.
+    * ``backoff``: sleeping between retried attempts.
+    * ``parse``: json decoding the content.
+    * ``build``: unwrapping the envelope and munchifying, or wrapping into records.
+
+    :attribute str method: Http method, upper case.
+    :attribute str endpoint: Sub URL with ids replaced by placeholders.
+    :attribute dict phases: Seconds spent in every phase.
+    :attribute int response_bytes: Size of the response content.
+    :attribute bool cached: Whether the response was served from the :class:`statuspageio.ResponseCache`.
+    """
+
+    """
+    Phases of a request, in the order they happen.
+    """
+    PHASES = ('encode', 'pacing', 'transport', 'read', 'backoff', 'parse', 'build')
+
+    def __init__(self, method, path):
+        self.method = method.upper()
+        self.path = path
+        self.endpoint = endpoint_template(path)
+        self.phases = dict.fromkeys(self.PHASES, 0.0)
+        self.response_bytes = 0
+        self.cached = False
+
+    def add(self, phase, seconds):
+        """
+        Account ``seconds`` to ``phase``. Phases of retried attempts add up.
+        """
+
+        self.phases[phase] += seconds
+
+    @property
+    def total(self):
+        """
+        Seconds spent in all phases.
+
+        :rtype: float
+        """
+
+        return sum(self.phases.values())
+
+    @property
+    def network(self):
+        """
+        Seconds spent waiting on the network: ``pacing``, ``transport``, ``read`` and ``backoff``.
+
+        :rtype: float
+        """
+
+        return sum(self.phases[phase] for phase in ('pacing', 'transport', 'read', 'backoff'))
+
+    @property
+    def processing(self):
+        """
+        Seconds spent handling payloads in process: ``encode``, ``parse`` and ``build``.
+
+        :rtype: float
+        """
+
+        return sum(self.phases[phase] for phase in ('encode', 'parse', 'build'))
+
+    def as_dict(self):
+        """
+        :rtype: dict
+        """
+
+        result = dict(self.phases)
+        result.update(method=self.method, endpoint=self.endpoint, total=self.total,
+                      response_bytes=self.response_bytes, cached=self.cached)
+        return result
+
+    def __repr__(self):
+        return '<Profile {0} {1} total={2:.4f} {3}>'.format(
+            self.method, self.endpoint, self.total,
+            ' '.join('{0}={1:.4f}'.format(phase, self.phases[phase]) for phase in self.PHASES))
+
+
+class Profiler(object):
+    """
+    Decides which requests get a :class:`Profile <Profile>` and hands completed ones to a callback.
+
+    Normally you won't instantiate this class directly, :class:`statuspageio.HttpClient` builds one
+    when the ``profile`` option is set.
+    """
+
+    def __init__(self, callback=None, sample_rate=1.0):
+        """
+        :param callable callback: (optional) Called with every completed :class:`Profile <Profile>`.
+        :param float sample_rate: (optional) Fraction of requests profiled, between 0 and 1. Default: **1**.
+        """
+
+        self.callback = callback
+        self.sample_rate = sample_rate
+
+    def start(self, method, path):
+        """
+        :return: A new profile, or ``None`` if the request is not sampled.
+        :rtype: :class:`Profile <Profile>`
+        """
+
+        if self.sample_rate < 1:
+            import random
+            if random.random() >= self.sample_rate:
+                return None
+        return Profile(method, path)
+
+    def finish(self, profile):
+        if self.callback is not None:
+            self.callback(profile)
@@ -0,0 +1,116 @@
+import threading
+import time
+
+try:
+    monotonic = time.monotonic
+except AttributeError:
+    # Python 2
+    monotonic = time.time
+
+
+"""
+Http status codes the API uses to signal an exceeded rate limit.
+"""
+RATE_LIMIT_STATUSES = (420, 429)
+
+
+class TokenBucket(object):
+    """
+    Thread safe token bucket pacing outgoing requests.
+
+    Implemented as a virtual scheduler: every :meth:`acquire` reserves the next free slot and sleeps
+    until it comes, so callers are queued in arrival order instead of failing. Up to ``burst``
+    requests may go out back to back, after that requests are spaced ``1 / rate`` seconds apart.
+
+    Normally you won't instantiate this class directly, :class:`statuspageio.HttpClient` builds one
+    when ``rate_limit`` is configured and shares it with every service of the client.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        :param float rate: Sustained number of requests per second.
+        :param int burst: (optional) Number of requests allowed back to back. Default: **1**.
+        """
+
+        self.interval = 1.0 / rate
+        self.tolerance = (max(burst, 1) - 1) * self.interval
+        self.__lock = threading.Lock()
+        self.__tat = monotonic()
+
+    def acquire(self):
+        """
+        Block until the caller may send a request.
+
+        :return: Seconds spent waiting.
+        :rtype: float
+        """
+
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reserve(self):
+        """
+        Reserve the next free slot without waiting for it, for callers sleeping on their own,
+        e.g. with :func:`asyncio.sleep`.
+
+        :return: Seconds to wait before sending the request.
+        :rtype: float
+        """
+
+        with self.__lock:
+            now = monotonic()
+            tat = max(self.__tat, now)
+            wait = max(0.0, tat - self.tolerance - now)
+            self.__tat = tat + self.interval
+        return wait
+
+    def pause(self, seconds):
+        """
+        Hold every request for ``seconds``, e.g. as asked by a ``Retry-After`` header.
+        Requests resume one at a time, spaced by the configured rate.
+
+        :param float seconds: Seconds to wait before the next request goes out.
+        """
+
+        with self.__lock:
+            self.__tat = max(self.__tat, monotonic() + seconds + self.tolerance)
+
+
+def retry_after(headers):
+    """
+    Extract from response headers how long the server asks us to wait.
+
+    Understands ``Retry-After`` (delta seconds or http date) and, when no quota is left,
+    ``X-RateLimit-Reset`` (unix timestamp or delta seconds).
+
+    :param headers: Response headers (case insensitive mapping).
+    :return: Seconds to wait or ``None`` if the headers do not ask for a pause.
+    :rtype: float
+    """
+
+    value = headers.get('Retry-After')
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            import calendar
+            from email.utils import parsedate
+            date = parsedate(value)
+            if date is not None:
+                return max(0.0, calendar.timegm(date) - time.time())
+
+    remaining = headers.get('X-RateLimit-Remaining')
+    reset = headers.get('X-RateLimit-Reset')
+    if remaining is not None and reset is not None:
+        try:
+            if int(remaining) > 0:
+                return None
+            reset = float(reset)
+        except ValueError:
+            return None
+        # large values are absolute unix timestamps, small ones are delta seconds
+        return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+    return None
@@ -0,0 +1,206 @@
+import threading
+
+
+class SyncReport(object):
+    """
+    Outcome of :meth:`statuspageio.ComponentsService.sync`.
+
+    :attribute list created: Components created, as returned by the API.
+    :attribute list updated: Components updated, as returned by the API.
+    :attribute list deleted: Ids of deleted components.
+    :attribute list unchanged: Ids of components already in the desired state.
+    :attribute list errors: Tuples of ``(key, exception)`` for failed calls.
+    """
+
+    def __init__(self):
+        self.created = []
+        self.updated = []
+        self.deleted = []
+        self.unchanged = []
+        self.errors = []
+
+    @property
+    def changed(self):
+        """
+        Whether any call was issued and succeeded.
+
+        :rtype: bool
+        """
+
+        return bool(self.created or self.updated or self.deleted)
+
+    def __repr__(self):
+        return '<SyncReport created={0} updated={1} deleted={2} unchanged={3} errors={4}>'.format(
+            len(self.created), len(self.updated), len(self.deleted), len(self.unchanged), len(self.errors))
+
+
+def as_dict(resource):
+    """
+    Shallow plain dictionary of a resource in any response mode (munch, record or raw).
+
+    :rtype: dict
+    """
+
+    return dict((key, resource[key]) for key in resource)
+
+
+def plan(snapshot, desired, persisted_keys, delete_missing=False):
+    """
+    Compute the minimal set of calls turning ``snapshot`` into ``desired``.
+
+    :param dict snapshot: Mapping of id to current attributes.
+    :param dict desired: Mapping of id or name to desired attributes.
+    :param list persisted_keys: Attributes the API allows to write.
+    :param bool delete_missing: Whether resources not in ``desired`` are deleted.
+    :return: Tuple of ``(creates, updates, deletes, unchanged)``: lists of ``(key, attributes)``,
+             ``(id, changed attributes)``, ids and ids.
+    :rtype: tuple
+    """
+
+    by_name = dict((current.get('name'), resource_id) for resource_id, current in snapshot.items())
+    creates, updates, unchanged, matched = [], [], [], set()
+
+    for key, attributes in desired.items():
+        attributes = dict((k, v) for k, v in attributes.items() if k in persisted_keys)
+        resource_id = key if key in snapshot else by_name.get(key)
+
+        if resource_id is None:
+            attributes.setdefault('name', key)
+            creates.append((key, attributes))
+            continue
+
+        matched.add(resource_id)
+        current = snapshot[resource_id]
+        changes = dict((k, v) for k, v in attributes.items() if current.get(k) != v)
+        if changes:
+            updates.append((resource_id, changes))
+        else:
+            unchanged.append(resource_id)
+
+    deletes = [resource_id for resource_id in snapshot if resource_id not in matched] if delete_missing else []
+
+    return creates, updates, deletes, unchanged
+
+
+class Reconciler(object):
+    """
+    Keeps a snapshot of a resource collection and plans the fewest calls applying desired states.
+
+    The service reports its own writes through :meth:`put` and :meth:`remove`, so resources created,
+    updated or deleted inside or outside of :meth:`sync` keep the snapshot current. The blocking
+    :meth:`sync` and the one of :class:`statuspageio.aio.AsyncComponentsService` both plan with
+    :meth:`calls` and fill the report with :meth:`record`, they only differ in how the calls run.
+
+    Normally you won't instantiate this class directly, it backs :meth:`statuspageio.ComponentsService.sync`.
+    """
+
+    def __init__(self, service):
+        """
+        :param service: Service exposing ``list``, ``create``, ``update`` and ``delete``.
+        """
+
+        self.service = service
+        self.snapshot = None
+        self.__lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reload the snapshot from the API.
+        """
+
+        self.load(self.service.list())
+
+    def load(self, resources):
+        """
+        Replace the snapshot with a listing of the collection.
+
+        :param list resources: Resources as returned by the API.
+        """
+
+        snapshot = dict((resource['id'], as_dict(resource)) for resource in resources)
+        with self.__lock:
+            self.snapshot = snapshot
+
+    def put(self, resource):
+        """
+        Record a created or updated resource, as returned by the API. Ignored until the snapshot is loaded.
+        """
+
+        with self.__lock:
+            if self.snapshot is not None:
+                self.snapshot[resource['id']] = as_dict(resource)
+
+    def remove(self, resource_id):
+        """
+        Forget a deleted resource.
+        """
+
+        with self.__lock:
+            if self.snapshot is not None:
+                self.snapshot.pop(resource_id, None)
+
+    def calls(self, desired, delete_missing=False):
+        """
+        Plan the calls turning the loaded snapshot into ``desired``.
+
+        :return: Tuple of ``(report, calls)``: the :class:`SyncReport <SyncReport>` to fill, listing the unchanged
+                 resources already, and a list of ``(key, action, args, kwargs)`` where ``action`` is the service
+                 method to call: ``'create'``, ``'update'`` or ``'delete'``.
+        :rtype: tuple
+        """
+
+        with self.__lock:
+            creates, updates, deletes, unchanged = plan(self.snapshot, desired,
+                                                        self.service.OPTS_KEYS_TO_PERSIST, delete_missing)
+
+        report = SyncReport()
+        report.unchanged.extend(unchanged)
+        calls = ([(key, 'create', (), attributes) for key, attributes in creates] +
+                 [(resource_id, 'update', (resource_id,), changes) for resource_id, changes in updates] +
+                 [(resource_id, 'delete', (resource_id,), {}) for resource_id in deletes])
+        return report, calls
+
+    def record(self, report, key, action, result):
+        """
+        Add the outcome of a planned call to the report.
+
+        :param report: :class:`SyncReport <SyncReport>` returned by :meth:`calls`.
+        :param key: Key of the call.
+        :param str action: Action of the call.
+        :param result: Resource returned by the call, or the exception it raised.
+        """
+
+        with self.__lock:
+            if isinstance(result, Exception):
+                report.errors.append((key, result))
+            elif action == 'create':
+                report.created.append(result)
+            elif action == 'update':
+                report.updated.append(result)
+            else:
+                report.deleted.append(key)
+
+    def sync(self, desired, delete_missing=False, refresh=False, max_workers=8):
+        """
+        See :meth:`statuspageio.ComponentsService.sync`.
+
+        :rtype: :class:`SyncReport <SyncReport>`
+        """
+
+        if refresh or self.snapshot is None:
+            self.refresh()
+
+        report, calls = self.calls(desired, delete_missing)
+        if not calls:
+            return report
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [(key, action, executor.submit(getattr(self.service, action), *args, **kwargs))
+                       for key, action, args, kwargs in calls]
+
+        for key, action, future in futures:
+            error = future.exception()
+            self.record(report, key, action, error if error is not None else future.result())
+
+        return report
@@ -0,0 +1,106 @@
+class RetryPolicy(object):
+    """
+    Describes when and how :class:`statuspageio.HttpClient` retries a failed request.
+
+    A request is retried when the server answers with one of ``statuses`` or the transport fails
+    (connection reset, timeout...), as long as the http method is safe to repeat and attempts are left.
+    Between attempts the client sleeps an exponentially growing, jittered delay, or longer if the
+    response carries a ``Retry-After`` header. A response asking to wait more than ``max_backoff``
+    is not retried.
+
+    Usage::
+
+      >>> client = statuspageio.Client(api_key='...', page_id='...',
+      ...                              retry=statuspageio.RetryPolicy(max_attempts=5, retry_non_idempotent=True))
+    """
+
+    """
+    Methods that can be repeated without side effects.
+    """
+    IDEMPOTENT_METHODS = frozenset(['get', 'head', 'options', 'put', 'delete'])
+
+    """
+    Http statuses hinting at a transient backend failure.
+    """
+    RETRY_STATUSES = frozenset([500, 502, 503, 504])
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30.0, jitter=True,
+                 statuses=RETRY_STATUSES, retry_non_idempotent=False):
+        """
+        :param int max_attempts: (optional) Total attempts including the first one, ``1`` disables retries. Default: **3**.
+        :param float backoff_factor: (optional) Base delay, doubled on every attempt. Default: **0.5** seconds.
+        :param float max_backoff: (optional) Upper bound of a single delay. Default: **30** seconds.
+        :param bool jitter: (optional) Whether to pick a random delay up to the exponential one ("full jitter"),
+                            spreading retries of concurrent callers. Default: ``True``.
+        :param iterable statuses: (optional) Http statuses to retry. Default: **500, 502, 503, 504**.
+        :param bool retry_non_idempotent: (optional) Whether POST and PATCH are retried as well.
+                                          They may create duplicates if the first attempt did reach the server.
+                                          Default: ``False``.
+        """
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def should_retry(self, method, attempt, status_code=None, retry_after=None):
+        """
+        Decide whether a request gets another attempt.
+
+        :param str method: Http method of the request.
+        :param int attempt: Number of the attempt which just finished, starting at 1.
+        :param int status_code: (optional) Http status of the response, ``None`` when the transport failed.
+        :param float retry_after: (optional) Seconds the response asked to wait, see
+                                  :func:`statuspageio.rate_limit.retry_after`.
+        :rtype: bool
+        """
+
+        if attempt >= self.max_attempts:
+            return False
+        if status_code is not None and status_code not in self.statuses:
+            return False
+        if retry_after is not None and retry_after > self.max_backoff:
+            return False
+        return self.retry_non_idempotent or method.lower() in self.IDEMPOTENT_METHODS
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Delay to sleep before the next attempt, never more than ``max_backoff``.
+
+        :param int attempt: Number of the attempt which just finished, starting at 1.
+        :param float retry_after: (optional) Seconds the response asked to wait, a lower bound of the delay.
+        :rtype: float
+        """
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            import random
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = min(self.max_backoff, max(delay, retry_after))
+        return delay
+
+
+class Attempt(object):
+    """
+    Timing of a single attempt of a request.
+
+    :attribute int number: Attempt number, starting at 1.
+    :attribute float elapsed: Seconds spent on the attempt, including rate limit pacing.
+    :attribute int status_code: Http status of the response, ``None`` when the transport failed.
+    :attribute Exception error: Transport error, ``None`` when a response was received.
+    :attribute float delay: Seconds slept before the next attempt, ``0`` for the last one.
+    """
+
+    def __init__(self, number, elapsed, status_code=None, error=None):
+        self.number = number
+        self.elapsed = elapsed
+        self.status_code = status_code
+        self.error = error
+        self.delay = 0.0
+
+    def __repr__(self):
+        return '<Attempt number={0} elapsed={1:.3f} status_code={2} error={3!r} delay={4:.3f}>'.format(
+            self.number, self.elapsed, self.status_code, self.error, self.delay)
@@ -1,5 +1,12 @@
 
 from statuspageio.errors import ConfigurationError
+from statuspageio.export import export_records
+from statuspageio.incident_coalescer import IncidentUpdateCoalescer
+from statuspageio.metrics_backfill import MetricsBackfill
+from statuspageio.metrics_batcher import MetricsBatcher
+from statuspageio.pagination import paginate
+from statuspageio.reconcile import Reconciler
+from statuspageio.subscriber_import import SubscriberImporter
 
 
 class PageService(object):
@@ -12,6 +19,31 @@ class PageService(object):
 
     OPTS_KEYS_TO_PERSIST = ['name', 'url', 'notifications_from_email', ]
 
+    UPDATE_OPTS_KEYS_TO_PERSIST = [
+        'name',
+        'url',
+        'notifications_from_email',
+        'time_zone',
+        'city',
+        'state',
+        'country',
+        'subdomain',
+        'domain',
+        'layout',
+        'allow_email_subscribers',
+        'allow_incident_subscribers',
+        'allow_page_subscribers',
+        'allow_sms_subscribers',
+        'hero_cover_url',
+        'transactional_logo_url',
+        'css_body_background_color',
+        'css_font_color',
+        'css_light_font_color',
+        'css_greens',
+        'css_oranges',
+        'css_reds',
+        'css_yellows']
+
     def __init__(self, http_client, page_id):
         """
         :param :class:`statuspageio.HttpClient` http_client: Pre configured high-level http client.
@@ -56,36 +88,11 @@ class PageService(object):
         """
 
 
-        OPTS_KEYS_TO_PERSIST = [
-            'name',
-            'url',
-            'notifications_from_email',
-            'time_zone',
-            'city',
-            'state',
-            'country',
-            'subdomain',
-            'domain',
-            'layout',
-            'allow_email_subscribers',
-            'allow_incident_subscribers',
-            'allow_page_subscribers',
-            'allow_sms_subscribers',
-            'hero_cover_url',
-            'transactional_logo_url',
-            'css_body_background_color',
-            'css_font_color',
-            'css_light_font_color',
-            'css_greens',
-            'css_oranges',
-            'css_reds',
-            'css_yellows']
-
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.UPDATE_OPTS_KEYS_TO_PERSIST)
 
         page = self.http_client.patch('/pages/{page_id}.json'.format(page_id=self.page_id),
                                       container=self.container,
@@ -111,6 +118,10 @@ class ComponentsService(object):
         self.__http_client = http_client
         self.page_id = page_id
         self.container = 'component'
+        # index of statuspageio.Client.mirror kept current from the write responses, once loaded
+        self.mirror = None
+        # snapshot and plan of sync, kept current from the write responses as well
+        self.reconciler = Reconciler(self)
 
     @property
     def http_client(self):
@@ -152,12 +163,15 @@ class ComponentsService(object):
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
+        attributes = dict((k, v) for k, v in kwargs.items()
                           if k in self.OPTS_KEYS_TO_PERSIST)
 
         _, _, component = self.http_client.post(
             '/pages/{page_id}/components.json'.format(
                 page_id=self.page_id), container=self.container, body=attributes)
+        if self.mirror is not None:
+            self.mirror.put(component)
+        self.reconciler.put(component)
 
         return component
 
@@ -178,6 +192,9 @@ class ComponentsService(object):
         status_code, _, _ = self.http_client.delete(
             "/pages/{page_id}/components/{component_id}.json".format(
                 page_id=self.page_id, component_id=component_id))
+        if self.mirror is not None:
+            self.mirror.remove(component_id)
+        self.reconciler.remove(component_id)
         return status_code
 
 
@@ -199,14 +216,40 @@ class ComponentsService(object):
         if not kwargs:
             raise Exception('attributes for Contact are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
+        attributes = dict((k, v) for k, v in kwargs.items()
                           if k in self.OPTS_KEYS_TO_PERSIST)
 
         _, _, component = self.http_client.patch(
             "/pages/{page_id}/components/{component_id}.json".format(
                 page_id=self.page_id, component_id=component_id), container='component', body=attributes)
+        if self.mirror is not None:
+            self.mirror.put(component)
+        self.reconciler.put(component)
         return component
 
+    def sync(self, desired, delete_missing=False, refresh=False, max_workers=8):
+        """
+        Reconcile components with a desired state
+
+        Compares the desired state against a cached snapshot of the page components and issues
+        only the calls needed to reach it, concurrently: a POST for unknown components, a PATCH
+        carrying just the changed attributes for drifted ones and, with ``delete_missing``,
+        a DELETE for components absent from ``desired``. The snapshot is loaded with :meth:`list`
+        on first use and kept current from the responses of every :meth:`create`, :meth:`update`
+        and :meth:`delete` made through this service.
+
+        :calls: ``post``, ``patch`` and ``delete pages/{page_id}/components/{component_id}.json`` as needed
+        :param dict desired: Mapping of component id or name to attributes, e.g. ``{'EU API': {'status': 'major_outage'}}``.
+        :param bool delete_missing: (optional) Whether components not in ``desired`` are deleted. Default: ``False``.
+        :param bool refresh: (optional) Whether to reload the snapshot before comparing. Default: ``False``.
+        :param int max_workers: (optional) Maximum number of concurrent calls. Default: **8**.
+        :return: Report of created, updated, deleted and unchanged components and per-call errors.
+        :rtype: :class:`statuspageio.reconcile.SyncReport`
+        """
+
+        return self.reconciler.sync(desired, delete_missing=delete_missing,
+                                      refresh=refresh, max_workers=max_workers)
+
 class IncidentsService(object):
     """
     :class:`statuspageio.IncidentsService` is used by :class:`statuspageio.Client` to make
@@ -217,6 +260,35 @@ class IncidentsService(object):
 
     OPTS_KEYS_TO_PERSIST = ['name', 'description', 'group_id', 'status']
 
+    CREATE_OPTS_KEYS_TO_PERSIST = [
+        'name',
+        'status',
+        'message',
+        'wants_twitter_update',
+        'impact_override',
+        'component_ids']
+
+    CREATE_SCHEDULED_OPTS_KEYS_TO_PERSIST = [
+        'name',
+        'status',
+        'scheduled_for',
+        'scheduled_until',
+        'message',
+        'wants_twitter_update',
+        'scheduled_remind_prior',
+        'scheduled_auto_in_progress',
+        'scheduled_auto_completed',
+        'impact_override',
+        'component_ids']
+
+    UPDATE_OPTS_KEYS_TO_PERSIST = [
+        'name',
+        'status',
+        'message',
+        'wants_twitter_update',
+        'impact_override',
+        'component_ids']
+
     def __init__(self, http_client, page_id):
         """
         :param :class:`statuspageio.HttpClient` http_client: Pre configured high-level http client.
@@ -225,6 +297,8 @@ class IncidentsService(object):
         self.__http_client = http_client
         self.page_id = page_id
         self.container = 'incident'
+        # index of statuspageio.Client.mirror kept current from the write responses, once loaded
+        self.mirror = None
 
     @property
     def http_client(self):
@@ -243,6 +317,27 @@ class IncidentsService(object):
             '/pages/{page_id}/incidents.json'.format(page_id=self.page_id))
         return incidents
 
+    def iter_all(self, per_page=100, prefetch=False):
+        """
+        Iterate over all incidents
+
+        Walks the incidents page by page, so only one page is held in memory at a time.
+
+        :calls: ``get pages/{page_id}/incidents.json?page={page}&per_page={per_page}``
+        :param int per_page: (optional) Number of incidents requested per page. Default: **100**.
+        :param bool prefetch: (optional) Whether to fetch the next page in the background. Default: ``False``.
+        :return: Generator of dictionaries that support attriubte-style access and represent Incident resources.
+        :rtype: generator
+        """
+
+        def fetch(page, per_page):
+            _, _, incidents = self.http_client.get(
+                '/pages/{page_id}/incidents.json'.format(page_id=self.page_id),
+                params={'page': page, 'per_page': per_page})
+            return incidents
+
+        return paginate(fetch, per_page=per_page, prefetch=prefetch)
+
     def list_unresolved(self):
         """
         List unresolved incidents
@@ -278,23 +373,17 @@ class IncidentsService(object):
         :rtype: dict
         """
 
-        OPTS_KEYS_TO_PERSIST = [
-            'name',
-            'status',
-            'message',
-            'wants_twitter_update',
-            'impact_override',
-            'component_ids']
-
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
 
         _, _, component = self.http_client.post(
             '/pages/{page_id}/incidents.json'.format(
                 page_id=self.page_id), container=self.container, body=attributes)
+        if self.mirror is not None:
+            self.mirror.put(component)
 
         return component
 
@@ -308,27 +397,17 @@ class IncidentsService(object):
         :rtype: dict
         """
 
-        OPTS_KEYS_TO_PERSIST = [
-            'name',
-            'status',
-            'scheduled_for',
-            'scheduled_until',
-            'message',
-            'wants_twitter_update',
-            'scheduled_remind_prior',
-            'scheduled_auto_in_progress',
-            'scheduled_auto_completed',
-            'impact_override',
-            'component_ids']
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_SCHEDULED_OPTS_KEYS_TO_PERSIST)
 
         _, _, incident = self.http_client.post(
             '/pages/{page_id}/incidents.json'.format(
                 page_id=self.page_id), container=self.container, body=attributes)
+        if self.mirror is not None:
+            self.mirror.put(incident)
 
         return incident
 
@@ -344,6 +423,8 @@ class IncidentsService(object):
         status_code, _, _ = self.http_client.delete(
             "/pages/{page_id}/incidents/{incident_id}.json".format(
                 page_id=self.page_id, incident_id=incident_id))
+        if self.mirror is not None:
+            self.mirror.remove(incident_id)
         return status_code 
 
     def update(self, incident_id, **kwargs):
@@ -361,25 +442,30 @@ class IncidentsService(object):
         :rtype: string
 
         """
-        OPTS_KEYS_TO_PERSIST = [
-            'name',
-            'status',
-            'message',
-            'wants_twitter_update',
-            'impact_override',
-            'component_ids']
-
         if not kwargs:
             raise Exception('attributes for Contact are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.UPDATE_OPTS_KEYS_TO_PERSIST)
 
         _, _, component = self.http_client.patch(
             "/pages/{page_id}/incidents/{incident_id}.json".format(
                 page_id=self.page_id, incident_id=incident_id), container=self.container, body=attributes)
+        if self.mirror is not None:
+            self.mirror.put(component)
         return component
 
+    def coalescer(self, **options):
+        """
+        Build a :class:`statuspageio.IncidentUpdateCoalescer` which merges bursts of changes
+        to an incident into a single update, sent from a background thread.
+
+        :param dict **options: Options of :class:`statuspageio.IncidentUpdateCoalescer`.
+        :rtype: :class:`statuspageio.IncidentUpdateCoalescer`
+        """
+
+        return IncidentUpdateCoalescer(self, **options)
+
 class SubscribersService(object):
     """
     :class:`statuspageio.SubscribersService` is used by :class:`statuspageio.Client` to make
@@ -390,6 +476,14 @@ class SubscribersService(object):
     
     OPTS_KEYS_TO_PERSIST = ['name', 'description', 'group_id', 'status']
 
+    CREATE_OPTS_KEYS_TO_PERSIST = [
+        'email',
+        'phone_number',
+        'phone_country',
+        'endpoint',
+        'skip_confirmation_notification',
+        'page_access_user']
+
     def __init__(self, http_client, page_id):
         """
         :param :class:`statuspageio.HttpClient` http_client: Pre configured high-level http client.
@@ -417,6 +511,63 @@ class SubscribersService(object):
             '/pages/{page_id}/subscribers.json'.format(page_id=self.page_id))
         return subscribers
 
+    def stream(self, params=None):
+        """
+        Stream subscribers
+
+        Like :meth:`list`, but decodes the subscribers one by one while the response is received,
+        so memory stays bounded whatever the number of subscribers.
+
+        :calls: ``get /pages/[page_id]/subscribers.json``
+        :param dict params: (optional) Query parameters, e.g. ``{'page': 1, 'per_page': 1000}``.
+        :return: Generator of dictionaries that support attriubte-style access and represent Subscriber resources.
+        :rtype: generator
+        """
+
+        _, _, subscribers = self.http_client.get(
+            '/pages/{page_id}/subscribers.json'.format(page_id=self.page_id), params=params, stream=True)
+        return subscribers
+
+    def iter_all(self, per_page=100, prefetch=False):
+        """
+        Iterate over all subscribers
+
+        Walks the subscribers page by page, so only one page is held in memory at a time.
+
+        :calls: ``get /pages/[page_id]/subscribers.json?page=[page]&per_page=[per_page]``
+        :param int per_page: (optional) Number of subscribers requested per page. Default: **100**.
+        :param bool prefetch: (optional) Whether to fetch the next page in the background. Default: ``False``.
+        :return: Generator of dictionaries that support attriubte-style access and represent Subscriber resources.
+        :rtype: generator
+        """
+
+        def fetch(page, per_page):
+            _, _, subscribers = self.http_client.get(
+                '/pages/{page_id}/subscribers.json'.format(page_id=self.page_id),
+                params={'page': page, 'per_page': per_page})
+            return subscribers
+
+        return paginate(fetch, per_page=per_page, prefetch=prefetch)
+
+    def export(self, path, per_page=100, **options):
+        """
+        Export all subscribers
+
+        Writes the subscribers to a CSV, JSON Lines or Parquet file while walking them page by page,
+        so only the current and the next page are held in memory.
+
+        :calls: ``get /pages/[page_id]/subscribers.json?page=[page]&per_page=[per_page]``
+        :param str path: Output file, its extension selects the format unless ``format`` is given.
+        :param int per_page: (optional) Number of subscribers requested per page. Default: **100**.
+        :param dict **options: Options of :func:`statuspageio.export.export_records`, e.g. ``format``,
+                               ``columns``, ``progress`` or ``batch_size``.
+        :return: Number of written subscribers and throughput.
+        :rtype: :class:`statuspageio.ExportReport`
+        """
+
+        options.setdefault('codec', self.http_client.codec)
+        return export_records(self.iter_all(per_page=per_page, prefetch=True), path, **options)
+
     def create(self, **kwargs):
         """
         Create a subscriber
@@ -427,19 +578,11 @@ class SubscribersService(object):
         :rtype: dict
         """
 
-        OPTS_KEYS_TO_PERSIST = [
-            'email',
-            'phone_number',
-            'phone_country',
-            'endpoint',
-            'skip_confirmation_notification',
-            'page_access_user']
-
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
 
         _, _, subscriber = self.http_client.post(
             '/pages/{page_id}/subscribers.json'.format(
@@ -447,6 +590,25 @@ class SubscribersService(object):
 
         return subscriber
 
+    def bulk_import(self, path, **options):
+        """
+        Import subscribers from a file
+
+        Streams the rows of a CSV file with a header line, or of a JSON Lines file, validates them
+        against :attr:`CREATE_OPTS_KEYS_TO_PERSIST` and creates the subscribers concurrently. Settled
+        rows are recorded in a checkpoint file, so running the import again after an interruption
+        resumes where it stopped, and rejected rows are appended to an error report.
+
+        :calls: ``post pages/{page_id}/subscribers.json`` per row
+        :param str path: CSV or JSON Lines file, one subscriber per row.
+        :param dict **options: Options of :class:`statuspageio.SubscriberImporter`, e.g. ``max_workers``,
+                               ``checkpoint``, ``error_report`` or ``progress``.
+        :return: Numbers of created, rejected and skipped rows.
+        :rtype: :class:`statuspageio.ImportReport`
+        """
+
+        return SubscriberImporter(self, path, **options).run()
+
     def delete(self, subscriber_id=None):
         """
         Create a subscriber
@@ -470,6 +632,17 @@ class MetricsService(object):
     Normally you won't instantiate this class directly.
     """
 
+    CREATE_OPTS_KEYS_TO_PERSIST = [
+        'name',
+        'suffix',
+        'display',
+        'tooltip_description',
+        'y_axis_min',
+        'y_axis_max',
+        'decimal_places']
+
+    DATA_OPTS_KEYS_TO_PERSIST = ['timestamp', 'value']
+
     def __init__(self, http_client, page_id):
         """
         :param :class:`statuspageio.HttpClient` http_client: Pre configured high-level http client.
@@ -478,6 +651,8 @@ class MetricsService(object):
         self.__http_client = http_client
         self.page_id = page_id
         self.container = 'metric'
+        # index of statuspageio.Client.mirror kept current from the write responses, once loaded
+        self.mirror = None
 
     @property
     def http_client(self):
@@ -530,24 +705,17 @@ class MetricsService(object):
         :rtype: dict
         """
 
-        OPTS_KEYS_TO_PERSIST = [
-            'name',
-            'suffix',
-            'display',
-            'tooltip_description',
-            'y_axis_min',
-            'y_axis_max',
-            'decimal_places']
-
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
 
         _, _, metric = self.http_client.post(
             '/pages/{page_id}/metrics_providers/{metrics_provider_id}/metrics.json'.format(
                 page_id=self.page_id, metrics_provider_id=provider_id), container=self.container, body=attributes)
+        if self.mirror is not None:
+            self.mirror.put(metric)
 
         return metric
 
@@ -562,13 +730,11 @@ class MetricsService(object):
         :rtype: dict
         """
 
-        OPTS_KEYS_TO_PERSIST = ['timestamp', 'value']
-
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.DATA_OPTS_KEYS_TO_PERSIST)
 
         _, _, metric = self.http_client.post(
             '/pages/{page_id}/metrics/{metric_id}/data.json'.format(
@@ -576,6 +742,68 @@ class MetricsService(object):
 
         return metric
 
+    def submit_bulk_data(self, data):
+        """
+        Submit data points for many custom metrics at once
+
+        :calls: ``post /pages/{page_id}/metrics/data.json``
+        :param dict data: Mapping of metric id to a list of ``{'timestamp': ..., 'value': ...}`` points.
+        :return: Dictionary that support attriubte-style access and represents submitted data.
+        :rtype: dict
+        """
+
+        if not data:
+            raise Exception('data points are missing')
+
+        points = dict((metric_id, [dict((k, v) for k, v in point.items()
+                                        if k in self.DATA_OPTS_KEYS_TO_PERSIST)
+                                   for point in metric_points])
+                      for metric_id, metric_points in data.items())
+
+        _, _, metric = self.http_client.post(
+            '/pages/{page_id}/metrics/data.json'.format(
+                page_id=self.page_id), container='data', body=points)
+
+        return metric
+
+    def batcher(self, **options):
+        """
+        Build a :class:`statuspageio.MetricsBatcher` which buffers data points in memory
+        and submits them in bulk from a background thread.
+
+        :param dict **options: Options of :class:`statuspageio.MetricsBatcher`.
+        :rtype: :class:`statuspageio.MetricsBatcher`
+        """
+
+        return MetricsBatcher(self, **options)
+
+    def backfill(self, metric_id, data, values=None, **options):
+        """
+        Backfill the history of a custom metric
+
+        Converts the timestamps, downsamples the points to one per ``resolution`` seconds and submits
+        them with :meth:`submit_bulk_data` in concurrent requests. Uses :mod:`numpy` when installed.
+        With a ``checkpoint`` file, running the backfill again with the same data after a failure
+        only submits the points not submitted yet.
+
+        Usage::
+
+          >>> client.metrics.backfill('<METRIC_ID>', series, checkpoint='latency.checkpoint')
+          >>> client.metrics.backfill('<METRIC_ID>', timestamps, values, aggregate='max')
+
+        :calls: ``post /pages/{page_id}/metrics/data.json`` per ``points_per_request`` points
+        :param str metric_id: The id of the custom metric.
+        :param data: A pandas series indexed by time, a numpy array of ``(timestamp, value)`` rows, an iterable
+                     of ``(timestamp, value)`` pairs, or the timestamps when ``values`` is given.
+        :param values: (optional) Values matching the timestamps of ``data``.
+        :param dict **options: Options of :class:`statuspageio.MetricsBackfill`, e.g. ``resolution``,
+                               ``aggregate``, ``max_workers``, ``checkpoint`` or ``progress``.
+        :return: Numbers of submitted and skipped points and requests.
+        :rtype: :class:`statuspageio.BackfillReport`
+        """
+
+        return MetricsBackfill(self, metric_id, **options).run(data, values)
+
     def delete_all_data(self, metric_id=None):
         """
         Delete All Metric Data
@@ -604,6 +832,8 @@ class MetricsService(object):
         _, _, metric = self.http_client.delete(
             "/pages/{page_id}/metrics/{metric_id}.json".format(
                 page_id=self.page_id, metric_id=metric_id))
+        if self.mirror is not None:
+            self.mirror.remove(metric_id)
         return metric
 
 class UsersService(object):
@@ -613,6 +843,9 @@ class UsersService(object):
 
     Normally you won't instantiate this class directly.
     """
+
+    CREATE_OPTS_KEYS_TO_PERSIST = ['email', 'password', 'first_name', 'last_name']
+
     def __init__(self, http_client, organization_id):
         """
         :param :class:`statuspageio.HttpClient` http_client: Pre configured high-level http client.
@@ -647,6 +880,65 @@ class UsersService(object):
                 organization_id=self.organization_id), container=self.container)
         return users
 
+    def stream(self, params=None):
+        """
+        Stream all users
+
+        Like :meth:`list`, but decodes the users one by one while the response is received,
+        so memory stays bounded whatever the number of users.
+
+        :calls: ``get organizations/[organization_id]/users.json``
+        :param dict params: (optional) Query parameters, e.g. ``{'page': 1, 'per_page': 1000}``.
+        :return: Generator of dictionaries that support attriubte-style access and represent User resources.
+        :rtype: generator
+        """
+
+        _, _, users = self.http_client.get(
+            '/organizations/{organization_id}/users.json'.format(
+                organization_id=self.organization_id), params=params, stream=True)
+        return users
+
+    def iter_all(self, per_page=100, prefetch=False):
+        """
+        Iterate over all users
+
+        Walks the organization users page by page, so only one page is held in memory at a time.
+
+        :calls: ``get organizations/[organization_id]/users.json?page=[page]&per_page=[per_page]``
+        :param int per_page: (optional) Number of users requested per page. Default: **100**.
+        :param bool prefetch: (optional) Whether to fetch the next page in the background. Default: ``False``.
+        :return: Generator of dictionaries that support attriubte-style access and represent User resources.
+        :rtype: generator
+        """
+
+        def fetch(page, per_page):
+            _, _, users = self.http_client.get(
+                '/organizations/{organization_id}/users.json'.format(
+                    organization_id=self.organization_id),
+                params={'page': page, 'per_page': per_page})
+            return users
+
+        return paginate(fetch, per_page=per_page, prefetch=prefetch)
+
+    def export(self, path, per_page=100, **options):
+        """
+        Export all users
+
+        Writes the users to a CSV, JSON Lines or Parquet file while walking them page by page,
+        so only the current and the next page are held in memory.
+
+        :calls: ``get organizations/[organization_id]/users.json?page=[page]&per_page=[per_page]``
+        :param str path: Output file, its extension selects the format unless ``format`` is given.
+        :param int per_page: (optional) Number of users requested per page. Default: **100**.
+        :param dict **options: Options of :func:`statuspageio.export.export_records`, e.g. ``format``,
+                               ``columns``, ``progress`` or ``batch_size``.
+        :return: Number of written users and throughput.
+        :rtype: :class:`statuspageio.ExportReport`
+        """
+
+        options.setdefault('codec', self.http_client.codec)
+        return export_records(self.iter_all(per_page=per_page, prefetch=True), path, **options)
+
     def create(self, **kwargs):
         """
         Create a user 
@@ -656,13 +948,11 @@ class UsersService(object):
         :return: Dictionary that support attriubte-style access and represents updated User resource.
         :rtype: dict
         """
-        OPTS_KEYS_TO_PERSIST = ['email', 'password', 'first_name', 'last_name']
-
         if not kwargs:
             raise Exception('attributes are missing')
 
-        attributes = dict((k, v) for k, v in kwargs.iteritems()
-                          if k in OPTS_KEYS_TO_PERSIST)
+        attributes = dict((k, v) for k, v in kwargs.items()
+                          if k in self.CREATE_OPTS_KEYS_TO_PERSIST)
 
         _, _, user = self.http_client.post(
             '/organizations/{organization_id}/users.json'.format(
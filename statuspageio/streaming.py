@@ -0,0 +1,159 @@
+"""
+Incremental parsing of json array responses.
+
+List endpoints answer with a bare json array. :class:`JsonArrayParser` is fed the response content
+chunk by chunk as it is received and hands out every element as soon as it is complete, so only
+the element being received and the unread rest of the current chunk are held in memory.
+"""
+
+import codecs
+import json
+import re
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# what may follow the part of a number decoded so far when the number is cut by the end of a chunk
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z')
+
+
+class JsonArrayParser(object):
+    """
+    Push parser of a json array, decoding one element at a time with the C scanner of :mod:`json`.
+
+    A document which is not an array, such as an error or an ``items`` envelope, is buffered and
+    decoded whole when the parser is closed: the elements of the envelope, or the document itself,
+    are returned then.
+
+    Usage::
+
+      >>> parser = JsonArrayParser()
+      >>> parser.feed(b'[{"id": 1}, {"id"')
+      [{'id': 1}]
+      >>> parser.feed(b': 2}]')
+      [{'id': 2}]
+      >>> parser.close()
+      []
+    """
+
+    def __init__(self):
+        self.__decoder = codecs.getincrementaldecoder('utf-8')()
+        # the C scanner behind json.loads, without the checks of raw_decode around every element
+        self.__scan = json.JSONDecoder().scan_once
+        self.__buffer = u''
+        self.__position = 0
+        # '[' before the array, 'item' or 'first' before an element, ',' after one, None once finished
+        self.__expect = '['
+        self.__array = True
+        self.__retry_at = 0
+
+    def feed(self, chunk):
+        """
+        :param bytes chunk: Next chunk of the utf-8 encoded document.
+        :return: Elements completed by this chunk.
+        :rtype: list
+        :raises ValueError: if the chunk is not valid json, or follows the end of the array with more than whitespace.
+        """
+
+        return self.__parse(self.__decoder.decode(chunk), final=False)
+
+    def close(self):
+        """
+        Signal the end of the document.
+
+        :return: Elements completed by the end of the document.
+        :rtype: list
+        :raises ValueError: if the document is truncated or is not valid json.
+        """
+
+        items = self.__parse(self.__decoder.decode(b'', True), final=True)
+        if not self.__array:
+            document = json.loads(self.__buffer)
+            return document['items'] if isinstance(document, dict) and 'items' in document else [document]
+        if self.__expect is not None:
+            raise ValueError('Truncated json array')
+        return items
+
+    def __parse(self, text, final):
+        if not self.__array:
+            self.__buffer += text
+            return []
+
+        # drop what was parsed already, so the buffer never grows past one element and a chunk
+        buffer = self.__buffer = self.__buffer[self.__position:] + text
+        length = len(buffer)
+        position = 0
+        items = []
+        skip_whitespace = WHITESPACE.match
+        scan = self.__scan
+        expect = self.__expect
+        while expect is not None:
+            position = skip_whitespace(buffer, position).end()
+            if position == length:
+                break
+            character = buffer[position]
+
+            if expect == ',':
+                if character == ',':
+                    expect = 'item'
+                elif character == ']':
+                    expect = None
+                else:
+                    raise ValueError('Expecting , delimiter at position {0}'.format(position))
+                position += 1
+            elif expect == '[':
+                if character != '[':
+                    self.__array = False
+                    self.__buffer = buffer[position:]
+                    self.__position = 0
+                    self.__expect = expect
+                    return items
+                position += 1
+                expect = 'first'
+            elif character == ']' and expect == 'first':
+                position += 1
+                expect = None
+            else:
+                # an element split across chunks fails to decode, retry once the buffer doubled
+                if not final and length - position < self.__retry_at:
+                    break
+                try:
+                    item, end = scan(buffer, position)
+                except (StopIteration, ValueError):
+                    if final:
+                        raise ValueError('Invalid json element at position {0}'.format(position))
+                    self.__retry_at = 2 * (length - position)
+                    break
+                if not final and character in '-0123456789' and NUMBER_TAIL.match(buffer, end):
+                    # the number may go on in the next chunk
+                    break
+                items.append(item)
+                position = end
+                self.__retry_at = 0
+                expect = ','
+
+        if expect is None:
+            # only whitespace may follow the array, anything else is a concatenated or corrupted body
+            position = skip_whitespace(buffer, position).end()
+            if position != length:
+                raise ValueError('Extra data after the json array at position {0}'.format(position))
+
+        self.__position = position
+        self.__expect = expect
+        return items
+
+
+def iter_json_array(chunks):
+    """
+    Yield the elements of a json array from an iterable of utf-8 encoded chunks, as they complete.
+
+    :param chunks: Iterable of bytes.
+    :rtype: generator
+    """
+
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -0,0 +1,283 @@
+"""
+Resumable bulk import of subscribers from CSV or JSON Lines files.
+
+Rows are streamed from the file, validated and created concurrently, with at most a couple of rows
+per worker in memory. Progress is recorded in a checkpoint file so an interrupted import resumes
+where it stopped, and rejected rows are written to an error report instead of stopping the import.
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+
+from statuspageio.bulk import BoundedExecutor, BulkReport, format_of, load_checkpoint, save_checkpoint
+from statuspageio.errors import RequestError, ResourceError
+from statuspageio.rate_limit import RATE_LIMIT_STATUSES, monotonic
+
+
+def iter_rows(path, format=None):
+    """
+    Stream the rows of a CSV file with a header line, or of a JSON Lines file with one object per line.
+
+    Lines of a JSON Lines file which are not valid json are yielded as is, blank lines are skipped.
+
+    :param str path: Path of the file.
+    :param str format: (optional) ``'csv'`` or ``'jsonl'``. Default: guessed from the extension.
+    :return: Generator of dictionaries.
+    :rtype: generator
+    :raises ValueError: if the format is unknown.
+    """
+
+    if format is None:
+        format = format_of(path)
+    if format not in ('csv', 'jsonl'):
+        raise ValueError('Unknown format of {0}, expected one of: csv, jsonl.'.format(path))
+    return iter_csv(path) if format == 'csv' else iter_jsonl(path)
+
+
+def iter_csv(path):
+    import csv
+    if sys.version_info[0] >= 3:
+        source = io.open(path, 'r', encoding='utf-8-sig', newline='')
+    else:
+        # the csv module of Python 2 reads utf-8 encoded byte strings
+        source = open(path, 'rb')
+    with source:
+        for row in csv.DictReader(source, restkey='(extra columns)'):
+            yield row
+
+
+def iter_jsonl(path):
+    with io.open(path, 'r', encoding='utf-8') as source:
+        for line in source:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield line
+
+
+class ImportReport(BulkReport):
+    """
+    Outcome of :meth:`statuspageio.SubscribersService.bulk_import`.
+
+    :attribute int created: Subscribers created by this run.
+    :attribute int failed: Rows rejected by validation or by the API, see the error report.
+    :attribute int skipped: Rows settled by an earlier run, according to the checkpoint.
+    :attribute float elapsed: Seconds taken by this run.
+    """
+
+    def __init__(self):
+        super(ImportReport, self).__init__()
+        self.created = 0
+        self.failed = 0
+        self.skipped = 0
+
+    @property
+    def rows(self):
+        """
+        Rows settled by this run.
+
+        :rtype: int
+        """
+
+        return self.created + self.failed
+
+    processed = rows
+
+    def __repr__(self):
+        return '<ImportReport created={0} failed={1} skipped={2} rate={3:.1f}/s>'.format(
+            self.created, self.failed, self.skipped, self.rate)
+
+
+class SubscriberImporter(object):
+    """
+    Creates the subscribers of a file concurrently, keeping a checkpoint and an error report.
+
+    The checkpoint holds the number of the last row before which every row is settled - created
+    or rejected - and the rows settled after it, so a new run with the same checkpoint skips them.
+    Rows rejected by validation or with a 4xx answer are settled and written to the error report,
+    one json object per line. Any other failure, such as a server error, an exhausted rate limit or
+    an interruption, stops the import after the rows in flight and leaves the unsettled rows for the
+    next run.
+
+    Normally you will use :meth:`statuspageio.SubscribersService.bulk_import`.
+    """
+
+    """
+    Api errors which would fail every row, they stop the import instead of being reported.
+    """
+    FATAL_STATUSES = (401, 403) + RATE_LIMIT_STATUSES
+
+    """
+    At least one of these attributes identifies the subscriber.
+    """
+    CONTACT_ATTRIBUTES = ('email', 'phone_number', 'endpoint')
+
+    BOOLEAN_ATTRIBUTES = ('skip_confirmation_notification',)
+
+    BOOLEANS = {'true': True, 'yes': True, '1': True, 'false': False, 'no': False, '0': False}
+
+    def __init__(self, service, path, format=None, checkpoint=None, error_report=None, max_workers=8,
+                 checkpoint_every=100, progress=None):
+        """
+        :param :class:`statuspageio.SubscribersService` service: Service creating the subscribers.
+        :param str path: CSV or JSON Lines file, one subscriber per row.
+        :param str format: (optional) ``'csv'`` or ``'jsonl'``. Default: guessed from the extension.
+        :param str checkpoint: (optional) Checkpoint file. Default: ``path`` followed by ``.checkpoint``.
+        :param str error_report: (optional) Error report, appended to. Default: ``path`` followed by ``.errors.jsonl``.
+        :param int max_workers: (optional) Maximum number of concurrent requests. Default: **8**.
+        :param int checkpoint_every: (optional) Settled rows between checkpoint writes. Default: **100**.
+        :param callable progress: (optional) Called with the :class:`ImportReport <ImportReport>` in progress
+                                  on every checkpoint write.
+        """
+
+        self.service = service
+        self.path = path
+        self.format = format
+        self.checkpoint = checkpoint if checkpoint is not None else path + '.checkpoint'
+        self.error_report = error_report if error_report is not None else path + '.errors.jsonl'
+        self.max_workers = max_workers
+        self.checkpoint_every = checkpoint_every
+        self.progress = progress
+
+        self.report = ImportReport()
+        self.__position = 0
+        self.__settled = set()
+        self.__unsaved = 0
+        self.__started = None
+        self.__errors = None
+        self.__lock = threading.Lock()
+
+    def validate(self, row):
+        """
+        Check a row against the attributes a subscriber is created with. Empty values are dropped.
+
+        :param dict row: Row read from the file.
+        :return: Attributes of the subscriber.
+        :rtype: dict
+        :raises ValueError: if the row is invalid.
+        """
+
+        if not isinstance(row, dict):
+            raise ValueError('Row is not a json object')
+
+        attributes = dict((key, value) for key, value in row.items() if value is not None and value != '')
+        unknown = sorted(str(key) for key in attributes if key not in self.service.CREATE_OPTS_KEYS_TO_PERSIST)
+        if unknown:
+            raise ValueError('Unknown attributes: {0}'.format(', '.join(unknown)))
+        if not any(key in attributes for key in self.CONTACT_ATTRIBUTES):
+            raise ValueError('One of {0} is required'.format(', '.join(self.CONTACT_ATTRIBUTES)))
+        if 'phone_number' in attributes and 'phone_country' not in attributes:
+            raise ValueError('phone_country is required with phone_number')
+
+        for key in self.BOOLEAN_ATTRIBUTES:
+            value = attributes.get(key)
+            if value is None or isinstance(value, bool):
+                continue
+            try:
+                attributes[key] = self.BOOLEANS[str(value).strip().lower()]
+            except KeyError:
+                raise ValueError('{0} must be true or false, got {1!r}'.format(key, value))
+
+        return attributes
+
+    def run(self):
+        """
+        Import the rows not settled by an earlier run.
+
+        :rtype: :class:`ImportReport <ImportReport>`
+        :raises ValueError: if the checkpoint belongs to another file or the format is unknown.
+        """
+
+        rows = iter_rows(self.path, self.format)
+        self.__load_checkpoint()
+        self.__started = monotonic()
+        executor = BoundedExecutor(self.max_workers)
+        self.__errors = io.open(self.error_report, 'a', encoding='utf-8')
+        try:
+            for number, row in enumerate(rows, 1):
+                if executor.error is not None:
+                    break
+                if number <= self.__position or number in self.__settled:
+                    self.report.skipped += 1
+                    continue
+                try:
+                    attributes = self.validate(row)
+                except ValueError as e:
+                    self.__settle(number, row, e)
+                    continue
+
+                executor.submit(lambda future, number=number, row=row: self.__done(future, number, row, executor),
+                                self.service.create, **attributes)
+        finally:
+            executor.shutdown()
+            with self.__lock:
+                self.__save_checkpoint()
+            self.__errors.close()
+
+        if executor.error is not None:
+            raise executor.error
+        if self.progress is not None:
+            self.progress(self.report)
+        return self.report
+
+    def __done(self, future, number, row, executor):
+        error = future.exception()
+        if error is None:
+            self.__settle(number, row, None)
+        elif (isinstance(error, (RequestError, ResourceError)) and
+                getattr(error, 'http_status', None) not in self.FATAL_STATUSES):
+            self.__settle(number, row, error)
+        else:
+            executor.fail(error)
+
+    def __settle(self, number, row, error):
+        with self.__lock:
+            if error is None:
+                self.report.created += 1
+            else:
+                self.report.failed += 1
+                entry = {'row': number, 'error': '{0}: {1}'.format(type(error).__name__, error), 'attributes': row}
+                if getattr(error, 'errors', None) is not None:
+                    # the decoded error response of the API
+                    entry['details'] = error.errors
+                line = json.dumps(entry)
+                self.__errors.write(line if isinstance(line, type(u'')) else line.decode('utf-8'))
+                self.__errors.write(u'\n')
+
+            if number == self.__position + 1:
+                self.__position = number
+                while self.__position + 1 in self.__settled:
+                    self.__position += 1
+                    self.__settled.remove(self.__position)
+            else:
+                self.__settled.add(number)
+
+            self.__unsaved += 1
+            if self.__unsaved < self.checkpoint_every:
+                return
+            self.__save_checkpoint()
+
+        if self.progress is not None:
+            self.progress(self.report)
+
+    def __load_checkpoint(self):
+        state = load_checkpoint(self.checkpoint)
+        if state is None:
+            return
+        if state['source'] != os.path.abspath(self.path):
+            raise ValueError('Checkpoint {0} belongs to {1}'.format(self.checkpoint, state['source']))
+        self.__position = state['position']
+        self.__settled = set(state['settled'])
+
+    def __save_checkpoint(self):
+        self.__errors.flush()
+        self.report.elapsed = monotonic() - self.__started
+        save_checkpoint(self.checkpoint, {'source': os.path.abspath(self.path), 'position': self.__position,
+                                          'settled': sorted(self.__settled)})
+        self.__unsaved = 0
@@ -0,0 +1,408 @@
+import datetime
+
+from statuspageio.errors import ConfigurationError
+from statuspageio.rate_limit import monotonic
+
+
+"""
+Bytes read at a time from streamed responses.
+"""
+CHUNK_SIZE = 64 * 1024
+
+
+class Headers(dict):
+    """
+    Case insensitive dictionary of response headers, for transports whose library does not provide one.
+    """
+
+    def __init__(self, headers=None):
+        super(Headers, self).__init__()
+        for key, value in (headers or {}).items():
+            self[key] = value
+
+    def __setitem__(self, key, value):
+        super(Headers, self).__setitem__(key.lower(), value)
+
+    def __getitem__(self, key):
+        return super(Headers, self).__getitem__(key.lower())
+
+    def __contains__(self, key):
+        return super(Headers, self).__contains__(key.lower())
+
+    def get(self, key, default=None):
+        return super(Headers, self).get(key.lower(), default)
+
+
+class TransportResponse(object):
+    """
+    Response of a :class:`Transport <Transport>`, mirroring the parts of :class:`requests.Response`
+    the http client relies on.
+
+    :attribute int status_code: Http status code.
+    :attribute headers: Case insensitive mapping of response headers.
+    :attribute bytes content: Response content.
+    :attribute :class:`datetime.timedelta` elapsed: Time until the response headers were received.
+    """
+
+    def __init__(self, status_code, headers, content, elapsed=0.0):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = datetime.timedelta(seconds=elapsed)
+
+    def __repr__(self):
+        return '<TransportResponse [{0}]>'.format(self.status_code)
+
+    def close(self):
+        pass
+
+
+class StreamedResponse(object):
+    """
+    Response of :meth:`Transport.stream`, whose content is read on demand.
+
+    :attribute int status_code: Http status code.
+    :attribute headers: Case insensitive mapping of response headers.
+    :attribute :class:`datetime.timedelta` elapsed: Time until the response headers were received.
+    """
+
+    def __init__(self, status_code, headers, chunks, close=None, elapsed=0.0):
+        """
+        :param int status_code: Http status code.
+        :param headers: Case insensitive mapping of response headers.
+        :param chunks: Iterable of the content, in bytes chunks.
+        :param callable close: (optional) Releases the connection, also when the content was not read to the end.
+        :param float elapsed: (optional) Seconds until the response headers were received.
+        """
+
+        self.status_code = status_code
+        self.headers = headers
+        self.elapsed = datetime.timedelta(seconds=elapsed)
+        self.__chunks = chunks
+        self.__close = close
+        self.__content = None
+
+    def __repr__(self):
+        return '<StreamedResponse [{0}]>'.format(self.status_code)
+
+    def iter_content(self):
+        """
+        :return: Generator of the content chunks not read yet.
+        :rtype: generator
+        """
+
+        if self.__content is not None:
+            yield self.__content
+            return
+        for chunk in self.__chunks:
+            yield chunk
+
+    @property
+    def content(self):
+        """
+        The rest of the content, read at once, e.g. to decode an error response.
+
+        :rtype: bytes
+        """
+
+        if self.__content is None:
+            self.__content = b''.join(self.__chunks)
+            self.close()
+        return self.__content
+
+    def close(self):
+        if self.__close is not None:
+            close, self.__close = self.__close, None
+            close()
+
+
+class Transport(object):
+    """
+    Sends a single, fully prepared http request. :class:`statuspageio.HttpClient` builds urls, headers
+    and bodies, retries, paces and decodes; a transport only moves bytes.
+
+    Implementations return an object with ``status_code``, ``headers`` (case insensitive), ``content``
+    and ``elapsed`` attributes, such as :class:`TransportResponse <TransportResponse>`, and list in
+    :attr:`retryable_exceptions` the errors a request may be retried after.
+    """
+
+    """
+    Transport errors worth another attempt, e.g. connection resets and timeouts.
+    """
+    retryable_exceptions = ()
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        """
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param dict params: (optional) Query parameters.
+        :param str data: (optional) Encoded request body.
+        :param dict headers: (optional) Request headers.
+        """
+
+        raise NotImplementedError
+
+    def stream(self, method, url, params=None, data=None, headers=None):
+        """
+        Like :meth:`request`, but return as soon as the response headers are received and read the
+        content on demand. Transports which can't stream read the whole content first.
+
+        :param str method: Http method.
+        :param str url: Absolute URL.
+        :param dict params: (optional) Query parameters.
+        :param str data: (optional) Encoded request body.
+        :param dict headers: (optional) Request headers.
+        :rtype: :class:`StreamedResponse <StreamedResponse>`
+        """
+
+        resp = self.request(method, url, params=params, data=data, headers=headers)
+        return StreamedResponse(resp.status_code, resp.headers, [resp.content],
+                                elapsed=resp.elapsed.total_seconds())
+
+    def close(self):
+        """
+        Release pooled connections. The transport remains usable.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport: a single :class:`requests.Session` with a pooled adapter sized according to
+    the configuration, so keep-alive connections are reused by every service.
+    """
+
+    def __init__(self, config):
+        """
+        :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+        """
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.config = config
+        self.retryable_exceptions = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=config.pool_connections,
+                              pool_maxsize=config.pool_maxsize,
+                              pool_block=config.pool_block)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['User-Agent'] = config.user_agent
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        return self.session.request(method, url, params=params, data=data, headers=headers,
+                                    timeout=float(self.config.timeout),
+                                    verify=self.config.verify_ssl)
+
+    def stream(self, method, url, params=None, data=None, headers=None):
+        resp = self.session.request(method, url, params=params, data=data, headers=headers,
+                                    timeout=float(self.config.timeout),
+                                    verify=self.config.verify_ssl, stream=True)
+        return StreamedResponse(resp.status_code, resp.headers, resp.iter_content(CHUNK_SIZE), resp.close,
+                                resp.elapsed.total_seconds())
+
+    def close(self):
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport talking to :mod:`urllib3` directly, skipping the per request work of :mod:`requests`
+    (hooks, cookies, environment lookups, redirects).
+    """
+
+    def __init__(self, config):
+        """
+        :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+        """
+
+        import urllib3
+
+        self.config = config
+        self.retryable_exceptions = (urllib3.exceptions.ProtocolError, urllib3.exceptions.TimeoutError)
+
+        options = {}
+        if config.verify_ssl:
+            options['cert_reqs'] = 'CERT_REQUIRED'
+            try:
+                import certifi
+                options['ca_certs'] = certifi.where()
+            except ImportError:
+                pass
+        else:
+            options['cert_reqs'] = 'CERT_NONE'
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        self.pool = urllib3.PoolManager(num_pools=config.pool_connections,
+                                        maxsize=config.pool_maxsize,
+                                        block=config.pool_block,
+                                        timeout=urllib3.Timeout(total=float(config.timeout)),
+                                        retries=False,
+                                        headers={'User-Agent': config.user_agent},
+                                        **options)
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        resp, elapsed = self.__urlopen(method, url, params, data, headers)
+        try:
+            content = resp.read()
+        finally:
+            resp.release_conn()
+        return TransportResponse(resp.status, resp.headers, content, elapsed)
+
+    def stream(self, method, url, params=None, data=None, headers=None):
+        resp, elapsed = self.__urlopen(method, url, params, data, headers)
+
+        def close():
+            if not resp.isclosed():
+                # stopped early, the unread rest would be taken for the next response on the connection
+                resp.close()
+            resp.release_conn()
+
+        return StreamedResponse(resp.status, resp.headers, resp.stream(CHUNK_SIZE), close, elapsed)
+
+    def __urlopen(self, method, url, params, data, headers):
+        if params:
+            try:
+                from urllib.parse import urlencode
+            except ImportError:
+                # Python 2
+                from urllib import urlencode
+            url += ('&' if '?' in url else '?') + urlencode(params, True)
+        if data is not None and not isinstance(data, bytes):
+            data = data.encode('utf-8')
+
+        started = monotonic()
+        resp = self.pool.urlopen(method.upper(), url, body=data, headers=headers,
+                                 preload_content=False, redirect=False)
+        return resp, monotonic() - started
+
+    def close(self):
+        self.pool.clear()
+
+
+class HttpxTransport(Transport):
+    """
+    HTTP/2 transport on :mod:`httpx`: concurrent calls from every thread multiplex as streams over a
+    single connection per host, instead of one socket per call in flight.
+
+    Requests run on an :class:`httpx.AsyncClient` driven by a private event loop thread, because
+    the blocking HTTP/2 connection of :mod:`httpcore` may open streams out of order when several
+    threads share it. ``https`` urls negotiate HTTP/2 with ALPN and fall back to HTTP/1.1 on servers
+    without it. Plain ``http`` urls, such as a local :class:`statuspageio.FakeServer`, speak HTTP/2
+    with prior knowledge (h2c). Requires Python 3 and ``httpx[http2]``.
+    """
+
+    def __init__(self, config):
+        """
+        :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+        """
+
+        try:
+            import httpx
+        except ImportError:
+            raise ConfigurationError('httpx is required by the httpx transport. '
+                                     'Install it using: "pip install statuspageio[http2]"')
+        import asyncio
+        import threading
+
+        self.config = config
+        self.asyncio = asyncio
+        self.retryable_exceptions = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+        self.client = httpx.AsyncClient(http1=not config.base_url.startswith('http://'),
+                                        http2=True,
+                                        verify=config.verify_ssl,
+                                        timeout=float(config.timeout),
+                                        limits=httpx.Limits(max_connections=config.pool_maxsize,
+                                                            max_keepalive_connections=config.pool_maxsize),
+                                        headers={'User-Agent': config.user_agent})
+        self.loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.loop.run_forever, name='statuspageio-httpx')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        started = monotonic()
+        resp = self.__run(self.client.request(method, url, params=params, content=data, headers=headers))
+        # httpx only sets elapsed once the content is read
+        resp.elapsed = datetime.timedelta(seconds=monotonic() - started)
+        return resp
+
+    def stream(self, method, url, params=None, data=None, headers=None):
+        run = self.__run
+        started = monotonic()
+        resp = run(self.client.send(self.client.build_request(method, url, params=params, content=data,
+                                                              headers=headers), stream=True))
+        elapsed = monotonic() - started
+
+        def chunks():
+            iterator = resp.aiter_bytes(CHUNK_SIZE)
+            while True:
+                try:
+                    yield run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+
+        return StreamedResponse(resp.status_code, resp.headers, chunks(), lambda: run(resp.aclose()), elapsed)
+
+    def __run(self, coroutine):
+        return self.asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+        self.__run(self.client.aclose())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.__thread.join()
+        self.loop.close()
+
+
+class FakeTransport(Transport):
+    """
+    Transport answering from an in-process backend, normally a :class:`statuspageio.fake.FakeStatusPage`,
+    so whole automations run at full speed without network.
+
+    Usage::
+
+      >>> backend = statuspageio.FakeStatusPage()
+      >>> client = statuspageio.Client(api_key='key', page_id='page', transport=statuspageio.FakeTransport(backend))
+    """
+
+    def __init__(self, backend):
+        """
+        :param backend: Object with a ``handle(method, path, params, body, headers)`` method returning
+                        ``(status_code, headers, content)``.
+        """
+
+        self.backend = backend
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        # absolute url of the configured base url, keep the path only
+        path = '/' + url.split('://', 1)[-1].split('/', 1)[-1].split('?', 1)[0]
+        started = monotonic()
+        status_code, response_headers, content = self.backend.handle(method.upper(), path,
+                                                                     params or {}, data, headers or {})
+        return TransportResponse(status_code, Headers(response_headers), content, monotonic() - started)
+
+
+"""
+Transports selectable by name with the ``transport`` option.
+"""
+TRANSPORTS = {
+    'requests': RequestsTransport,
+    'urllib3': Urllib3Transport,
+    'httpx': HttpxTransport,
+}
+
+
+def build_transport(transport, config):
+    """
+    :param transport: Name of one of :data:`TRANSPORTS`, or a :class:`Transport <Transport>` instance.
+    :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+    :rtype: :class:`Transport <Transport>`
+    """
+
+    if isinstance(transport, (str, type(u''))):
+        return TRANSPORTS[transport](config)
+    return transport
@@ -0,0 +1,24 @@
+import sys
+
+import pytest
+
+import statuspageio
+
+
+if sys.version_info[0] < 3:
+    # AsyncClient is written with async/await
+    collect_ignore = ['test_aio.py']
+
+
+@pytest.fixture
+def backend():
+    return statuspageio.FakeStatusPage()
+
+
+@pytest.fixture
+def client(backend):
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend),
+                                 retry=statuspageio.RetryPolicy(backoff_factor=0.01))
+    yield client
+    client.close()
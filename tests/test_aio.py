@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+import statuspageio
+from statuspageio import errors
+from statuspageio.rate_limit import monotonic
+
+pytest.importorskip('aiohttp')
+
+
+@pytest.fixture
+def server(backend):
+    server = statuspageio.FakeServer(backend)
+    server.start()
+    yield server
+    server.stop()
+
+
+def run(server, coroutine, **options):
+    """
+    Run ``coroutine(client)`` with an :class:`statuspageio.AsyncClient` of the fake server.
+    """
+
+    async def main():
+        async with statuspageio.AsyncClient(api_key='key', page_id='page', organization_id='org',
+                                            base_url=server.url, **options) as client:
+            return await coroutine(client)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize('helper', ['metrics.batcher', 'metrics.backfill', 'incidents.coalescer',
+                                    'subscribers.stream', 'subscribers.bulk_import', 'subscribers.export',
+                                    'users.stream', 'users.export'])
+def test_blocking_helpers_are_rejected(server, helper):
+    service, method = helper.split('.')
+
+    async def call(client):
+        getattr(getattr(client, service), method)('argument')
+
+    with pytest.raises(TypeError, match=helper):
+        run(server, call)
+
+
+def test_actions_match_the_blocking_client(server, backend):
+    async def scenario(client):
+        component = await client.components.create(name='API', status='operational')
+        await client.components.update(component['id'], status='major_outage')
+        incident = await client.incidents.create(name='Outage', status='investigating')
+        await client.subscribers.create(email='user@example.com')
+        subscribers = [subscriber async for subscriber in client.subscribers.iter_all(per_page=1)]
+        return component, incident, subscribers, await client.components.list()
+
+    component, incident, subscribers, components = run(server, scenario)
+    blocking = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                   transport=statuspageio.FakeTransport(backend))
+
+    assert [c['status'] for c in components] == ['major_outage']
+    assert blocking.components.list() == components
+    assert [s['email'] for s in subscribers] == [s['email'] for s in blocking.subscribers.list()]
+    assert blocking.incidents.list()[0]['id'] == incident['id']
+
+
+def test_paces_requests_and_requeues_rate_limited_ones(server, backend):
+    async def scenario(client):
+        started = monotonic()
+        await asyncio.gather(*[client.components.list() for _ in range(10)])
+        elapsed = monotonic() - started
+        backend.inject(420, count=2, retry_after=0.05)
+        component = await client.components.create(name='API')
+        return elapsed, component
+
+    elapsed, component = run(server, scenario, rate_limit=20, retry=None)
+
+    assert elapsed >= 0.4
+    assert component['name'] == 'API'
+
+
+def test_retries_server_errors(server, backend):
+    events = []
+
+    async def scenario(client):
+        backend.inject(503, count=2)
+        await client.components.list()
+        assert events[-1].attempts == 3
+        backend.inject(503)
+        with pytest.raises(errors.ServerError):
+            await client.components.create(name='API')
+        assert events[-1].attempts == 1
+        backend.inject(503, retry_after=86400)
+        with pytest.raises(errors.ServerError):
+            await client.components.list()
+        assert events[-1].attempts == 1
+
+    run(server, scenario, retry=statuspageio.RetryPolicy(backoff_factor=0.01, max_backoff=1),
+        after_request=events.append)
+
+
+def test_serves_reads_from_the_cache(server, backend):
+    events = []
+
+    async def scenario(client):
+        await client.components.list()
+        await client.components.list()
+        assert events[-1].cached
+        await client.components.create(name='API')
+        return await client.components.list()
+
+    assert len(run(server, scenario, cache=True, after_request=events.append)) == 1
+    assert backend.request_count == 3
+
+
+def test_iter_all_walks_every_page(server, backend):
+    async def scenario(client):
+        for number in range(3):
+            await client.users.create(email='user{0}@example.com'.format(number), first_name='A', last_name='B')
+        return [user async for user in client.users.iter_all(per_page=1, prefetch=True)]
+
+    assert len(run(server, scenario)) == 3
+
+
+def test_sync_sees_direct_writes(server, backend):
+    async def scenario(client):
+        component = await client.components.create(name='EU API', status='operational')
+        await client.components.sync({'EU API': {'status': 'operational'}})
+        await client.components.update(component['id'], status='major_outage')
+        updated = await client.components.sync({'EU API': {'status': 'operational'}})
+        await client.components.delete(component['id'])
+        created = await client.components.sync({'EU API': {'status': 'operational'}, 'DB': {}}, delete_missing=True)
+        return updated, created
+
+    updated, created = run(server, scenario)
+
+    assert len(updated.updated) == 1
+    assert sorted(component['name'] for component in created.created) == ['DB', 'EU API']
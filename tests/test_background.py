@@ -0,0 +1,90 @@
+import gc
+import time
+import weakref
+
+from statuspageio import background
+
+
+def test_batcher_flushes_on_size_and_close(client, backend):
+    metric_id = client.metrics.create(provider_id='self', name='latency')['id']
+    batcher = client.metrics.batcher(flush_size=3, flush_interval=60)
+
+    for value in range(5):
+        batcher.submit(metric_id, value)
+    time.sleep(0.2)
+    assert sum(len(points) for points in backend.page('page')['data'].values()) >= 3
+
+    batcher.close()
+    assert sum(len(points) for points in backend.page('page')['data'].values()) == 5
+
+
+def test_batcher_flushes_on_interval(client, backend):
+    metric_id = client.metrics.create(provider_id='self', name='latency')['id']
+
+    with client.metrics.batcher(flush_size=100, flush_interval=0.1) as batcher:
+        batcher.submit(metric_id, 1.0)
+        time.sleep(0.4)
+        assert len(batcher) == 0
+
+
+def test_batcher_drops_points_beyond_the_limit(client, backend):
+    metric_id = client.metrics.create(provider_id='self', name='latency')['id']
+
+    with client.metrics.batcher(flush_size=100, flush_interval=60, max_buffered_points=2) as batcher:
+        batcher.submit(metric_id, 1.0)
+        batcher.submit(metric_id, 2.0)
+        batcher.submit(metric_id, 3.0)
+        for number in range(10):
+            batcher.submit('unknown{0}'.format(number), 1.0)
+
+        assert len(batcher) == 2
+        assert batcher.dropped == 11
+        assert len(batcher._MetricsBatcher__buffer) == 1
+
+    assert [point['value'] for point in backend.page('page')['data'][metric_id]] == [2.0, 3.0]
+
+
+def test_closed_batchers_are_collected(client):
+    batcher = client.metrics.batcher()
+    batcher.close()
+    assert batcher not in background.OPEN_FLUSHERS
+
+    reference = weakref.ref(batcher)
+    del batcher
+    gc.collect()
+    assert reference() is None
+
+
+def test_coalescer_merges_updates(client, backend):
+    incident_id = client.incidents.create(name='Database', status='investigating')['id']
+
+    with client.incidents.coalescer(window=0.1, max_delay=1) as coalescer:
+        for number in range(5):
+            coalescer.update(incident_id, message='update {0}'.format(number))
+        coalescer.update(incident_id, status='resolved')
+
+    assert coalescer.sent == 1
+    assert backend.page('page')['incidents'][incident_id]['status'] == 'resolved'
+
+
+def test_coalescer_sends_after_the_window(client, backend):
+    incident_id = client.incidents.create(name='Database', status='investigating')['id']
+
+    with client.incidents.coalescer(window=0.05, max_delay=1) as coalescer:
+        coalescer.update(incident_id, status='identified')
+        time.sleep(0.4)
+        assert coalescer.sent == 1
+        assert backend.page('page')['incidents'][incident_id]['status'] == 'identified'
+
+
+def test_closed_coalescers_are_collected(client):
+    incident_id = client.incidents.create(name='Database', status='investigating')['id']
+    coalescer = client.incidents.coalescer(window=0.05)
+    coalescer.update(incident_id, status='resolved')
+    coalescer.close()
+    assert coalescer not in background.OPEN_FLUSHERS
+
+    reference = weakref.ref(coalescer)
+    del coalescer
+    gc.collect()
+    assert reference() is None
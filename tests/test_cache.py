@@ -0,0 +1,89 @@
+import statuspageio
+from statuspageio.cache import ResponseCache
+
+
+def test_key_accepts_list_params():
+    key = ResponseCache.key('GET', '/pages/page/components.json', {'ids': [1, 2], 'page': 1})
+
+    assert key == ('get', '/pages/page/components.json', (('ids', (1, 2)), ('page', 1)))
+    assert hash(key) is not None
+
+
+def test_invalidate_compares_whole_segments():
+    cache = ResponseCache()
+    key = cache.key('get', '/pages/abc/components.json')
+    cache.store(key, '/pages/abc/components.json', 200, {}, b'[]')
+
+    cache.invalidate('/pages/ab.json')
+    assert len(cache) == 1
+
+    cache.invalidate('/pages/abc/components/1.json')
+    assert len(cache) == 0
+
+
+def test_store_drops_responses_older_than_an_invalidation():
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate('/pages/page/components/1.json')
+
+    cache.store(cache.key('get', '/pages/page/components.json'), '/pages/page/components.json', 200, {}, b'[]',
+                generation)
+    assert len(cache) == 0
+
+
+def test_reads_are_served_from_the_cache_until_a_write(backend):
+    events = []
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend),
+                                 cache=True, after_request=events.append)
+
+    client.components.list()
+    client.components.list()
+    assert backend.request_count == 1
+    assert events[-1].cached
+
+    client.components.create(name='API')
+    assert len(client.components.list()) == 1
+    assert backend.request_count == 3
+
+
+def test_a_read_racing_a_write_is_not_cached(backend):
+    class RacingTransport(statuspageio.FakeTransport):
+        race = True
+
+        def request(self, method, url, **kwargs):
+            response = statuspageio.FakeTransport.request(self, method, url, **kwargs)
+            if self.race and method.lower() == 'get':
+                self.race = False
+                client.components.create(name='late')
+            return response
+
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=RacingTransport(backend),
+                                 cache=ResponseCache())
+
+    assert len(client.components.list()) == 0
+    assert len(client.components.list()) == 1
+
+
+def test_writes_invalidate_related_collections():
+    cache = ResponseCache()
+    for path in ('/pages/page/metrics_providers/self/metrics.json', '/pages/page/components.json',
+                 '/pages/page/subscribers.json'):
+        cache.store(cache.key('get', path), path, 200, {}, b'[]')
+
+    cache.invalidate('/pages/page/metrics/1.json')
+    assert len(cache) == 2
+
+    cache.invalidate('/pages/page/incidents.json')
+    assert len(cache) == 1
+
+
+def test_deleted_metrics_leave_the_provider_listing(backend):
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend), cache=True)
+    metric = client.metrics.create(provider_id='self', name='latency')
+
+    assert len(client.metrics.list_metrics_for_provider('self')) == 1
+    client.metrics.delete(metric['id'])
+    assert client.metrics.list_metrics_for_provider('self') == []
@@ -0,0 +1,52 @@
+import csv
+
+import pytest
+
+from statuspageio.export import export_records
+
+
+def test_export_csv_has_every_column(tmp_path):
+    path = str(tmp_path / 'records.csv')
+    records = [{'id': 1}, {'id': 2, 'tags': ['a']}, {'id': 3, 'active': True}]
+
+    report = export_records(records, path)
+
+    assert report.records == 3
+    assert report.rate >= 0
+    with open(path) as source:
+        rows = list(csv.DictReader(source))
+    assert [row['id'] for row in rows] == ['1', '2', '3']
+    assert rows[1]['tags'] == '["a"]'
+    assert rows[2]['active'] == 'true'
+
+
+def test_export_csv_with_selected_columns(tmp_path):
+    path = str(tmp_path / 'records.csv')
+    export_records([{'id': 1, 'name': 'a'}, {'id': 2, 'other': 'b'}], path, columns=['id', 'other'])
+
+    with open(path) as source:
+        assert source.read().split() == ['id,other', '1,', '2,b']
+
+
+def test_export_parquet_types_every_row_group(tmp_path):
+    pyarrow = pytest.importorskip('pyarrow')
+    from pyarrow import parquet
+    path = str(tmp_path / 'records.parquet')
+    records = [{'id': 1, 'value': 1}, {'id': 2, 'value': 2.5, 'late': 'x'}, {'id': 3, 'value': None, 'late': 3}]
+
+    export_records(records, path, batch_size=1)
+
+    table = parquet.read_table(path)
+    assert table.schema.field('value').type == pyarrow.float64()
+    assert table.schema.field('late').type == pyarrow.string()
+    assert table.to_pydict()['late'] == [None, 'x', '3']
+
+
+def test_export_subscribers(client, tmp_path):
+    for number in range(3):
+        client.subscribers.create(email='user{0}@example.com'.format(number))
+    path = str(tmp_path / 'subscribers.jsonl')
+
+    assert client.subscribers.export(path, per_page=2).records == 3
+    with open(path) as source:
+        assert len(source.readlines()) == 3
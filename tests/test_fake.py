@@ -0,0 +1,54 @@
+import pytest
+
+import statuspageio
+from statuspageio import errors
+
+
+def test_answers_every_service(client, backend):
+    component = client.components.create(name='API', status='operational')
+    client.incidents.create(name='Outage', status='investigating')
+    client.subscribers.create(email='user@example.com')
+    client.users.create(email='user@example.com', first_name='A', last_name='B')
+
+    page = backend.page('page')
+    assert page['components'][component['id']]['name'] == 'API'
+    assert len(page['incidents']) == 1
+    assert len(page['subscribers']) == 1
+    assert len(backend.users('org')) == 1
+    assert [c['id'] for c in client.components.list()] == [component['id']]
+
+
+def test_injected_failures_answer_the_next_requests(client, backend):
+    backend.inject(404, count=2)
+
+    for _ in range(2):
+        with pytest.raises(errors.RequestError):
+            client.components.list()
+    assert client.components.list() == []
+    assert backend.request_count == 3
+
+
+def test_rejects_other_api_keys():
+    backend = statuspageio.FakeStatusPage(api_key='secret')
+    client = statuspageio.Client(api_key='other', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend))
+
+    with pytest.raises(errors.RequestError) as error:
+        client.components.list()
+    assert error.value.http_status == 401
+
+
+def test_server_answers_over_http(backend):
+    with statuspageio.FakeServer(backend) as server:
+        client = statuspageio.Client(api_key='key', page_id='page', organization_id='org', base_url=server.url)
+        client.components.create(name='API')
+
+        assert [c['name'] for c in client.components.list()] == ['API']
+
+
+def test_transports_are_selected_by_name(backend):
+    with statuspageio.FakeServer(backend) as server:
+        client = statuspageio.Client(api_key='key', page_id='page', organization_id='org', base_url=server.url,
+                                     transport=u'requests')
+
+        assert client.components.list() == []
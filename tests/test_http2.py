@@ -0,0 +1,35 @@
+import socket
+import threading
+import time
+
+import pytest
+
+import statuspageio
+
+pytest.importorskip('h2')
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+
+
+def test_server_releases_streams_of_a_vanished_client():
+    backend = statuspageio.FakeStatusPage()
+    subscribers = backend.page('page')['subscribers']
+    for number in range(2000):
+        subscribers['s{0}'.format(number)] = {'id': 's{0}'.format(number), 'email': 'user{0}@example.com'.format(number)}
+
+    with statuspageio.FakeServer(backend, http2=True) as server:
+        baseline = threading.active_count()
+        connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=True))
+        connection.initiate_connection()
+        connection.send_headers(1, [(':method', 'GET'), (':path', '/v1/pages/page/subscribers.json'),
+                                    (':scheme', 'http'), (':authority', server.host)], end_stream=True)
+        client = socket.create_connection((server.host, server.port))
+        client.sendall(connection.data_to_send())
+        # never acknowledge the response, so it stalls on the flow control window, then vanish
+        time.sleep(0.2)
+        client.close()
+
+        deadline = time.time() + 5
+        while threading.active_count() > baseline and time.time() < deadline:
+            time.sleep(0.05)
+        assert threading.active_count() <= baseline
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import statuspageio
+from statuspageio.errors import ConfigurationError
+from statuspageio.json_codec import StdlibCodec, build_codec
+
+
+def test_builds_codecs_by_name():
+    assert isinstance(build_codec(u'json'), StdlibCodec)
+    assert isinstance(build_codec('json'), StdlibCodec)
+    assert build_codec('auto') is not None
+
+    codec = StdlibCodec()
+    assert build_codec(codec) is codec
+
+
+def test_rejects_unknown_codec_names():
+    with pytest.raises(ConfigurationError):
+        statuspageio.Client(api_key='key', page_id='page', organization_id='org', json_codec=u'yaml')
+
+
+def test_round_trips_through_the_client(backend):
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend), json_codec=u'json')
+
+    client.components.create(name=u'API é')
+    assert [component['name'] for component in client.components.list()] == [u'API é']
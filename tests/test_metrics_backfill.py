@@ -0,0 +1,29 @@
+import pytest
+
+from statuspageio import errors
+from statuspageio.metrics_backfill import downsample, downsample_python
+
+
+def test_backfill_resumes_from_checkpoint(client, backend, tmp_path):
+    metric_id = client.metrics.create(provider_id='self', name='latency')['id']
+    checkpoint = str(tmp_path / 'latency.checkpoint')
+    points = [(1500000000 + 30 * number, float(number)) for number in range(100)]
+
+    backend.inject(503)
+    with pytest.raises(errors.ServerError):
+        client.metrics.backfill(metric_id, points, points_per_request=10, max_workers=1, checkpoint=checkpoint)
+
+    report = client.metrics.backfill(metric_id, points, points_per_request=10, checkpoint=checkpoint)
+    assert report.skipped + report.submitted == 100
+    assert len(backend.page('page')['data'][metric_id]) == 100
+
+
+@pytest.mark.parametrize('aggregate', ['mean', 'min', 'max', 'last'])
+def test_downsample_matches_the_python_fallback(aggregate):
+    pytest.importorskip('numpy')
+    timestamps = [1500000059, 1500000000, 1500000010, 1500000031, 1500000045, 1500000090]
+    values = [6.0, 1.0, None, 3.0, 4.0, float('nan')]
+
+    starts, aggregated = downsample(timestamps, values, 30, aggregate)
+
+    assert (list(starts), list(aggregated)) == downsample_python(timestamps, values, 30, aggregate)
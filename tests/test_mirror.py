@@ -0,0 +1,53 @@
+import statuspageio
+
+
+class WriteDuringListing(object):
+    """
+    Backend updating a component after building the first listing of the components and
+    before returning it, like a write of another thread finishing while the mirror loads.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.write = None
+
+    def handle(self, method, path, params, body, headers):
+        response = self.backend.handle(method, path, params, body, headers)
+        write, self.write = self.write, None
+        if write is not None and method == 'GET' and path.endswith('/components.json'):
+            write()
+        return response
+
+
+def test_lookups_follow_the_writes_of_the_client(client):
+    group = client.components.create(name='Group', status='operational')
+    api = client.components.create(name='API', status='operational', group_id=group['id'])
+    mirror = client.mirror
+
+    assert mirror.components.find('API')['id'] == api['id']
+    assert [component['id'] for component in mirror.components.in_group(group['id'])] == [api['id']]
+
+    client.components.update(api['id'], status='major_outage')
+    assert mirror.components.get(api['id'])['status'] == 'major_outage'
+
+    client.components.delete(api['id'])
+    assert mirror.components.find('API') is None
+    assert mirror.components.in_group(group['id']) == []
+
+
+def test_writes_made_while_loading_are_kept(backend):
+    racing = WriteDuringListing(backend)
+    client = statuspageio.Client(api_key='key', page_id='page', transport=statuspageio.FakeTransport(racing))
+    updated = client.components.create(name='API', status='operational')
+    deleted = client.components.create(name='Web', status='operational')
+
+    racing.write = lambda: client.components.update(updated['id'], status='major_outage')
+    mirror = client.mirror
+
+    assert mirror.components.get(updated['id'])['status'] == 'major_outage'
+
+    racing.write = lambda: client.components.delete(deleted['id'])
+    mirror.refresh()
+
+    assert deleted['id'] not in mirror.components
+    assert mirror.components.get(updated['id'])['status'] == 'major_outage'
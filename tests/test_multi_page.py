@@ -0,0 +1,23 @@
+import statuspageio
+
+
+def test_page_client_builds_each_service_once(backend):
+    multi = statuspageio.MultiPageClient(api_key='key', page_ids=['a', 'b'], organization_id='org',
+                                         transport=statuspageio.FakeTransport(backend))
+    services = set()
+
+    def action(page):
+        services.add(id(page.components))
+        return []
+
+    multi.fan_out(action, page_ids=['a'] * 16, max_workers=16)
+    assert len(services) == 1
+
+
+def test_merges_the_pages(backend):
+    multi = statuspageio.MultiPageClient(api_key='key', page_ids=['a', 'b'], organization_id='org',
+                                         transport=statuspageio.FakeTransport(backend))
+    multi.page('a').components.create(name='API')
+    multi.page('b').components.create(name='DB')
+
+    assert sorted(component['name'] for component in multi.list_components()) == ['API', 'DB']
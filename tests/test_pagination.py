@@ -0,0 +1,38 @@
+from statuspageio.pagination import paginate
+
+
+def fetch_pages(pages, per_page, calls):
+    def fetch(page, per_page):
+        calls.append(page)
+        return list(range(page * per_page, page * per_page + (per_page if page < pages else 2)))
+    return fetch
+
+
+def ignoring_page(calls):
+    def fetch(page, per_page):
+        calls.append(page)
+        return list(range(per_page))
+    return fetch
+
+
+def test_stops_at_the_first_short_page():
+    for prefetch in (False, True):
+        calls = []
+        assert len(list(paginate(fetch_pages(3, 5, calls), 5, prefetch=prefetch))) == 12
+
+
+def test_stops_when_the_endpoint_ignores_page():
+    for prefetch in (False, True):
+        calls = []
+        assert list(paginate(ignoring_page(calls), 5, prefetch=prefetch)) == list(range(5))
+        assert calls[:2] == [1, 2]
+        assert len(calls) <= 3
+
+
+def test_iter_all_walks_every_page(client):
+    for number in range(5):
+        client.subscribers.create(email='user{0}@example.com'.format(number))
+        client.users.create(email='user{0}@example.com'.format(number), first_name='A', last_name='B')
+
+    assert len(list(client.subscribers.iter_all(per_page=2))) == 5
+    assert len(list(client.users.iter_all(per_page=2, prefetch=True))) == 5
@@ -0,0 +1,37 @@
+import statuspageio
+from statuspageio.rate_limit import TokenBucket, monotonic, retry_after
+
+
+def test_bucket_spaces_requests_after_the_burst():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.05 < waits[2] <= 0.1
+    assert 0.15 < waits[3] <= 0.2
+
+
+def test_retry_after_headers():
+    assert retry_after({'Retry-After': '2'}) == 2.0
+    assert retry_after({'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': '10'}) is None
+    assert retry_after({}) is None
+
+
+def test_paces_requests(backend):
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend), rate_limit=20, retry=None)
+
+    started = monotonic()
+    for _ in range(5):
+        client.components.list()
+    assert monotonic() - started >= 0.2
+
+
+def test_requeues_rate_limited_requests(backend):
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend), rate_limit=50, retry=None)
+
+    backend.inject(420, count=2, retry_after=0.05)
+    assert client.components.create(name='API')['name'] == 'API'
+    assert backend.request_count == 3
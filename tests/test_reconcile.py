@@ -0,0 +1,45 @@
+import pytest
+
+import statuspageio
+from statuspageio.reconcile import Reconciler
+
+
+@pytest.mark.parametrize('response_model', ['munch', 'model', 'raw'])
+def test_sync_sees_direct_writes(backend, response_model):
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend),
+                                 response_model=response_model)
+    component = client.components.create(name='EU API', status='operational')
+    client.components.sync({'EU API': {'status': 'operational'}})
+
+    client.components.update(component['id'], status='major_outage')
+    report = client.components.sync({'EU API': {'status': 'operational'}})
+
+    assert len(report.updated) == 1
+    assert backend.page('page')['components'][component['id']]['status'] == 'operational'
+
+    client.components.delete(component['id'])
+    report = client.components.sync({'EU API': {'status': 'operational'}})
+
+    assert len(report.created) == 1
+
+
+def test_sync_leaves_matching_components_alone(client, backend):
+    client.components.create(name='API', status='operational')
+    requests = backend.request_count
+
+    report = client.components.sync({'API': {'status': 'operational'}})
+
+    assert not report.changed
+    assert backend.request_count == requests + 1
+
+
+def test_each_write_reaches_the_snapshot_once(client, monkeypatch):
+    puts = []
+    put = Reconciler.put
+    monkeypatch.setattr(Reconciler, 'put', lambda self, resource: puts.append(resource['id']) or put(self, resource))
+    client.components.sync({})
+
+    report = client.components.sync({'API': {'status': 'operational'}, 'DB': {'status': 'operational'}})
+
+    assert sorted(puts) == sorted(component['id'] for component in report.created)
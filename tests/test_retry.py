@@ -0,0 +1,45 @@
+import pytest
+
+import statuspageio
+from statuspageio import errors
+from statuspageio.rate_limit import monotonic
+
+
+def test_policy_caps_the_delay():
+    policy = statuspageio.RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert policy.backoff(1) == 1
+    assert policy.backoff(10) == 5
+    assert policy.backoff(1, retry_after=3) == 3
+    assert policy.should_retry('get', 1, 503, retry_after=5)
+    assert not policy.should_retry('get', 1, 503, retry_after=86400)
+
+
+def test_retries_server_errors(backend):
+    events = []
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend),
+                                 retry=statuspageio.RetryPolicy(backoff_factor=0.01), after_request=events.append)
+
+    backend.inject(503, count=2)
+    client.components.list()
+    assert events[-1].attempts == 3
+
+    backend.inject(503, count=1)
+    with pytest.raises(errors.ServerError):
+        client.components.create(name='API')
+    assert events[-1].attempts == 1
+
+
+def test_gives_up_when_retry_after_exceeds_max_backoff(backend):
+    events = []
+    client = statuspageio.Client(api_key='key', page_id='page', organization_id='org',
+                                 transport=statuspageio.FakeTransport(backend),
+                                 retry=statuspageio.RetryPolicy(max_backoff=1), after_request=events.append)
+
+    backend.inject(503, retry_after=86400)
+    started = monotonic()
+    with pytest.raises(errors.ServerError):
+        client.components.list()
+    assert monotonic() - started < 1
+    assert events[-1].attempts == 1
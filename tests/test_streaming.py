@@ -0,0 +1,45 @@
+import pytest
+
+from statuspageio.streaming import JsonArrayParser, iter_json_array
+
+
+def chunked(document, size):
+    return [document[start:start + size] for start in range(0, len(document), size)]
+
+
+def test_yields_elements_split_across_chunks():
+    document = b'[{"id": 1, "tags": ["a", "b"]}, 12345, -0.5e3, "text", true, null, []]'
+
+    for size in (1, 3, 7, len(document)):
+        assert list(iter_json_array(chunked(document, size))) == \
+            [{'id': 1, 'tags': ['a', 'b']}, 12345, -500.0, 'text', True, None, []]
+
+
+def test_decodes_other_documents_whole():
+    assert list(iter_json_array([b'{"items": [1, 2]}'])) == [1, 2]
+    assert list(iter_json_array([b'{"error": "Not found"}'])) == [{'error': 'Not found'}]
+
+
+def test_accepts_whitespace_after_the_array():
+    assert list(iter_json_array([b' [1, 2] ', b'\n'])) == [1, 2]
+
+
+@pytest.mark.parametrize('chunks', [[b'[1, 2][3]'], [b'[1, 2]', b'x'], [b'[1, 2]  ', b'  ,']])
+def test_rejects_data_after_the_array(chunks):
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunks))
+
+
+def test_rejects_truncated_arrays():
+    parser = JsonArrayParser()
+    assert parser.feed(b'[1, 2, {"id"') == [1, 2]
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_streams_subscribers(client):
+    for number in range(5):
+        client.subscribers.create(email='user{0}@example.com'.format(number))
+
+    assert [subscriber['email'] for subscriber in client.subscribers.stream()] == \
+        ['user{0}@example.com'.format(number) for number in range(5)]
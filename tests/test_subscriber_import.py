@@ -0,0 +1,29 @@
+import io
+import json
+
+import pytest
+
+from statuspageio import errors
+
+
+def test_import_reports_rejected_rows_and_resumes(client, backend, tmp_path):
+    path = str(tmp_path / 'subscribers.csv')
+    with io.open(path, 'w', encoding='utf-8') as output:
+        output.write(u'email,skip_confirmation_notification\n')
+        for number in range(50):
+            output.write(u'user{0}@example.com,true\n'.format(number))
+        output.write(u',true\n')
+
+    backend.inject(503)
+    with pytest.raises(errors.ServerError):
+        client.subscribers.bulk_import(path, max_workers=4)
+
+    report = client.subscribers.bulk_import(path, max_workers=4)
+    assert report.skipped + report.created == 50
+    assert report.failed == 1
+    with io.open(path + '.errors.jsonl', encoding='utf-8') as error_report:
+        assert json.loads(error_report.readline())['row'] == 51
+
+    report = client.subscribers.bulk_import(path)
+    assert report.skipped == 51
+    assert len(backend.page('page')['subscribers']) == 50